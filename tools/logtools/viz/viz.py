@@ -3,7 +3,7 @@ Data Visualization Tool - Complete Implementation
 Professional time-series data visualization with advanced features
 
 Requirements:
-pip install pyside6-essentials pyqtgraph numpy pandas h5py
+pip install pyside6-essentials pyqtgraph numpy h5py
 
 Usage:
 python viz.py [logfile.h5]
@@ -15,6 +15,9 @@ import pathlib
 import re
 import subprocess
 import threading
+from math import floor, ceil, log10, isfinite
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Force UTF-8 encoding on Windows to handle Unicode characters in stream_config.yaml and output
 if sys.platform == 'win32':
@@ -27,27 +30,33 @@ if sys.platform == 'win32':
         sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, errors='replace')
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, errors='replace')
 import argparse
+import importlib.util
+import json
 import numpy as np
-import pandas as pd
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QPushButton, QFileDialog, QCheckBox,
                              QScrollArea, QSplitter, QLabel, QFrame, QMenu,
                              QMenuBar, QToolBar, QLineEdit, QListWidget, QListWidgetItem,
-                             QSpinBox, QStackedWidget, QPlainTextEdit, QTextEdit)
-from PySide6.QtCore import Qt, QPointF, QTimer, QRectF, QSettings, QByteArray, QMimeData, QPoint, QEvent, Signal
-from PySide6.QtGui import QPen, QColor, QFont, QAction, QPainter, QDrag, QTextCursor, QTextCharFormat
+                             QSpinBox, QStackedWidget, QPlainTextEdit, QTextEdit, QToolTip)
+from PySide6.QtCore import (Qt, QPointF, QTimer, QRectF, QSettings, QByteArray, QMimeData, QPoint, QEvent, Signal,
+                            QObject, QThread)
+from PySide6.QtGui import (QPen, QColor, QFont, QFontMetricsF, QAction, QPainter, QDrag, QTextCursor,
+                           QTextCharFormat)
 import pyqtgraph as pg
 from pyqtgraph import QtWidgets
 
-# Must have h5py for HDF5 file support
-import h5py
-HDF5_AVAILABLE = True
-#try:
-#    import h5py
-#    HDF5_AVAILABLE = True
-#except ImportError:
-#    HDF5_AVAILABLE = False
-#    h5py = None
+# PyOpenGL is optional; pyqtgraph can only rasterize curves on the GPU when it is installed
+OPENGL_AVAILABLE = importlib.util.find_spec("OpenGL") is not None
+
+# orjson is optional; it only speeds up writing the GPS track map
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Must have h5py for HDF5 file support (imported where files are opened, to keep startup fast)
+from viz_components.data.hdf5_loader import HDF5_AVAILABLE
 
 # Import stream configuration system
 from stream_config import get_config_manager, StreamType
@@ -56,41 +65,60 @@ from stream_config import get_config_manager, StreamType
 from viz_components.config import AppConfig, UnitConverter, PerFileSettingsManager, PerFileSettings
 from viz_components.widgets import (ColorCheckbox, StreamCheckbox, DraggableStreamList,
                                      ZoomableGraphWidget, ResizableSplitter)
-from viz_components.utils import parse_color_to_rgba
-from viz_components.rendering import min_max_decimate, DataNormalizer
-from viz_components.data import HDF5DataLoader, DataManager
+from viz_components.utils import parse_color_to_rgba, simplify_polyline
+from viz_components.rendering import (min_max_decimate, merge_close_intervals, bucket_intervals,
+                                       warm_up_decimation, DataNormalizer, LODPyramid)
+from viz_components.data import HDF5DataLoader, DataManager, warm_up_range_pyramid
 from viz_components.navigation import ViewNavigationController, ViewHistory
 
-# Import decoder for .um4 file conversion
-# Try to import directly first (works in Nuitka onefile builds where modules are bundled)
+# Decoder for .um4 file conversion - imported on first conversion rather than at
+# startup, since it pulls in h5py and the generated Logsyms module
+decodelog = None
 DECODER_IMPORT_ERROR = None
-try:
-    import decodelog
-    DECODER_AVAILABLE = True
-except ImportError as e:
-    DECODER_IMPORT_ERROR = str(e)
+
+
+def _import_decoder():
+    """
+    Import decodelog on first use.
+
+    Returns:
+        The decodelog module, or None if it can't be imported (see DECODER_IMPORT_ERROR)
+    """
+    global decodelog, DECODER_IMPORT_ERROR
+    if decodelog is not None:
+        return decodelog
+
+    # Try to import directly first (works in Nuitka onefile builds where modules are bundled)
+    try:
+        import decodelog
+        DECODER_IMPORT_ERROR = None
+        return decodelog
+    except ImportError as e:
+        DECODER_IMPORT_ERROR = str(e)
+
     # Fallback: add decoder directory to path (works in development/source runs)
     decoder_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../decoder')
-    if os.path.exists(decoder_path):
+    if not os.path.exists(decoder_path):
+        DECODER_IMPORT_ERROR = f"Decoder path does not exist: {decoder_path}"
+        return None
+    if decoder_path not in sys.path:
         sys.path.insert(0, decoder_path)
-        try:
-            import decodelog
-            DECODER_AVAILABLE = True
-            DECODER_IMPORT_ERROR = None
-        except ImportError as e2:
-            DECODER_AVAILABLE = False
-            decodelog = None
-            DECODER_IMPORT_ERROR = f"Path tried: {decoder_path}\nError: {str(e2)}"
-    else:
-        DECODER_AVAILABLE = False
+    try:
+        import decodelog
+        DECODER_IMPORT_ERROR = None
+    except ImportError as e2:
         decodelog = None
-        DECODER_IMPORT_ERROR = f"Decoder path does not exist: {decoder_path}"
+        DECODER_IMPORT_ERROR = f"Path tried: {decoder_path}\nError: {str(e2)}"
+    return decodelog
+
 
 # Event visualization constants
 SPARK_LABEL_OFFSET = 0.025  # Vertical offset from RPM line for spark labels (2.5% of normalized range)
 CRANKREF_LINE_HEIGHT = 0.04  # Height of vertical line for crankref markers (4% of normalized range)
 CAMSHAFT_LINE_HEIGHT = 0.04  # Height of vertical line for camshaft markers (4% of normalized range)
 MAX_VISIBLE_EVENT_MARKERS = 100  # Skip drawing event markers if more than this many are visible
+MAX_PLOT_POINTS = 10000  # Target max points per stream in the main graph (LOD/decimation budget)
+NAV_MAX_POINTS = 1000  # Target points per stream in the navigation overview
 
 # Injector bar visualization constants
 FRONT_INJECTOR_BAR_Y = 0.25  # Fixed Y position for front injector bars (normalized)
@@ -102,42 +130,572 @@ MAX_INJECTOR_BARS_VISIBLE = 5000  # Maximum bars to draw for performance
 MAX_REASONABLE_DURATION_TICKS = 50000  # 100ms max reasonable duration (startup injector pulses can be long)
 
 
-class InjectorBarItem(QtWidgets.QGraphicsRectItem):
-    """Custom rectangle item for injector bars with proper hover detection"""
+@lru_cache(maxsize=256)
+def _cached_pen(color, width=1.0, style=Qt.PenStyle.SolidLine):
+    """
+    Get a shared pen for per-redraw items (pg.mkPen parses the color every call).
+
+    Items copy the pen they're given, but callers must not modify the returned pen.
+    """
+    return pg.mkPen(color=color, width=width, style=style)
 
-    def __init__(self, x, y, width, height, tooltip_text, color, alpha):
-        # Create rect at (0, 0) with the specified size
-        super().__init__(0, 0, width, height)
-        # Then set the item's position in the scene
-        self.setPos(x, y)
 
-        self._tooltip_text = tooltip_text
-        self.setAcceptHoverEvents(True)
+@lru_cache(maxsize=256)
+def _cached_brush(color, alpha):
+    """Get a shared brush for a (color, alpha) pair; callers must not modify it."""
+    return pg.mkBrush(*parse_color_to_rgba(color, alpha))
+
+
+@lru_cache(maxsize=16)
+def _stack_bar_positions(bar_heights, bar_spacing=0.01):
+    """
+    Stack bars upward from Y=0 in the given order.
+
+    Only depends on which bars are enabled and their heights, so the layout is
+    computed once per combination rather than on every redraw.
+
+    Args:
+        bar_heights: Tuple of (stream_name, height) in stacking order
+        bar_spacing: Small gap between bars (normalized)
+
+    Returns:
+        Tuple of (stream_name -> y_position dict, total normalized space used by the bars);
+        the dict is shared between calls and must not be modified
+    """
+    positions = {}
+    current_y = 0.0
+    for stream_name, height in bar_heights:
+        positions[stream_name] = current_y
+        current_y += height + bar_spacing
+    return positions, sum(height + bar_spacing for _, height in bar_heights)
+
+
+def _bar_geometry(bar_times, duration_values, duration_units):
+    """
+    Convert a bar stream's durations and precompute what visibility filtering needs.
+
+    Args:
+        bar_times: numpy array of bar start times (seconds)
+        duration_values: numpy array of durations in duration_units
+        duration_units: "ticks" or "nanoseconds"
+
+    Returns:
+        Tuple of (duration_units, duration_values, duration_seconds, end_times, valid_mask,
+        max_duration); the last four are None for unknown units
+    """
+    if duration_units == "ticks":
+        # Timer ticks: 2 microseconds per tick
+        duration_seconds = duration_values * TIMER_TICK_DURATION_S
+        # Validate reasonable duration (0 to 100ms)
+        valid_mask = (duration_values > 0) & (duration_values <= MAX_REASONABLE_DURATION_TICKS)
+    elif duration_units == "nanoseconds":
+        # Nanoseconds: convert directly
+        duration_seconds = duration_values / 1e9
+        # Validate reasonable duration (0 to 100ms)
+        valid_mask = (duration_values > 0) & (duration_values <= 100_000_000)
+    else:
+        return duration_units, duration_values, None, None, None, None
+
+    # Longest valid bar: how far before the view a bar can start and still reach into it
+    max_duration = float(duration_seconds[valid_mask].max()) if valid_mask.any() else 0.0
+
+    return duration_units, duration_values, duration_seconds, bar_times + duration_seconds, valid_mask, max_duration
 
-        # Set up appearance - use NO PEN to avoid bounding box issues
-        self.setPen(pg.mkPen(None))
 
-        rgba = parse_color_to_rgba(color, alpha)
-        self.setBrush(pg.mkBrush(*rgba))
+class InjectorBarBatchItem(QtWidgets.QGraphicsItem):
+    """All visible injector bars of one stream, painted as a single scene item"""
 
-    def hoverEnterEvent(self, event):
-        """Show tooltip only when mouse enters the actual bar rectangle"""
-        self.setToolTip(self._tooltip_text)
-        super().hoverEnterEvent(event)
+    def __init__(self, start_times, durations, y, height, color, alpha, tooltip_template, display_name,
+                 spans=None):
+        """
+        Args:
+            start_times: Sorted numpy array of bar start times (seconds)
+            durations: numpy array of bar durations (seconds)
+            y: Bottom of the bars (normalized)
+            height: Height of the bars (normalized)
+            color: Bar color (name or hex)
+            alpha: Bar opacity (0-1)
+            tooltip_template: Format string with {start_time} and {duration_us}, or None
+            display_name: Stream name shown by the default tooltip
+            spans: Optional (starts, durations) of merged spans to paint instead of the
+                individual bars; tooltips still report the bar under the mouse
+        """
+        super().__init__()
+        self._start_times = start_times
+        self._durations = durations
+        self._y = y
+        self._height = height
+        self._tooltip_template = tooltip_template
+        self._display_name = display_name
+        self._hover_index = -1
+
+        paint_starts, paint_durations = spans if spans is not None else (start_times, durations)
+        self._rects = [QRectF(x, y, w, height) for x, w in zip(paint_starts.tolist(), paint_durations.tolist())]
+        end = float(np.max(paint_starts + paint_durations))
+        self._bounds = QRectF(float(paint_starts[0]), y, end - float(paint_starts[0]), height)
+
+        self._brush = _cached_brush(color, alpha)
+        self.setAcceptHoverEvents(True)
+        # The bars are fixed for the item's lifetime (it is rebuilt when the view moves), so
+        # repaints from hovering, tooltips or the log cursor can blit a cached pixmap
+        self.setCacheMode(QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+    def boundingRect(self):
+        return self._bounds
+
+    def paint(self, painter, option, widget=None):
+        # Use NO PEN to avoid bounding box issues
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._brush)
+        painter.drawRects(self._rects)
+
+    def _bar_at(self, pos):
+        """Index of the bar under an item-coordinate position, or -1."""
+        if not (self._y <= pos.y() <= self._y + self._height):
+            return -1
+        i = int(np.searchsorted(self._start_times, pos.x(), side='right')) - 1
+        if i >= 0 and pos.x() <= self._start_times[i] + self._durations[i]:
+            return i
+        return -1
+
+    def _tooltip_text(self, i):
+        start_time = float(self._start_times[i])
+        duration_us = float(self._durations[i]) * 1e6  # Convert to microseconds
+        if self._tooltip_template:
+            # Use template from YAML config and format it
+            return self._tooltip_template.format(start_time=start_time, duration_us=duration_us)
+        # Fallback to default format (duration only)
+        return f"{self._display_name}\nDuration: {duration_us:.1f} μs"
+
+    def hoverMoveEvent(self, event):
+        """Show the tooltip of the bar under the mouse, formatted only when the bar changes"""
+        i = self._bar_at(event.pos())
+        if i != self._hover_index:
+            self._hover_index = i
+            # Show it directly: the item-wide toolTip would keep the first bar's text
+            # while the mouse moves across neighbouring bars of the same item
+            if i >= 0:
+                QToolTip.showText(event.screenPos(), self._tooltip_text(i))
+            else:
+                QToolTip.hideText()
+        super().hoverMoveEvent(event)
 
     def hoverLeaveEvent(self, event):
         """Clear tooltip when mouse leaves"""
-        self.setToolTip("")
+        if self._hover_index >= 0:
+            self._hover_index = -1
+            QToolTip.hideText()
         super().hoverLeaveEvent(event)
 
-    def shape(self):
-        """Override shape to return exact rectangle bounds for hover detection"""
-        path = QtWidgets.QPainterPath()
-        path.addRect(self.rect())
-        return path
+
+class MarkerLabelBatchItem(pg.GraphicsObject):
+    """Text labels for many event markers, painted by one item in screen-space font size"""
+
+    # Matches QGraphicsTextItem's document margin, so labels sit where pg.TextItem put them
+    TEXT_MARGIN = 4.0
+
+    def __init__(self, xs, ys, texts, color, anchor):
+        """
+        Args:
+            xs: List of label x positions (data coordinates)
+            ys: List of label y positions (data coordinates)
+            texts: List of label strings
+            color: Text color (name or hex)
+            anchor: (x, y) fraction of the text box placed at each position, like pg.TextItem
+        """
+        super().__init__()
+        self._xs = xs
+        self._ys = ys
+        self._texts = texts
+        self._pen = _cached_pen(color)
+        self._anchor = anchor
+        self._font = QApplication.font()
+
+        # Text box sizes in pixels, measured once
+        metrics = QFontMetricsF(self._font)
+        box_h = metrics.height() + 2 * self.TEXT_MARGIN
+        self._boxes = [(metrics.horizontalAdvance(t) + 2 * self.TEXT_MARGIN, box_h) for t in texts]
+        self._max_box = (max(w for w, _ in self._boxes), box_h)
+
+        self._anchor_bounds = QRectF(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys))
+        self._bounds = None
+        # Same as the bar batches: repaint from a cached pixmap until the view changes
+        self.setCacheMode(QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+    def viewTransformChanged(self):
+        # Labels keep their pixel size, so their extent in data units changes with the view
+        self._bounds = None
+        self.prepareGeometryChange()
+
+    def boundingRect(self):
+        if self._bounds is None:
+            px, py = self.pixelWidth(), self.pixelHeight()
+            dx = self._max_box[0] * px
+            dy = self._max_box[1] * py
+            self._bounds = self._anchor_bounds.adjusted(-dx, -dy, dx, dy)
+        return self._bounds
+
+    def paint(self, painter, option, widget=None):
+        # Map anchor points to device pixels and draw unscaled text there
+        transform = painter.transform()
+        painter.resetTransform()
+        painter.setFont(self._font)
+        painter.setPen(self._pen)
+        ax, ay = self._anchor
+        margin = self.TEXT_MARGIN
+        for x, y, text, (box_w, box_h) in zip(self._xs, self._ys, self._texts, self._boxes):
+            pt = transform.map(QPointF(x, y))
+            rect = QRectF(pt.x() - ax * box_w + margin, pt.y() - ay * box_h + margin,
+                          box_w - 2 * margin, box_h - 2 * margin)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, text)
+
+
+# ================================================================================================
+# Decoder worker — runs decodelog.main() off the GUI thread
+# ================================================================================================
+
+# decodelog.main() reads sys.argv and the module-level PROGRESS_CALLBACK, both process-global
+_DECODE_LOCK = threading.Lock()
+
+
+class DecodeWorker(QObject):
+    """
+    Converts a .um4 file with decodelog in a worker QThread.
+
+    Signals are delivered to the GUI thread as queued connections, so the
+    event loop (and the progress dialog) keep running during a long decode.
+    """
+
+    progress = Signal(int)     # percent complete (0-100)
+    finished = Signal(str)     # output filename
+    failed = Signal(str)       # error message
+
+    def __init__(self, um4_filename, output_filename, output_format):
+        """
+        Args:
+            um4_filename: Path to the .um4 binary log
+            output_filename: Path of the file to write
+            output_format: decodelog --format value ('h5' or 'hr')
+        """
+        super().__init__()
+        self.um4_filename = um4_filename
+        self.output_filename = output_filename
+        self.output_format = output_format
+
+    def _on_decode_progress(self, bytes_read, total_bytes):
+        self.progress.emit(int(bytes_read * 100 / total_bytes))
+
+    def run(self):
+        """Run the decoder (executes in the worker thread)."""
+        with _DECODE_LOCK:
+            original_argv = sys.argv
+            sys.argv = ['decodelog', self.um4_filename, '--format', self.output_format, '-o', self.output_filename]
+            decodelog.PROGRESS_CALLBACK = self._on_decode_progress
+            try:
+                result = decodelog.main()
+            except SystemExit as e:  # argparse errors
+                result = e.code
+            except Exception as e:
+                self.failed.emit(str(e))
+                return
+            finally:
+                # Restore original sys.argv/callback
+                sys.argv = original_argv
+                decodelog.PROGRESS_CALLBACK = None
+
+        if result:
+            self.failed.emit(f"decodelog exited with status {result} (see console output for details)")
+        else:
+            self.finished.emit(self.output_filename)
+
+
+# Track points closer than this to the line through their neighbours are left off the map (~1 m)
+GPS_MAP_SIMPLIFY_EPSILON_DEG = 1e-5
+
+# Leaflet page showing the whole GPS track; GpsMapWorker writes the track JSON at {track_json}
+GPS_MAP_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>UMOD4 GPS Track</title>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css" />
+    <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
+    <style>
+        body {{ margin: 0; padding: 0; }}
+        #map {{ width: 100%; height: 100vh; }}
+        .info {{
+            padding: 6px 8px;
+            background: white;
+            box-shadow: 0 0 15px rgba(0,0,0,0.2);
+            border-radius: 5px;
+        }}
+        .info h4 {{ margin: 0 0 5px; color: #777; }}
+    </style>
+</head>
+<body>
+    <div id="map"></div>
+    <script>
+        // GPS track data: parallel lat/lon/time arrays of the simplified track, each point's
+        // index in the full log and the position of the clicked point
+        const track = {track_json};
+        const positions = track.lat.map((lat, i) => ({{
+            lat: lat,
+            lon: track.lon[i],
+            time: track.time[i],
+            index: track.index[i],
+            clicked: i === track.clicked
+        }}));
+
+        // Find clicked position
+        const clickedPos = positions.find(p => p.clicked);
+
+        // Create map centered on clicked position
+        const map = L.map('map').setView([clickedPos.lat, clickedPos.lon], 15);
+
+        // Add CartoDB Voyager tiles (no Referer header required, unlike OSM direct tiles)
+        L.tileLayer('https://{{s}}.basemaps.cartocdn.com/rastertiles/voyager/{{z}}/{{x}}/{{y}}{{r}}.png', {{
+            attribution: '&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors &copy; <a href="https://carto.com/attributions">CARTO</a>',
+            subdomains: 'abcd',
+            maxZoom: 19
+        }}).addTo(map);
+
+        // Create polyline for the track
+        const trackPoints = positions.map(p => [p.lat, p.lon]);
+        L.polyline(trackPoints, {{
+            color: 'blue',
+            weight: 3,
+            opacity: 0.7
+        }}).addTo(map);
+
+        // Add markers for each position
+        positions.forEach((pos) => {{
+            const marker = L.circleMarker([pos.lat, pos.lon], {{
+                radius: pos.clicked ? 8 : 4,
+                fillColor: pos.clicked ? '#ff0000' : '#0066ff',
+                color: pos.clicked ? '#cc0000' : '#0044cc',
+                weight: 2,
+                opacity: 1,
+                fillOpacity: pos.clicked ? 1 : 0.6
+            }}).addTo(map);
+
+            marker.bindPopup(
+                `<b>Point ${{pos.index + 1}}</b><br>` +
+                `Time: ${{pos.time.toFixed(3)}}s<br>` +
+                `Lat: ${{pos.lat.toFixed(6)}}<br>` +
+                `Lon: ${{pos.lon.toFixed(6)}}`
+            );
+
+            if (pos.clicked) {{
+                marker.openPopup();
+            }}
+        }});
+
+        // Add info box
+        const info = L.control({{position: 'topright'}});
+        info.onAdd = function(map) {{
+            this._div = L.DomUtil.create('div', 'info');
+            this._div.innerHTML =
+                '<h4>UMOD4 GPS Track</h4>' +
+                `<b>${{track.total}}</b> GPS positions (${{positions.length}} shown)<br>` +
+                `Clicked: Time ${{clickedPos.time.toFixed(3)}}s`;
+            return this._div;
+        }};
+        info.addTo(map);
+
+        // Fit map to show all points
+        const bounds = L.latLngBounds(trackPoints);
+        map.fitBounds(bounds, {{padding: [50, 50]}});
+    </script>
+</body>
+</html>"""
+
+# Page text before and after the embedded track JSON, so the JSON can be written
+# between them without first being formatted into one big page string
+GPS_MAP_HTML_HEAD, GPS_MAP_HTML_TAIL = (
+    part.encode('utf-8') for part in GPS_MAP_HTML_TEMPLATE.format(track_json='\0').split('\0'))
+
+
+class GpsMapWorker(QObject):
+    """
+    Writes the GPS track map page in a worker QThread.
+
+    Serializing a long track to JSON takes long enough to freeze the window,
+    so it happens here; the GUI thread only opens the finished page.
+    """
+
+    finished = Signal(str)     # path of the written HTML file
+    failed = Signal(str)       # error message
+
+    def __init__(self, lats, lons, times, clicked_index):
+        """
+        Args:
+            lats: numpy array of GPS latitudes
+            lons: numpy array of GPS longitudes
+            times: numpy array of GPS sample times (seconds)
+            clicked_index: Index of the marker that was clicked
+        """
+        super().__init__()
+        self.lats = lats
+        self.lons = lons
+        self.times = times
+        self.clicked_index = clicked_index
+
+    def run(self):
+        """Build and write the page (executes in the worker thread)."""
+        import tempfile
+
+        try:
+            # Drop points that lie on a straight run of the track, but always keep the clicked one
+            keep = simplify_polyline(self.lons, self.lats, GPS_MAP_SIMPLIFY_EPSILON_DEG)
+            if not np.any(keep == self.clicked_index):
+                keep = np.sort(np.append(keep, self.clicked_index))
+            clicked_pos = int(np.searchsorted(keep, self.clicked_index))
+
+            # Parallel arrays instead of one object per point keep the JSON small and fast to
+            # build; 6 decimal places (~0.1 m) is finer than the GPS fix itself
+            track = {
+                'lat': np.round(self.lats[keep], 6),
+                'lon': np.round(self.lons[keep], 6),
+                'time': np.round(self.times[keep], 3),
+                'index': keep,
+                'clicked': clicked_pos,
+                'total': len(self.lats),
+            }
+            if ORJSON_AVAILABLE:
+                # Serializes the numpy arrays directly, without building lists of Python floats
+                track_json = orjson.dumps(track, option=orjson.OPT_SERIALIZE_NUMPY)
+            else:
+                track_json = json.dumps({k: v.tolist() if isinstance(v, np.ndarray) else v
+                                         for k, v in track.items()}).encode('utf-8')
+
+            html_file = os.path.join(tempfile.gettempdir(), 'umod4_gps_track.html')
+            with open(html_file, 'wb') as f:
+                f.write(GPS_MAP_HTML_HEAD)
+                f.write(track_json)
+                f.write(GPS_MAP_HTML_TAIL)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+
+        self.finished.emit(html_file)
+
+
+class LoadWorker(QObject):
+    """
+    Loads an HDF5 log in a worker QThread.
+
+    Does everything that doesn't touch widgets: reading and converting the
+    datasets, classifying streams, building LOD pyramids and reading the
+    seek_index. The GUI thread applies the result.
+    """
+
+    progress = Signal(int, int)     # (datasets_read, datasets_total)
+    loaded = Signal(int, object)    # (job_id, load result dict)
+    failed = Signal(int, str)       # (job_id, error message)
+
+    def __init__(self, job_id, filename, hdf5_loader, unit_preferences, float32_values, stream_config):
+        """
+        Args:
+            job_id: Identifies this load so stale or cancelled results can be dropped
+            filename: Path to the HDF5 file
+            hdf5_loader: HDF5DataLoader instance
+            unit_preferences: Dict of data type -> preferred display units, read on the GUI thread
+            float32_values: Store stream values as float32 (False keeps float64)
+            stream_config: StreamConfigManager instance
+        """
+        super().__init__()
+        self.job_id = job_id
+        self.filename = filename
+        self.hdf5_loader = hdf5_loader
+        self.unit_preferences = unit_preferences
+        self.float32_values = float32_values
+        self.stream_config = stream_config
+
+    def run(self):
+        """Load the file (executes in the worker thread)."""
+        try:
+            loaded_data = self.hdf5_loader.load_file(self.filename, self.unit_preferences,
+                                                     self.float32_values, self.progress.emit)
+            loaded_data['filepath'] = self.filename
+            raw_data = loaded_data['raw_data']
+
+            # Classify loaded streams once; the per-frame plot loops only test set membership
+            event_only = frozenset(s for s in raw_data if self.stream_config.is_event_only_stream(s))
+            skipped = frozenset(s for s in raw_data if self.stream_config.should_skip_in_selection(s))
+            loaded_data['event_only_streams'] = event_only
+            loaded_data['skipped_streams'] = skipped
+
+            # Decimation pyramids for every stream drawn as a line in the main graph
+            loaded_data['lod_pyramid'] = {
+                name: LODPyramid(entry['time'], entry['values'], MAX_PLOT_POINTS)
+                for name, entry in raw_data.items()
+                if 'values' in entry and name not in event_only and name not in skipped
+            }
+
+            # Bar durations in seconds, end times and validity masks for the redraw path
+            for name, cfg in self.stream_config.get_streams_by_type(StreamType.BAR_DATA).items():
+                entry = raw_data.get(name)
+                if entry is not None and 'values' in entry:
+                    entry['bar_geometry'] = _bar_geometry(entry['time'], entry['values'], cfg.duration_units or "ticks")
+
+            # Load seek_index for log viewer (4-column dataset, not handled by hdf5_loader)
+            loaded_data['seek_index'] = None
+            try:
+                import h5py
+                with h5py.File(self.filename, 'r') as hf:
+                    if 'seek_index' in hf and hf['seek_index'].shape[0] > 0:
+                        loaded_data['seek_index'] = hf['seek_index'][:]
+                        print(f"Loaded seek_index: {len(loaded_data['seek_index'])} entries")
+            except Exception as e:
+                print(f"Could not load seek_index: {e}")
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            self.failed.emit(self.job_id, str(e))
+            return
+
+        self.loaded.emit(self.job_id, loaded_data)
+
+
+def _debug_print_noop(*args, **kwargs):
+    """Stand-in for DataVisualizationTool.debug_print when debug output is off."""
+
 
 # Axis tick spacing constraints
 MIN_TEMPERATURE_TICK_SPACING_C = 5.0  # Minimum spacing between temperature axis ticks (degrees C)
+TICK_CACHE_MAX_ENTRIES = 256  # Generated tick sets kept per window before the cache is reset
+VISIBLE_MAX_CACHE_MAX_ENTRIES = 128  # Per-view stream maxima kept before the cache is reset
+
+
+@lru_cache(maxsize=256)
+def _nice_tick_spacing(data_range):
+    """
+    Calculate a nice round number for tick spacing.
+
+    Callers pass the range rounded to 6 decimals so small float jitter between
+    redraws of the same view still hits the cache.
+    """
+    if not data_range or not isfinite(data_range) or data_range <= 0:
+        return 1
+    # Get order of magnitude
+    exponent = floor(log10(data_range))
+    magnitude = 10 ** exponent
+    # Normalize to 1-10 range
+    normalized = data_range / magnitude
+    # Choose nice spacing: 0.1, 0.2, 0.5, 1, 2, 5, 10, etc.
+    if normalized <= 1.0:
+        nice_spacing = 0.1 * magnitude
+    elif normalized <= 2.0:
+        nice_spacing = 0.2 * magnitude
+    elif normalized <= 5.0:
+        nice_spacing = 0.5 * magnitude
+    elif normalized <= 10.0:
+        nice_spacing = 1.0 * magnitude
+    else:
+        nice_spacing = 2.0 * magnitude
+    return nice_spacing
+
 
 # ================================================================================================
 # Event Log Panel — decoded .um4 log viewer synchronized with the main graph
@@ -269,12 +827,20 @@ class DataVisualizationTool(QMainWindow):
 
         # Debug flag for verbose output
         self.debug = debug
+        if not debug:
+            # Skip the flag check on every call; hot-path call sites are also wrapped in
+            # `if self.debug:` so their f-strings aren't built at all
+            self.debug_print = _debug_print_noop
 
         # Initialize configuration managers FIRST
         self.config = AppConfig()
         self.stream_config = get_config_manager()
         self.per_file_settings_manager = PerFileSettingsManager(debug=self.debug)
 
+        # Vertical layout of the main graph (updated by _calculate_bar_positions when bars are drawn)
+        self.bar_space_offset = 0.0  # Normalized space reserved below the data for bars
+        self.dynamic_normalize_max = self.stream_config.get_setting('data_normalize_max', 0.85)
+
         # Print config location for user awareness
         self.debug_print(f"Configuration file: {self.config.settings.fileName()}")
         self.debug_print(f"Stream configuration: {self.stream_config.config_path}")
@@ -291,8 +857,26 @@ class DataVisualizationTool(QMainWindow):
         # TODO: Phase 4+ will remove these in favor of data_manager methods
         self.raw_data = {}  # Will point to data_manager.raw_data
         self.data_streams = []  # Will point to data_manager.stream_names
+        self._event_only_streams = frozenset()  # Loaded streams with custom (marker/bar) visualization
+        self._skipped_streams = frozenset()  # Loaded duration/helper streams hidden from selection
         self.stream_metadata = {}  # Will point to data_manager.stream_metadata
         self.stream_ranges = {}  # Will point to data_manager.stream_ranges
+        self.lod_pyramid = {}  # stream_name -> LODPyramid, rebuilt on file load / unit change
+        self._curves = {}  # stream_name -> persistent PlotDataItem in graph_plot
+        self._curve_styles = {}  # stream_name -> (display_mode, color) last applied to its curve
+        self._transient_items = []  # Marker/bar items redrawn from scratch on every update
+        self._decim_cache = {}  # stream_name -> (view_start, view_end, values, plot_time, plot_values)
+        self._tick_cache = {}  # (axis_min, axis_max, spacing) -> (min_rounded, max_rounded, real_ticks)
+        self._visible_max_cache = {}  # (stream_name, view_start, view_end) -> (values, visible_max)
+        self._nav_curve_cache = {}  # stream_name -> (values, nav_time, normalized_values)
+        self._gps_y_buf = np.full(4096, -0.05)  # Constant GPS marker heights, sliced per redraw
+        self._bar_mask_buf = np.empty(4096, dtype=bool)  # Scratch visibility mask for bar streams
+        self._last_axis_sig = None  # Inputs of the last _configure_axes call (None forces a refresh)
+        self._last_theme = None  # (dark, left owned, right owned) last applied by _apply_graph_theme
+        self._tick_closures = {}  # 'left'/'right' -> (tickValues, tickStrings) overrides for owner axes
+        self._axis_font_cache = {}  # point size -> QFont shared by axis labels and ticks
+        self._axis_label_state = {}  # axis name -> (label text, font size) last applied
+        self._axis_tick_font_size = {}  # axis name -> tick font size last applied
 
         # Navigation management (Phase 3 refactoring)
         self.view_controller = ViewNavigationController()
@@ -334,12 +918,31 @@ class DataVisualizationTool(QMainWindow):
         self.um4_path = None       # Path to companion .um4 binary log file
         self.log_panel_visible = False
         self._pending_log_events = None   # (events, center_time_s) set by background thread
+        self._decode_job = None           # (worker, progress dialog, load_when_done) while converting
+        self._load_job = None             # (job_id, progress dialog) while a file is loading
+        self._load_job_counter = 0        # Incremented per load; results from older jobs are ignored
+        self._load_done_message = None    # (title, text) shown once the running load has been applied
+        self._worker_threads = {}         # QThread -> worker object, kept alive until the thread exits
 
         # Update timer for real-time updates (30 FPS max)
         self.update_timer = QTimer()
         self.update_timer.setInterval(33)  # ~30 FPS
         self.update_timer.timeout.connect(self.perform_pending_update)
         self.pending_update = False
+        self.pending_nav_update = False  # Whether the pending update must also rebuild the nav plot
+
+        # Zero-delay single-shot timer that coalesces keyboard/zoom redraw requests: the
+        # navigation region moves immediately, the graph redraws once the queue is drained
+        self._graph_update_timer = QTimer(self)
+        self._graph_update_timer.setSingleShot(True)
+        self._graph_update_timer.setInterval(0)
+        self._graph_update_timer.timeout.connect(self.update_graph_plot)
+
+        # Last raw region seen by on_region_changed during a nav drag; pixel-identical
+        # ticks are dropped instead of scheduling another redraw
+        self._last_region = None
+        # View (start, end) when the current nav drag began; None when not dragging
+        self._region_drag_start = None
 
         # Color palette
         self.colors = [
@@ -357,6 +960,9 @@ class DataVisualizationTool(QMainWindow):
         # Font size configuration - default is 12pt
         self.axis_font_size = self.config.get("axis_font_size", 12)
 
+        # Set once init_ui() has created the menu actions and widgets
+        self._ui_ready = False
+
         self.init_ui()
 
         # Restore window geometry after UI initialization
@@ -369,7 +975,7 @@ class DataVisualizationTool(QMainWindow):
 
     def _on_history_changed(self, can_undo, can_redo):
         """Callback when history state changes - update UI buttons"""
-        if hasattr(self, 'undo_action'):  # Check if UI is initialized
+        if self._ui_ready:
             self.undo_action.setEnabled(can_undo)
             self.redo_action.setEnabled(can_redo)
 
@@ -438,6 +1044,8 @@ class DataVisualizationTool(QMainWindow):
         self.config.restore_splitter_state("horizontal", self.h_splitter)
         self.config.restore_splitter_state("vertical", self.v_splitter)
 
+        self._ui_ready = True
+
     def create_menu_bar(self):
         """Create the menu bar to replace the ribbon"""
         menu_bar = self.menuBar()
@@ -691,11 +1299,8 @@ class DataVisualizationTool(QMainWindow):
         self.graph_plot.setLabel('right', 'Value')
 
         # Ensure font sizes are set properly for initial state
-        label_font = QFont()
-        label_font.setPointSize(self.axis_font_size)
-        self.graph_plot.getAxis('bottom').setTickFont(label_font)
-        self.graph_plot.getAxis('left').setTickFont(label_font)
-        self.graph_plot.getAxis('right').setTickFont(label_font)
+        for axis_name in ('bottom', 'left', 'right'):
+            self._set_axis_tick_font(axis_name)
 
         # Create GPS position marker scatter plot (triangles above time axis)
         # These will be persistent and updated when data loads or view changes
@@ -828,21 +1433,21 @@ class DataVisualizationTool(QMainWindow):
             if per_file_settings and stream in per_file_settings.stream_colors:
                 saved_color = per_file_settings.stream_colors[stream]
                 stream_widget.color = saved_color
-                stream_widget.checkbox.fill_color = saved_color
+                stream_widget.checkbox.set_fill_color(saved_color)
                 self.stream_colors[stream] = saved_color
             else:
                 # Check global QSettings
                 saved_color = self.config.get(f"stream_color_{stream}")
                 if saved_color:
                     stream_widget.color = saved_color
-                    stream_widget.checkbox.fill_color = saved_color
+                    stream_widget.checkbox.set_fill_color(saved_color)
                     self.stream_colors[stream] = saved_color
                 else:
                     # Check YAML default
                     stream_config = self.stream_config.get_stream(stream)
                     if stream_config and stream_config.default_color:
                         stream_widget.color = stream_config.default_color
-                        stream_widget.checkbox.fill_color = stream_config.default_color
+                        stream_widget.checkbox.set_fill_color(stream_config.default_color)
                         self.stream_colors[stream] = stream_config.default_color
 
             # Display mode precedence
@@ -875,7 +1480,8 @@ class DataVisualizationTool(QMainWindow):
                     if unit_label:
                         stream_widget.update_unit_label(unit_label)
 
-            # Connect signal before setting default state so it fires
+            # Default-enabled streams are checked later via _enable_streams_bulk(),
+            # which blocks this signal so loading doesn't redraw once per stream
             stream_widget.checkbox.stateChanged.connect(
                 lambda state, s=stream: self.toggle_stream(s, state)
             )
@@ -888,11 +1494,7 @@ class DataVisualizationTool(QMainWindow):
         if per_file_settings and per_file_settings.enabled_streams:
             # Use per-file enabled streams
             self.debug_print(f"Enabling streams from .viz: {per_file_settings.enabled_streams}")
-            for stream_name in per_file_settings.enabled_streams:
-                for widget in self.stream_list_widget.stream_widgets:
-                    if widget.stream_name == stream_name:
-                        widget.checkbox.setChecked(True)
-                        break
+            self._enable_streams_bulk(per_file_settings.enabled_streams)
 
             # Restore axis ownership
             if per_file_settings.axis_owner:
@@ -910,13 +1512,7 @@ class DataVisualizationTool(QMainWindow):
                 "ecu_throttle_adc",       # Second: moves first to right, becomes left (will be moved to right by third)
                 "ecu_rpm_instantaneous"   # Third: moves second to right, becomes left axis owner
             ]
-
-            for stream_name in default_streams:
-                # Find the widget for this stream
-                for widget in self.stream_list_widget.stream_widgets:
-                    if widget.stream_name == stream_name:
-                        widget.checkbox.setChecked(True)
-                        break
+            self._enable_streams_bulk(default_streams)
 
     def filter_streams(self, search_text):
         """Filter visible streams based on search text"""
@@ -951,12 +1547,11 @@ class DataVisualizationTool(QMainWindow):
         self.config.set(f"stream_unit_{stream_name}", units_key)
         self._apply_stream_unit(stream_name, units_key)
         # Update the sidebar label on the stream widget
-        for widget in self.stream_list_widget.stream_widgets:
-            if widget.stream_name == stream_name and widget.unit_options:
-                unit_label = next((lbl for lbl, uk in widget.unit_options if uk == units_key), None)
-                if unit_label:
-                    widget.update_unit_label(unit_label)
-                break
+        widget = self.stream_list_widget.stream_widget_by_name.get(stream_name)
+        if widget and widget.unit_options:
+            unit_label = next((lbl for lbl, uk in widget.unit_options if uk == units_key), None)
+            if unit_label:
+                widget.update_unit_label(unit_label)
         self.update_graph_plot()
         self.update_navigation_plot()
 
@@ -981,6 +1576,8 @@ class DataVisualizationTool(QMainWindow):
         display_values = UnitConverter.convert(native_values, data_type, native_units, new_units)
         entry['values'] = display_values
         meta['display_units'] = new_units
+        if stream_name in self.lod_pyramid:
+            self._build_lod_pyramid(stream_name)
 
         # Recalculate range in new units (ignore NaNs from sentinel values)
         valid = display_values[~np.isnan(display_values)]
@@ -1024,6 +1621,11 @@ class DataVisualizationTool(QMainWindow):
                 _convert_bound('display_range_min_top')
                 _convert_bound('display_range_max_bottom')
 
+    def _build_lod_pyramid(self, stream_name):
+        """(Re)build the decimation pyramid for one stream from its current display values."""
+        entry = self.raw_data[stream_name]
+        self.lod_pyramid[stream_name] = LODPyramid(entry['time'], entry['values'], MAX_PLOT_POINTS)
+
     def update_recent_files_menu(self):
         """Update the recent files menu."""
         self.recent_files_menu.clear()
@@ -1056,11 +1658,8 @@ class DataVisualizationTool(QMainWindow):
         else:
             print(f"File not found: {filepath}")
             # Remove from recent files
-            recent = self.config.get_recent_files()
-            if filepath in recent:
-                recent.remove(filepath)
-                self.config.settings.setValue("recent_files", recent)
-                self.update_recent_files_menu()
+            self.config.remove_recent_file(filepath)
+            self.update_recent_files_menu()
 
     def clear_recent_files(self):
         """Clear the recent files list."""
@@ -1088,8 +1687,7 @@ class DataVisualizationTool(QMainWindow):
 
     def load_file_with_conversion(self, filename):
         """Load a file, offering to convert from .um4 to .h5 if needed."""
-        from PySide6.QtWidgets import QMessageBox, QProgressDialog
-        import subprocess
+        from PySide6.QtWidgets import QMessageBox
 
         # Check if file is HDF5
         if filename.endswith('.h5') or filename.endswith('.hdf5'):
@@ -1147,72 +1745,8 @@ class DataVisualizationTool(QMainWindow):
             if not h5_filename:
                 return
 
-            # Run decoder to convert .um4 to .h5
-            try:
-                if not DECODER_AVAILABLE or decodelog is None:
-                    error_msg = "The decoder module is not available.\n\n"
-                    if DECODER_IMPORT_ERROR:
-                        error_msg += f"Import error:\n{DECODER_IMPORT_ERROR}\n\n"
-                    error_msg += "Cannot convert .um4 files to HDF5 format."
-                    QMessageBox.critical(
-                        self,
-                        "Decoder Not Available",
-                        error_msg,
-                        QMessageBox.StandardButton.Ok
-                    )
-                    return
-
-                # Live progress dialog - decodelog.main() runs synchronously
-                # on this thread, so the callback below also calls
-                # processEvents() to keep the bar (and the rest of the
-                # window) repainting during the otherwise-blocking call.
-                progress = QProgressDialog(
-                    f"Converting {os.path.basename(filename)} to HDF5...",
-                    None,  # no cancel button - decode can't be interrupted mid-loop
-                    0, 100, self
-                )
-                progress.setWindowTitle("Converting...")
-                progress.setWindowModality(Qt.WindowModal)
-                progress.setMinimumDuration(0)
-                progress.setValue(0)
-
-                def _on_decode_progress(bytes_read, total_bytes):
-                    progress.setValue(int(bytes_read * 100 / total_bytes))
-                    QApplication.processEvents()
-
-                # Save original sys.argv/callback and replace with ours
-                original_argv = sys.argv
-                sys.argv = ['decodelog', filename, '--format', 'h5', '-o', h5_filename]
-                decodelog.PROGRESS_CALLBACK = _on_decode_progress
-
-                try:
-                    # Call the decoder's main function directly
-                    decodelog.main()
-                    progress.setValue(100)
-                    progress.close()
-
-                    # Success - load the converted file
-                    QMessageBox.information(
-                        self,
-                        "Conversion Complete",
-                        f"Successfully converted to:\n{h5_filename}",
-                        QMessageBox.StandardButton.Ok
-                    )
-                    self.load_hdf5_file_internal(h5_filename)
-
-                finally:
-                    # Restore original sys.argv/callback
-                    sys.argv = original_argv
-                    decodelog.PROGRESS_CALLBACK = None
-                    progress.close()
-
-            except Exception as e:
-                QMessageBox.critical(
-                    self,
-                    "Conversion Error",
-                    f"Error converting file:\n\n{str(e)}",
-                    QMessageBox.StandardButton.Ok
-                )
+            # Run decoder to convert .um4 to .h5, then load the result
+            self._start_decode(filename, h5_filename, 'h5', load_when_done=True)
         else:
             # Unknown file type
             QMessageBox.warning(
@@ -1261,58 +1795,7 @@ class DataVisualizationTool(QMainWindow):
         if not h5_filename:
             return
 
-        # Check if decoder is available
-        if not DECODER_AVAILABLE or decodelog is None:
-            error_msg = "The decoder module is not available.\n\n"
-            if DECODER_IMPORT_ERROR:
-                error_msg += f"Import error:\n{DECODER_IMPORT_ERROR}\n\n"
-            error_msg += "Cannot convert .um4 files to HDF5 format."
-            QMessageBox.critical(
-                self,
-                "Decoder Not Available",
-                error_msg,
-                QMessageBox.StandardButton.Ok
-            )
-            return
-
-        # Perform conversion
-        try:
-            # Show progress message
-            QMessageBox.information(
-                self,
-                "Converting...",
-                f"Converting {os.path.basename(um4_filename)} to HDF5...\n\n"
-                f"This may take a moment. Click OK to continue.",
-                QMessageBox.StandardButton.Ok
-            )
-
-            # Save original sys.argv and replace it with our arguments
-            original_argv = sys.argv
-            sys.argv = ['decodelog', um4_filename, '--format', 'h5', '-o', h5_filename]
-
-            try:
-                # Call the decoder's main function directly
-                decodelog.main()
-
-                # Success
-                QMessageBox.information(
-                    self,
-                    "Conversion Complete",
-                    f"Successfully converted to:\n{h5_filename}",
-                    QMessageBox.StandardButton.Ok
-                )
-
-            finally:
-                # Restore original sys.argv
-                sys.argv = original_argv
-
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Conversion Error",
-                f"Error converting file:\n\n{str(e)}",
-                QMessageBox.StandardButton.Ok
-            )
+        self._start_decode(um4_filename, h5_filename, 'h5')
 
     def convert_um4_to_hr(self):
         """Convert a .um4 file to human-readable format."""
@@ -1353,8 +1836,25 @@ class DataVisualizationTool(QMainWindow):
         if not hr_filename:
             return
 
+        self._start_decode(um4_filename, hr_filename, 'hr')
+
+    def _start_decode(self, um4_filename, output_filename, output_format, load_when_done=False):
+        """
+        Convert a .um4 file with decodelog in a background QThread.
+
+        A modeless progress dialog tracks the decode while the rest of the window
+        stays responsive; completion and errors are reported from the GUI thread.
+
+        Args:
+            um4_filename: Path to the .um4 binary log
+            output_filename: Path of the file to write
+            output_format: decodelog --format value ('h5' or 'hr')
+            load_when_done: Load output_filename as HDF5 once conversion succeeds
+        """
+        from PySide6.QtWidgets import QMessageBox, QProgressDialog
+
         # Check if decoder is available
-        if not DECODER_AVAILABLE or decodelog is None:
+        if _import_decoder() is None:
             error_msg = "The decoder module is not available.\n\n"
             if DECODER_IMPORT_ERROR:
                 error_msg += f"Import error:\n{DECODER_IMPORT_ERROR}\n\n"
@@ -1367,54 +1867,178 @@ class DataVisualizationTool(QMainWindow):
             )
             return
 
-        # Perform conversion
-        try:
-            # Show progress message
+        if self._decode_job is not None:
             QMessageBox.information(
                 self,
-                "Converting...",
-                f"Converting {os.path.basename(um4_filename)} to human-readable format...\n\n"
-                f"This may take a moment. Click OK to continue.",
+                "Conversion In Progress",
+                "Another file is still being converted. Please wait for it to finish.",
                 QMessageBox.StandardButton.Ok
             )
+            return
 
-            # Save original sys.argv and replace it with our arguments
-            original_argv = sys.argv
-            sys.argv = ['decodelog', um4_filename, '--format', 'hr', '-o', hr_filename]
+        format_name = "HDF5" if output_format == 'h5' else "human-readable format"
+        progress = QProgressDialog(
+            f"Converting {os.path.basename(um4_filename)} to {format_name}...",
+            None,  # no cancel button - decode can't be interrupted mid-loop
+            0, 100, self
+        )
+        progress.setWindowTitle("Converting...")
+        progress.setWindowModality(Qt.NonModal)
+        progress.setMinimumDuration(0)
+        progress.setValue(0)
 
-            try:
-                # Call the decoder's main function directly
-                decodelog.main()
+        worker = DecodeWorker(um4_filename, output_filename, output_format)
+        worker.progress.connect(progress.setValue)
+        worker.finished.connect(self._on_decode_finished)
+        worker.failed.connect(self._on_decode_failed)
 
-                # Success
-                QMessageBox.information(
-                    self,
-                    "Conversion Complete",
-                    f"Successfully converted to:\n{hr_filename}",
-                    QMessageBox.StandardButton.Ok
-                )
+        self._decode_job = (worker, progress, load_when_done)
+        self._start_worker(worker, (worker.finished, worker.failed))
 
-            finally:
-                # Restore original sys.argv
-                sys.argv = original_argv
+    def _start_worker(self, worker, done_signals):
+        """
+        Run worker.run() in a new QThread.
 
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Conversion Error",
-                f"Error converting file:\n\n{str(e)}",
-                QMessageBox.StandardButton.Ok
-            )
+        The worker is kept referenced until its thread has exited, so it isn't
+        destroyed while run() is still unwinding after emitting its result.
+
+        Args:
+            worker: QObject with a run() method (must not have a parent)
+            done_signals: Worker signals that mean run() is done
+        """
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        for signal in done_signals:
+            signal.connect(thread.quit)
+        thread.finished.connect(self._on_worker_thread_finished)
+        self._worker_threads[thread] = worker
+        thread.start()
 
+    def _on_worker_thread_finished(self):
+        """Release a worker and its thread once the thread has exited."""
+        thread = self.sender()
+        worker = self._worker_threads.pop(thread, None)
+        if worker is not None:
+            worker.deleteLater()
+        thread.deleteLater()
+
+    def _end_decode_job(self):
+        """Close the progress dialog and forget the finished decode job; returns load_when_done."""
+        _, progress, load_when_done = self._decode_job
+        self._decode_job = None
+        progress.close()
+        progress.deleteLater()
+        return load_when_done
+
+    def _on_decode_finished(self, output_filename):
+        """Report a successful conversion and optionally load the result."""
+        from PySide6.QtWidgets import QMessageBox
+
+        load_when_done = self._end_decode_job()
+        QMessageBox.information(
+            self,
+            "Conversion Complete",
+            f"Successfully converted to:\n{output_filename}",
+            QMessageBox.StandardButton.Ok
+        )
+        if load_when_done:
+            self.load_hdf5_file_internal(output_filename)
+
+    def _on_decode_failed(self, error):
+        """Report a failed conversion."""
+        from PySide6.QtWidgets import QMessageBox
+
+        self._end_decode_job()
+        QMessageBox.critical(
+            self,
+            "Conversion Error",
+            f"Error converting file:\n\n{error}",
+            QMessageBox.StandardButton.Ok
+        )
 
     def load_hdf5_file_internal(self, filename):
-        """Internal method to load HDF5 file (used by both file picker and recent files)."""
+        """
+        Internal method to load HDF5 file (used by both file picker and recent files).
+
+        The file is read in a background thread (LoadWorker) while a progress dialog
+        keeps the window painting; the result is applied by _apply_loaded_data().
+        A load started while another is running supersedes it.
+        """
+        from PySide6.QtWidgets import QProgressDialog
+
+        if self._load_job is not None:
+            self._cancel_load()
+
+        self._load_job_counter += 1
+        job_id = self._load_job_counter
+
+        progress = QProgressDialog(f"Loading {os.path.basename(filename)}...", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Loading...")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(500)  # Only show for loads that take a noticeable time
+        progress.canceled.connect(self._cancel_load)
+
+        # Preferences are read here: QSettings (behind AppConfig) isn't safe to share with the worker
+        unit_preferences = {
+            'temperature': self.config.get_temperature_units(),
+            'velocity': self.config.get_velocity_units(),
+            'pressure': self.config.get_pressure_units(),
+        }
+        worker = LoadWorker(job_id, filename, self.hdf5_loader, unit_preferences,
+                            bool(self.config.get("float32_values")), self.stream_config)
+        worker.progress.connect(self._on_load_progress)
+        worker.loaded.connect(self._on_load_finished)
+        worker.failed.connect(self._on_load_failed)
+
+        self._load_job = (job_id, progress)
+        self._start_worker(worker, (worker.loaded, worker.failed))
+
+    def _on_load_progress(self, datasets_read, datasets_total):
+        """Show dataset read progress in the load dialog."""
+        if self._load_job is None:
+            return
+        progress = self._load_job[1]
+        progress.setMaximum(datasets_total)
+        progress.setValue(datasets_read)
+        progress.setLabelText(f"Loading streams: {datasets_read}/{datasets_total}")
+
+    def _end_load_job(self, job_id):
+        """Close the dialog of the current load; returns False if job_id is stale or cancelled."""
+        if self._load_job is None or self._load_job[0] != job_id:
+            return False
+        progress = self._load_job[1]
+        self._load_job = None
+        progress.canceled.disconnect(self._cancel_load)
+        progress.close()
+        progress.deleteLater()
+        return True
+
+    def _cancel_load(self):
+        """Abandon the running load; the worker finishes reading but its result is dropped."""
+        if self._load_job is not None:
+            self._end_load_job(self._load_job[0])
+            self._load_done_message = None
+            print("File load cancelled")
+
+    def _on_load_failed(self, job_id, error):
+        """Report a load that raised in the worker thread."""
+        if self._end_load_job(job_id):
+            self._load_done_message = None
+            print(f"Error loading HDF5 file: {error}")
+
+    def _on_load_finished(self, job_id, loaded_data):
+        """Apply a finished background load, unless it was cancelled or superseded."""
+        if self._end_load_job(job_id):
+            self._apply_loaded_data(loaded_data)
+
+    def _apply_loaded_data(self, loaded_data):
+        """Install a loaded file's data and rebuild the UI for it (GUI thread)."""
+        filename = loaded_data['filepath']
+        done_message, self._load_done_message = self._load_done_message, None
         try:
             self.current_file = filename
 
-            # Load data using HDF5DataLoader (Phase 2 refactoring)
-            loaded_data = self.hdf5_loader.load_file(filename, self.config)
-
             # Store data in DataManager
             self.data_manager.set_data(
                 loaded_data['raw_data'],
@@ -1431,16 +2055,12 @@ class DataVisualizationTool(QMainWindow):
             self.stream_metadata = self.data_manager.stream_metadata
             self.stream_ranges = self.data_manager.stream_ranges
 
-            # Load seek_index for log viewer (4-column dataset, not handled by hdf5_loader)
-            self.seek_index = None
+            # Stream classification and LOD pyramids were computed by the load worker
+            self._event_only_streams = loaded_data['event_only_streams']
+            self._skipped_streams = loaded_data['skipped_streams']
+
+            self.seek_index = loaded_data['seek_index']
             self.um4_path = None
-            try:
-                with h5py.File(filename, 'r') as hf:
-                    if 'seek_index' in hf and hf['seek_index'].shape[0] > 0:
-                        self.seek_index = hf['seek_index'][:]
-                        print(f"Loaded seek_index: {len(self.seek_index)} entries")
-            except Exception as e:
-                print(f"Could not load seek_index: {e}")
 
             # Look for companion .um4 binary log alongside the HDF5 file
             base = filename
@@ -1454,7 +2074,7 @@ class DataVisualizationTool(QMainWindow):
                 print(f"Found companion .um4: {um4_candidate}")
 
             # Update log viewer availability
-            if hasattr(self, 'log_panel_action'):
+            if self._ui_ready:
                 self.log_panel_action.setEnabled(
                     self.seek_index is not None and self.um4_path is not None)
 
@@ -1510,7 +2130,13 @@ class DataVisualizationTool(QMainWindow):
             self.view_controller.set_view_range(self.view_start, self.view_end)
 
             # Initialize normalizer (Phase 4 refactoring)
-            self.normalizer = DataNormalizer(self.stream_config, self.stream_ranges, debug=self.debug)
+            self.normalizer = DataNormalizer(self.stream_config, self.stream_ranges, self.data_manager, debug=self.debug)
+
+            # Compile the decimation and range kernels now so the first redraw doesn't stall
+            # on JIT (stream values are float32 unless the float32_values option is off)
+            value_dtype = np.float32 if self.config.get("float32_values") else np.float64
+            warm_up_decimation(value_dtype=value_dtype)
+            warm_up_range_pyramid(value_dtype=value_dtype)
 
             self.debug_print(f"Initial view: [{self.view_start:.2f}s, {self.view_end:.2f}s]")
 
@@ -1519,6 +2145,14 @@ class DataVisualizationTool(QMainWindow):
             self.axis_owner = None
             self.view_history.clear()
 
+            # Pyramids must be in place before populate: restoring a stream's saved
+            # units rebuilds its pyramid from the converted values
+            self.lod_pyramid = loaded_data['lod_pyramid']
+            self._decim_cache = {}
+            self._visible_max_cache = {}
+            self._nav_curve_cache = {}
+            self._last_axis_sig = None
+            self._remove_stream_curves()
             self.populate_stream_selection()
             self.update_navigation_plot()
             self.update_graph_plot()
@@ -1526,9 +2160,8 @@ class DataVisualizationTool(QMainWindow):
             # Restore view history from per-file settings or add initial view
             if per_file_settings and per_file_settings.view_history:
                 history_data = per_file_settings.view_history
-                self.view_history.history = [tuple(entry) for entry in history_data.get('history', [])]
-                self.view_history.history_index = history_data.get('current_index', 0)
-                self.view_history._emit_state()  # Update UI buttons
+                self.view_history.restore(history_data.get('history', []),
+                                          history_data.get('current_index', 0))
                 self.debug_print(f"Restored view history: {len(self.view_history.history)} entries, index={self.view_history.history_index}")
 
                 # Ensure the displayed view matches the current history entry
@@ -1558,6 +2191,10 @@ class DataVisualizationTool(QMainWindow):
 
             print("HDF5 file loaded successfully!")
 
+            if done_message:
+                from PySide6.QtWidgets import QMessageBox
+                QMessageBox.information(self, *done_message, QMessageBox.StandardButton.Ok)
+
         except Exception as e:
             print(f"Error loading HDF5 file: {e}")
             import traceback
@@ -1743,46 +2380,54 @@ class DataVisualizationTool(QMainWindow):
                     if len(eprom_loads) == 0:
                         metadata_text.append("  No EPROM loads recorded\n")
                     else:
-                        for i, load in enumerate(eprom_loads):
-                            # Decode name from bytes to string
-                            name = load['name'].decode('utf-8').rstrip('\x00')
-                            address = load['address']
-                            length = load['length']
-                            error_status = load['error_status']
-
-                            metadata_text.append(f"\nEPROM Load #{i+1}:\n")
-                            metadata_text.append(f"  Name:    {name}\n")
-                            metadata_text.append(f"  Address: 0x{address:04X}\n")
-                            metadata_text.append(f"  Length:  {length} bytes (0x{length:04X})\n")
-
-                            if error_status == 0:
-                                metadata_text.append(f"  Status:  Success\n")
-                            else:
-                                metadata_text.append(f"  Status:  Error (0x{error_status:02X})\n")
+                        # Decode whole columns at once, then emit one pre-formatted block per load
+                        names = np.char.rstrip(np.char.decode(eprom_loads['name'], 'utf-8'), '\x00')
+                        addresses = eprom_loads['address'].tolist()
+                        lengths = eprom_loads['length'].tolist()
+                        statuses = [
+                            "Success" if status == 0 else "Error (0x%02X)" % status
+                            for status in eprom_loads['error_status'].tolist()
+                        ]
+
+                        metadata_text.extend(
+                            "\nEPROM Load #%d:\n"
+                            "  Name:    %s\n"
+                            "  Address: 0x%04X\n"
+                            "  Length:  %d bytes (0x%04X)\n"
+                            "  Status:  %s\n" % (i + 1, name, address, length, length, status)
+                            for i, (name, address, length, status)
+                            in enumerate(zip(names.tolist(), addresses, lengths, statuses))
+                        )
                     metadata_text.append("\n")
 
                 # List all groups and datasets
                 metadata_text.append("STRUCTURE:\n")
                 metadata_text.append("-" * 70 + "\n")
 
-                def visit_item(name, obj):
+                # Low-level visit: the object info already carries the type and attribute
+                # count, so no Dataset/Group wrapper is built per object and attributes are
+                # only read for objects that actually have some
+                def visit_item(name_bytes, info):
+                    if name_bytes == b'.':
+                        return None
+                    name = name_bytes.decode('utf-8')
                     indent = "  " * (name.count('/'))
-                    if isinstance(obj, h5py.Dataset):
+                    if info.type == h5py.h5o.TYPE_DATASET:
+                        dsid = h5py.h5d.open(f.id, name_bytes)
                         metadata_text.append(f"{indent}📊 {name}\n")
-                        metadata_text.append(f"{indent}   Shape: {obj.shape}\n")
-                        metadata_text.append(f"{indent}   Dtype: {obj.dtype}\n")
-                        if obj.attrs:
-                            metadata_text.append(f"{indent}   Attributes:\n")
-                            for key, value in obj.attrs.items():
-                                metadata_text.append(f"{indent}     {key}: {value}\n")
-                    elif isinstance(obj, h5py.Group):
+                        metadata_text.append(f"{indent}   Shape: {dsid.shape}\n")
+                        metadata_text.append(f"{indent}   Dtype: {dsid.dtype}\n")
+                    elif info.type == h5py.h5o.TYPE_GROUP:
                         metadata_text.append(f"{indent}📁 {name}/\n")
-                        if obj.attrs:
-                            metadata_text.append(f"{indent}   Attributes:\n")
-                            for key, value in obj.attrs.items():
-                                metadata_text.append(f"{indent}     {key}: {value}\n")
+                    else:
+                        return None
+                    if info.num_attrs:
+                        metadata_text.append(f"{indent}   Attributes:\n")
+                        for key, value in f[name].attrs.items():
+                            metadata_text.append(f"{indent}     {key}: {value}\n")
+                    return None
 
-                f.visititems(visit_item)
+                h5py.h5o.visit(f.id, visit_item, info=True)
 
             text_edit.setPlainText("".join(metadata_text))
             layout.addWidget(text_edit)
@@ -1810,22 +2455,19 @@ class DataVisualizationTool(QMainWindow):
             stream_names: List of stream names to include
 
         Returns:
-            pandas DataFrame with unified time axis
+            Dict of numpy arrays {'time': uniform_time, stream_name: values, ...}
+            sharing one uniform time axis (column layout, no DataFrame copy)
         """
         if not raw_data or not stream_names:
             return None
 
-        # Find the time range across all streams
-        all_times = []
-        for stream in stream_names:
-            if stream in raw_data:
-                all_times.extend(raw_data[stream]['time'])
-
-        if not all_times:
+        streams = [stream for stream in stream_names if stream in raw_data and len(raw_data[stream]['time'])]
+        if not streams:
             return None
 
-        time_min = min(all_times)
-        time_max = max(all_times)
+        # Find the time range across all streams from each (sorted) stream's ends
+        time_min = float(np.minimum.reduce([raw_data[stream]['time'][0] for stream in streams]))
+        time_max = float(np.maximum.reduce([raw_data[stream]['time'][-1] for stream in streams]))
 
         # Create uniform time grid at 100 Hz (adjust based on data density)
         # This balances resolution vs. performance
@@ -1836,55 +2478,71 @@ class DataVisualizationTool(QMainWindow):
 
         self.debug_print(f"Creating unified time axis: {num_samples} samples from {time_min:.3f}s to {time_max:.3f}s")
 
-        # Create DataFrame
-        df_data = {'time': uniform_time}
-
-        # Interpolate each stream onto the uniform time grid
-        for stream in stream_names:
-            if stream in raw_data:
-                stream_data = raw_data[stream]
-                # Use numpy interp for fast linear interpolation
-                # Need to handle potential duplicate time values
-                unique_indices = np.unique(stream_data['time'], return_index=True)[1]
-                unique_time = stream_data['time'][unique_indices]
-                unique_values = stream_data['values'][unique_indices]
-
-                df_data[stream] = np.interp(
-                    uniform_time,
-                    unique_time,
-                    unique_values
-                )
+        def interp_stream(stream):
+            stream_data = raw_data[stream]
+            # Use numpy interp for fast linear interpolation
+            # Need to handle potential duplicate time values
+            unique_time, unique_indices = np.unique(stream_data['time'], return_index=True)
+            unique_values = stream_data['values'][unique_indices]
+            return np.interp(uniform_time, unique_time, unique_values)
+
+        # Interpolate each stream onto the uniform time grid; np.unique/np.interp
+        # release the GIL, so streams are resampled in parallel
+        unified = {'time': uniform_time}
+        with ThreadPoolExecutor(max_workers=min(len(streams), os.cpu_count() or 1)) as executor:
+            for stream, values in zip(streams, executor.map(interp_stream, streams)):
+                unified[stream] = values
 
-        return pd.DataFrame(df_data)
+        return unified
+
+    def _enable_stream(self, stream):
+        """Add stream to enabled_streams and update axis ownership (no redraw)."""
+        self.enabled_streams.append(stream)
+
+        # Get stream config to check if it should own an axis
+        stream_cfg = self.stream_config.get_stream(stream)
+        stream_owns_axis = stream_cfg.owns_axis if stream_cfg else True
+
+        # Event streams and non-axis-owning streams don't own axes
+        # Exception: smoothed RPM can own an axis when instantaneous RPM is not enabled
+        if self.stream_config.is_event_only_stream(stream) or (not stream_owns_axis and stream != 'ecu_rpm_smoothed'):
+            return
+        # Special case: If enabling smoothed RPM and instantaneous RPM is already the axis owner, don't take over
+        if stream == 'ecu_rpm_smoothed' and self.axis_owner == 'ecu_rpm_instantaneous':
+            return
+
+        if self.axis_owner is None:
+            # No axis owner yet, this becomes the left axis
+            self.axis_owner = stream
+        else:
+            # Already have a left axis owner, move it to right and make new stream left
+            self.right_axis_owner = self.axis_owner
+            self.axis_owner = stream
+
+    def _enable_streams_bulk(self, stream_names):
+        """
+        Check the widgets for several streams without firing toggle_stream for each.
+
+        Ownership is assigned in the given order exactly as individual toggles would,
+        but no redraw happens here - the caller draws once when it is done.
+        """
+        widgets = self.stream_list_widget.stream_widget_by_name
+        for stream_name in stream_names:
+            widget = widgets.get(stream_name)
+            if widget is None or widget.checkbox.isChecked():
+                continue
+            widget.checkbox.blockSignals(True)
+            try:
+                widget.checkbox.setChecked(True)
+            finally:
+                widget.checkbox.blockSignals(False)
+            self._enable_stream(stream_name)
 
     def toggle_stream(self, stream, state):
         """Handle stream enable/disable"""
         if state == Qt.CheckState.Checked.value:
-            # Enable stream
-            self.enabled_streams.append(stream)
-
-            # Get stream config to check if it should own an axis
-            stream_cfg = self.stream_config.get_stream(stream)
-            stream_owns_axis = stream_cfg.owns_axis if stream_cfg else True
-
-            # Event streams and non-axis-owning streams don't own axes
-            # Exception: smoothed RPM can own an axis when instantaneous RPM is not enabled
-            if self.stream_config.is_event_only_stream(stream) or (not stream_owns_axis and stream != 'ecu_rpm_smoothed'):
-                self.update_graph_plot()
-            # Special case: If enabling smoothed RPM and instantaneous RPM is already the axis owner, don't take over
-            elif stream == 'ecu_rpm_smoothed' and self.axis_owner == 'ecu_rpm_instantaneous':
-                self.update_graph_plot()
-            # Assign ownership - but don't change the axis owner yet
-            elif self.axis_owner is None:
-                # No axis owner yet, this becomes the left axis
-                self.axis_owner = stream
-                # Don't call fit_axis_owner here!
-                self.update_graph_plot()
-            else:
-                # Already have a left axis owner, move it to right and make new stream left
-                self.right_axis_owner = self.axis_owner
-                self.axis_owner = stream
-                self.update_graph_plot()
+            self._enable_stream(stream)
+            self.update_graph_plot()
 
         else:
             # Disable stream
@@ -1967,44 +2625,463 @@ class DataVisualizationTool(QMainWindow):
             self.update_graph_plot()
 
 
-    def request_update(self):
-        """Request a plot update (rate-limited to 30 FPS)"""
+    def request_update(self, navigation=True):
+        """
+        Request a plot update (rate-limited to 30 FPS).
+
+        Args:
+            navigation: Also rebuild the navigation plot; nav region drags pass False since
+                only the region moves and the overview curves stay the same
+        """
         self.pending_update = True
+        self.pending_nav_update = self.pending_nav_update or navigation
         if not self.update_timer.isActive():
             self.update_timer.start()
 
+    def schedule_graph_update(self):
+        """Redraw the main graph once control returns to the event loop (repeat calls coalesce)"""
+        self._graph_update_timer.start()
+
     def perform_pending_update(self):
         """Perform the actual update"""
         if self.pending_update:
             self.update_graph_plot()
-            self.update_navigation_plot()
+            if self.pending_nav_update:
+                self.update_navigation_plot()
             self.pending_update = False
+            self.pending_nav_update = False
         else:
             self.update_timer.stop()
 
-    def update_graph_plot(self):
-        """Update the main graph plot with dynamic level-of-detail"""
-        import math  # For temperature range calculations
-        self.graph_plot.clear()
+    def _view_bounds(self, time_array):
+        """
+        Get the index range of samples inside the current view window.
 
-        # Re-add GPS markers after clear (they get removed by clear())
-        self.graph_plot.addItem(self.gps_markers)
+        Args:
+            time_array: Sorted time array of a stream
 
-        # Re-add log cursor line if log panel is active
-        if self.log_panel_visible:
-            self.graph_plot.addItem(self._log_cursor_line)
+        Returns:
+            Tuple of (lo, hi) such that time_array[lo:hi] lies within [view_start, view_end]
+        """
+        lo = int(np.searchsorted(time_array, self.view_start, side='left'))
+        hi = int(np.searchsorted(time_array, self.view_end, side='right'))
+        return lo, hi
+
+    def _get_visible_max(self, stream_name, view_start, view_end):
+        """
+        Get the maximum of a stream's samples inside the view window.
+
+        Args:
+            stream_name: Stream in raw_data
+            view_start: Start of the view window
+            view_end: End of the view window
+
+        Returns:
+            The visible maximum as a float, or None if no samples are visible
+        """
+        values = self.raw_data[stream_name]['values']
+        key = (stream_name, view_start, view_end)
+        cached = self._visible_max_cache.get(key)
+        # Unit changes replace the values array, so only reuse a max computed from the same one
+        if cached is not None and cached[0] is values:
+            return cached[1]
+
+        # Answered from the stream's summary pyramid instead of scanning the window
+        _, visible_max = self.data_manager.get_visible_range(stream_name, view_start, view_end)
+
+        if len(self._visible_max_cache) >= VISIBLE_MAX_CACHE_MAX_ENTRIES:
+            self._visible_max_cache.clear()
+        self._visible_max_cache[key] = (values, visible_max)
+        return visible_max
+
+    def _visible_plot_data(self, all_time, all_values):
+        """
+        Get the raw points of a stream inside the current view, min/max decimated if needed.
+
+        Args:
+            all_time: Full time array for the stream
+            all_values: Full value array for the stream
+
+        Returns:
+            Tuple of (time, values) to plot, or (None, None) if the stream has no data
+        """
+        # Slice the visible time window plus one point on each edge (also when no point
+        # falls inside the window). This ensures lines connect properly even at extreme
+        # zoom levels; slicing gives views instead of mask/index copies.
+        lo = max(0, int(np.searchsorted(all_time, self.view_start, side='left')) - 1)
+        hi = min(len(all_time), int(np.searchsorted(all_time, self.view_end, side='right')) + 1)
+        visible_time = all_time[lo:hi]
+        visible_values = all_values[lo:hi]
+
+        if len(visible_time) == 0:
+            return None, None
+
+        # Dynamic decimation based on zoom level
+        # Target: ~MAX_PLOT_POINTS points max for smooth rendering
+        if len(visible_time) > MAX_PLOT_POINTS:
+            # Use min-max decimation to preserve peaks/valleys
+            return min_max_decimate(visible_time, visible_values, MAX_PLOT_POINTS)
+
+        # Zoomed in enough - plot every point
+        return visible_time, visible_values
+
+    def _get_stream_curve(self, stream, display_mode, color):
+        """
+        Get the persistent plot item for a stream, creating or restyling it as needed.
+
+        Args:
+            stream: Stream name
+            display_mode: "points" for scatter points, anything else for a line
+            color: Stream color
+
+        Returns:
+            PlotDataItem already added to graph_plot
+        """
+        curve = self._curves.get(stream)
+        if curve is None:
+            curve = pg.PlotDataItem()
+            self.graph_plot.addItem(curve)
+            self._curves[stream] = curve
+
+        style = (display_mode, color)
+        if self._curve_styles.get(stream) != style:
+            if display_mode == "points":
+                # Display as scatter points
+                curve.setPen(None)
+                curve.setSymbol('o')
+                curve.setSymbolSize(4)
+                curve.setSymbolBrush(color)
+                curve.setSymbolPen(None)
+            else:
+                # Display as line (default)
+                curve.setSymbol(None)
+                curve.setPen(pg.mkPen(color=color, width=2))
+            self._curve_styles[stream] = style
+
+        return curve
+
+    def _hide_curves_except(self, visible_streams):
+        """Hide the persistent curves of all streams not in visible_streams."""
+        for stream, curve in self._curves.items():
+            if stream not in visible_streams and curve.isVisible():
+                curve.setVisible(False)
+
+    def _remove_stream_curves(self):
+        """Remove all persistent stream curves from the graph (on file load)."""
+        for curve in self._curves.values():
+            self.graph_plot.removeItem(curve)
+        self._curves = {}
+        self._curve_styles = {}
+
+    def _add_transient_item(self, item):
+        """Add an item to the graph that is discarded on the next update_graph_plot()."""
+        self.graph_plot.addItem(item)
+        self._transient_items.append(item)
+
+    def _clear_transient_items(self):
+        """Remove the event markers and bars drawn by the previous update."""
+        for item in self._transient_items:
+            self.graph_plot.removeItem(item)
+        self._transient_items = []
+
+    def _axis_font(self):
+        """Get the shared QFont for the configured axis font size."""
+        font = self._axis_font_cache.get(self.axis_font_size)
+        if font is None:
+            font = QFont()
+            font.setPointSize(self.axis_font_size)
+            self._axis_font_cache[self.axis_font_size] = font
+        return font
+
+    def _set_axis_label(self, axis_name, text):
+        """Set an axis label and its font, skipping Qt calls if neither changed since last time."""
+        state = (text, self.axis_font_size)
+        if self._axis_label_state.get(axis_name) == state:
+            return
+        self.graph_plot.setLabel(axis_name, text)
+        self.graph_plot.getAxis(axis_name).label.setFont(self._axis_font())
+        self._axis_label_state[axis_name] = state
+
+    def _set_axis_tick_font(self, axis_name):
+        """Apply the axis font to an axis's tick labels if its size changed since last time."""
+        if self._axis_tick_font_size.get(axis_name) == self.axis_font_size:
+            return
+        self.graph_plot.getAxis(axis_name).setTickFont(self._axis_font())
+        self._axis_tick_font_size[axis_name] = self.axis_font_size
+
+    def _generate_ticks(self, axis_min, axis_max, tick_spacing_real):
+        """
+        Generate nice round tick values covering an axis range.
+
+        Args:
+            axis_min: Lowest real value shown on the axis
+            axis_max: Highest real value shown on the axis
+            tick_spacing_real: Spacing between ticks in real units
+
+        Returns:
+            Tuple of (axis_min_rounded, axis_max_rounded, real_ticks array); the
+            array is shared with the cache and must not be modified
+        """
+        key = (axis_min, axis_max, tick_spacing_real)
+        cached = self._tick_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Round axis_min DOWN to nearest tick spacing multiple
+        # This ensures ticks start at nice round numbers (0, 500, 1000, etc)
+        # Note: floor(a / s) rather than a // s - floor division is exact, so with a
+        # fractional spacing it lands a step low (1.0 // 0.1 == 9.0) and adds a stray tick
+        axis_min_rounded = floor(axis_min / tick_spacing_real) * tick_spacing_real
+
+        # Round axis_max UP to nearest tick spacing multiple
+        axis_max_rounded = ceil(axis_max / tick_spacing_real) * tick_spacing_real
+
+        # Half a step of slack so the top tick survives float rounding in arange
+        real_ticks = np.arange(axis_min_rounded, axis_max_rounded + tick_spacing_real * 0.5, tick_spacing_real)
+
+        if len(self._tick_cache) >= TICK_CACHE_MAX_ENTRIES:
+            self._tick_cache.clear()
+        result = (axis_min_rounded, axis_max_rounded, real_ticks)
+        self._tick_cache[key] = result
+        return result
+
+    def _configure_axes(self, axis_owner_visible_range, rpm_inst_range):
+        """
+        Apply axis pens, labels, view ranges and owner tick formatters.
+
+        Args:
+            axis_owner_visible_range: (min, max) of the left axis owner in the view, or None
+            rpm_inst_range: (min, max) of instantaneous RPM in the view, or None
+        """
+        left_owner = self.axis_owner if self.axis_owner and self.axis_owner in self.enabled_streams else None
+        right_owner = (self.right_axis_owner
+                       if self.right_axis_owner and self.right_axis_owner in self.enabled_streams else None)
+
+        # Left axis: default "Value" label when there's no owner
+        if left_owner:
+            # Use visible range if available, otherwise fall back to full range
+            if axis_owner_visible_range is not None:
+                axis_min, axis_max = axis_owner_visible_range
+            else:
+                axis_min, axis_max = self.stream_ranges.get(left_owner, (0, 1))
+
+            axis_range = axis_max - axis_min
+            if axis_range == 0:
+                axis_range = 1  # Avoid division by zero for constant data
+            self._configure_value_axis('left', left_owner, axis_min, axis_max, axis_range)
+        else:
+            self._configure_value_axis('left', None, default_label='Value')
+
+        # Right axis: label cleared when there's no owner
+        if right_owner:
+            axis_min, axis_max = self._right_axis_range(right_owner, rpm_inst_range)
+            axis_range = axis_max - axis_min
+            if not np.isfinite(axis_range) or axis_range <= 0:
+                axis_min, axis_max, axis_range = 0.0, 1.0, 1.0
+            self._configure_value_axis('right', right_owner, axis_min, axis_max, axis_range)
+        else:
+            self._configure_value_axis('right', None, default_label='')
+
+        # Set x-axis label and tick labels with configured font size
+        self._set_axis_label('bottom', 'Time (s)')
+        self._set_axis_tick_font('bottom')
+
+        # Set the actual Y range for display
+        # Account for:
+        # - Bar space at bottom (bar_space_offset)
+        # - Data range (dynamic_normalize_max)
+        # - Headroom above for graph markers (e.g., CRID with line_height=0.04)
+        # Headroom of 0.10 provides space for CRID markers (line_height=0.04) plus text labels
+        # Total: data at 0.85 + marker line 0.04 + text ~0.03 + margin 0.03 = ~0.10 headroom needed
+        y_max = self.bar_space_offset + self.dynamic_normalize_max + 0.10
+
+        self.graph_plot.setXRange(self.view_start, self.view_end, padding=0)
+        self.graph_plot.setYRange(-0.08, y_max, padding=0)
+
+    def _right_axis_range(self, owner, rpm_inst_range):
+        """
+        Get the real-value range shown on the right axis.
+
+        Args:
+            owner: Name of the right axis owner stream
+            rpm_inst_range: (min, max) of instantaneous RPM in the view, or None
+
+        Returns:
+            Tuple of (axis_min, axis_max)
+        """
+        # Get stream configuration for display range constraints
+        right_stream_cfg = self.stream_config.get_stream(owner)
+
+        # Special case: If right axis owner is smoothed RPM, use instantaneous RPM's range
+        if owner == 'ecu_rpm_smoothed' and rpm_inst_range is not None:
+            axis_min, axis_max = rpm_inst_range
+            if self.debug:
+                self.debug_print(f"Right axis (smoothed RPM) using instantaneous RPM range: {rpm_inst_range}")
+        else:
+            # Get visible data for right axis stream
+            full_min, full_max = self.stream_ranges.get(owner, (0, 1))
+
+            # Check for fixed display range or constraints
+            if right_stream_cfg and right_stream_cfg.display_range_min is not None and right_stream_cfg.display_range_max is not None:
+                # Fixed range - no dynamic scaling
+                axis_min = right_stream_cfg.display_range_min
+                axis_max = right_stream_cfg.display_range_max
+            else:
+                # Dynamic scaling with optional constraints
+                visible_max = None
+                if owner in self.raw_data:
+                    visible_max = self._get_visible_max(owner, self.view_start, self.view_end)
+
+                if visible_max is not None:
+                    axis_min = full_min
+
+                    # Check for minimum top constraint
+                    if right_stream_cfg and right_stream_cfg.display_range_min_top is not None:
+                        min_top = right_stream_cfg.display_range_min_top
+                        if visible_max < min_top:
+                            visible_max = min_top
+
+                    axis_max = visible_max
+                else:
+                    axis_min = full_min
+                    axis_max = full_max
+
+        return axis_min, axis_max
+
+    def _configure_value_axis(self, side, owner, axis_min=None, axis_max=None, axis_range=None,
+                              default_label=''):
+        """
+        Style a value axis for its owner stream and label it with the owner's real values.
+
+        Ticks sit at nice round real values, placed where the owner's normalized data
+        is drawn. Without an owner the axis goes back to pyqtgraph's default ticks.
+
+        Args:
+            side: 'left' or 'right'
+            owner: Name of the stream that owns the axis, or None
+            axis_min: Real value at the bottom of the data area
+            axis_max: Real value at the top of the data area
+            axis_range: Span used for normalization (non-zero)
+            default_label: Axis label used when there's no owner
+        """
+        axis = self.graph_plot.getAxis(side)
+
+        if not owner:
+            axis.setPen(pg.mkPen('k', width=2))
+            axis.setTextPen(pg.mkPen('k'))
+            self._set_axis_label(side, default_label)
+            self._reset_value_axis(side)
+            return
+
+        color = self.stream_colors[owner]
+        axis.setPen(pg.mkPen(color=color, width=2))
+        axis.setTextPen(pg.mkPen(color=color))
+
+        # Set the axis label to the owner's name; label and tick labels use the configured font size
+        owner_metadata = self.stream_metadata.get(owner, {})
+        display_name = UnitConverter.get_display_name(owner,
+                                                      owner_metadata.get('native_units', 'value'),
+                                                      owner_metadata.get('display_units', 'value'))
+        self._set_axis_label(side, display_name)
+        self._set_axis_tick_font(side)
+
+        # Calculate nice round tick spacing
+        tick_spacing_real = _nice_tick_spacing(round(axis_range, 6))  # Calculate spacing based on full range
+
+        # Apply minimum spacing constraints for specific stream types
+        # Check if this is a temperature stream (contains "temp" in name)
+        if 'temp' in owner.lower():
+            owner_display_units = owner_metadata.get('display_units', 'celsius')
+            min_temp_spacing = UnitConverter.convert(
+                MIN_TEMPERATURE_TICK_SPACING_C, 'temperature', 'celsius', owner_display_units
+            ) - UnitConverter.convert(0.0, 'temperature', 'celsius', owner_display_units)
+            if tick_spacing_real < min_temp_spacing:
+                tick_spacing_real = min_temp_spacing
+                if self.debug:
+                    self.debug_print(f"  Applied min temp tick spacing: {min_temp_spacing:.1f} {owner_display_units}")
+
+        # Nice round tick values in real units (cached per range and spacing)
+        axis_min_rounded, axis_max_rounded, real_ticks = self._generate_ticks(axis_min, axis_max, tick_spacing_real)
+
+        # DEBUG
+        if self.debug:
+            self.debug_print(f"{side.capitalize()} axis stream: {owner}")
+            self.debug_print(f"  Data range: {axis_min:.1f} to {axis_max:.1f}")
+            self.debug_print(f"  Rounded range: {axis_min_rounded:.1f} to {axis_max_rounded:.1f}")
+            self.debug_print(f"  Tick spacing: {tick_spacing_real:.1f}")
+            self.debug_print(f"  Real ticks: {real_ticks}")
+
+        # Convert tick positions to DATA's normalized space
+        # Data is normalized to [bar_offset, bar_offset + normalize_max] range
+        # So ticks must be placed in the same range to align with the data
+        normalize_max = self.dynamic_normalize_max
+        bar_offset = self.bar_space_offset
+        data_normalized_ticks = ((real_ticks - axis_min) / axis_range) * normalize_max + bar_offset
+
+        # Filter ticks to only those within the visible area (bar_offset to bar_offset + normalize_max)
+        in_view = (data_normalized_ticks >= bar_offset) & (data_normalized_ticks <= bar_offset + normalize_max)
+        major_ticks = data_normalized_ticks[in_view].tolist()
+        tick_val = real_ticks[in_view]
+
+        if self.debug:
+            self.debug_print(f"  Visible ticks: {major_ticks} -> {tick_val.tolist()}")
+
+        # Determine decimal precision based on tick spacing
+        if tick_spacing_real >= 1:
+            precision = 0  # No decimal places for spacing >= 1
+        elif tick_spacing_real >= 0.1:
+            precision = 1  # One decimal place for spacing like 0.1, 0.2, 0.5
+        elif tick_spacing_real >= 0.01:
+            precision = 2  # Two decimal places for spacing like 0.01, 0.02, 0.05
+        else:
+            precision = 3  # Three decimal places for very small spacing
+
+        # Format the labels now so painting only has to look them up. pyqtgraph hands
+        # tickStrings the positions returned by tickValues, so they key the labels directly
+        tick_str_by_pos = {round(pos, 6): f"{val:.{precision}f}" for pos, val in zip(major_ticks, tick_val.tolist())}
+
+        # Override tickValues to specify exact tick positions
+        def custom_tick_values(minVal, maxVal, size):
+            # Return list of [(spacing, [tick_positions])] for major and minor ticks
+            # We return our pre-calculated positions
+            if self.debug:
+                self.debug_print(f"  {side} tickValues returning {len(major_ticks)} positions")
+            return [(1.0, major_ticks), (0.0, [])]  # No minor ticks
+
+        # Override tickStrings to show real values
+        def custom_tick_strings(values, scale, spacing):
+            if self.debug:
+                self.debug_print(f"  {side} tickStrings called with {len(values)} positions: {values[:5]}")
+            return [tick_str_by_pos.get(round(v, 6), "") for v in values]
+
+        # The closures already match pyqtgraph's signatures, so install them without a wrapper
+        self._tick_closures[side] = (custom_tick_values, custom_tick_strings)
+        axis.tickValues = custom_tick_values
+        axis.tickStrings = custom_tick_strings
+
+    def _reset_value_axis(self, side):
+        """Restore pyqtgraph's default tick values and labels on a value axis."""
+        if self._tick_closures.pop(side, None) is None:
+            return
+        axis = self.graph_plot.getAxis(side)
+        # Rebind the class methods over the instance overrides
+        axis.tickValues = axis.__class__.tickValues.__get__(axis, type(axis))
+        axis.tickStrings = axis.__class__.tickStrings.__get__(axis, type(axis))
+
+    def update_graph_plot(self):
+        """Update the main graph plot with dynamic level-of-detail"""
+        # Stream curves, GPS markers and the log cursor stay in the plot between updates;
+        # only the event markers and bars are rebuilt
+        self._clear_transient_items()
+        drawn_curves = set()
 
         if not self.raw_data or len(self.enabled_streams) == 0:
+            self._hide_curves_except(drawn_curves)
             # Reset to default axis formatting when no streams are enabled
-            left_axis = self.graph_plot.getAxis('left')
-            # Remove custom tick value generator if it exists
-            if hasattr(self, '_custom_tick_values'):
-                left_axis.tickValues = left_axis.__class__.tickValues.__get__(left_axis, type(left_axis))
-            # Remove custom tick string formatter if it exists
-            if hasattr(left_axis, 'tickStrings') and hasattr(self, '_custom_tick_strings'):
-                del left_axis.tickStrings
-            self.graph_plot.setLabel('left', 'Value')
+            self._reset_value_axis('left')
+            self._set_axis_label('left', 'Value')
             self.graph_plot.setYRange(0, 100)
+            self._last_axis_sig = None
             return
 
         # First pass: calculate visible range for axis owner (needed for normalization)
@@ -2029,7 +3106,15 @@ class DataVisualizationTool(QMainWindow):
                 self.view_end,
                 axis_owner_visible_range if 'ecu_rpm_instantaneous' == self.axis_owner else None
             )
-            self.debug_print(f"RPM instantaneous range: {rpm_inst_range}")
+            if self.debug:
+                self.debug_print(f"RPM instantaneous range: {rpm_inst_range}")
+
+        # Loop invariants, hoisted out of the per-stream loop
+        event_only_streams = self._event_only_streams
+        skipped_streams = self._skipped_streams
+        stream_colors = self.stream_colors
+        normalize_max = self.dynamic_normalize_max
+        bar_offset = self.bar_space_offset
 
         # Plot each enabled stream with dynamic decimation
         for stream in self.enabled_streams:
@@ -2037,73 +3122,45 @@ class DataVisualizationTool(QMainWindow):
                 continue
 
             # Skip event-only streams (markers, bars, etc.) - they have custom visualization
-            if self.stream_config.is_event_only_stream(stream):
+            if stream in event_only_streams:
                 continue
 
             # Skip duration/helper streams that shouldn't be plotted
-            if self.stream_config.should_skip_in_selection(stream):
+            if stream in skipped_streams:
                 continue
 
-            color = self.stream_colors[stream]
+            color = stream_colors[stream]
 
             # Get raw data for this stream
             stream_data = self.raw_data[stream]
             all_time = stream_data['time']
             all_values = stream_data['values']
 
-            # Filter to visible time window, including one point on each edge
-            # This ensures lines connect properly even at extreme zoom levels
-            mask = (all_time >= self.view_start) & (all_time <= self.view_end)
-            visible_indices = np.where(mask)[0]
-
-            if len(visible_indices) == 0:
-                # No points in view - find closest points on either side
-                left_idx = np.searchsorted(all_time, self.view_start, side='right') - 1
-                right_idx = np.searchsorted(all_time, self.view_end, side='left')
-
-                if left_idx >= 0 and right_idx < len(all_time):
-                    # Points exist on both sides
-                    visible_indices = np.array([left_idx, right_idx])
-                elif left_idx >= 0:
-                    # Only point on left exists
-                    visible_indices = np.array([left_idx])
-                elif right_idx < len(all_time):
-                    # Only point on right exists
-                    visible_indices = np.array([right_idx])
-                else:
-                    # No data at all
-                    continue
+            # Reuse last frame's points if the view hasn't moved (e.g. axis owner change)
+            cached = self._decim_cache.get(stream)
+            if (cached is not None and cached[0] == self.view_start and cached[1] == self.view_end
+                    and cached[2] is all_values):
+                plot_time, plot_values = cached[3], cached[4]
             else:
-                # Expand to include edge points
-                first_visible = visible_indices[0]
-                last_visible = visible_indices[-1]
-
-                # Include one point before first visible (if exists)
-                if first_visible > 0:
-                    visible_indices = np.concatenate([[first_visible - 1], visible_indices])
-
-                # Include one point after last visible (if exists)
-                if last_visible < len(all_time) - 1:
-                    visible_indices = np.concatenate([visible_indices, [last_visible + 1]])
+                # Zoomed out past the point budget: slice the precomputed pyramid level
+                # that fits instead of filtering and re-decimating the raw data
+                pyramid = self.lod_pyramid.get(stream)
+                if pyramid is not None:
+                    lo, hi = self._view_bounds(all_time)
+                    visible_count = hi - lo
+                    lod = pyramid.select(self.view_start, self.view_end, MAX_PLOT_POINTS) if visible_count > MAX_PLOT_POINTS else None
+                else:
+                    lod = None
 
-            visible_time = all_time[visible_indices]
-            visible_values = all_values[visible_indices]
+                if lod is not None:
+                    plot_time, plot_values = lod
+                else:
+                    plot_time, plot_values = self._visible_plot_data(all_time, all_values)
+                self._decim_cache[stream] = (self.view_start, self.view_end, all_values, plot_time, plot_values)
 
-            if len(visible_time) == 0:
+            if plot_time is None:
                 continue
 
-            # Dynamic decimation based on zoom level
-            # Target: ~10,000 points max for smooth rendering
-            max_plot_points = 10000
-
-            if len(visible_time) > max_plot_points:
-                # Use min-max decimation to preserve peaks/valleys
-                plot_time, plot_values = min_max_decimate(visible_time, visible_values, max_plot_points)
-            else:
-                # Zoomed in enough - plot every point
-                plot_time = visible_time
-                plot_values = visible_values
-
             # Get normalization range using DataNormalizer (Phase 4 refactoring)
             # Streams that don't own an axis should use the axis owner's range for consistent scaling
             stream_cfg = self.stream_config.get_stream(stream)
@@ -2122,475 +3179,47 @@ class DataVisualizationTool(QMainWindow):
                 # Stream owns its own axis or no axis owner exists, calculate its own range
                 stream_min, stream_max = self.normalizer.calculate_stream_range(
                     stream,
-                    self.raw_data,
-                    self.view_start,
-                    self.view_end,
-                    None
-                )
-
-            # Normalize the data using DataNormalizer (Phase 4 refactoring)
-            normalize_max = getattr(self, 'dynamic_normalize_max',
-                                   self.stream_config.get_setting('data_normalize_max', 0.85))
-            bar_offset = getattr(self, 'bar_space_offset', 0.0)
-            normalized_data = self.normalizer.normalize_data(
-                plot_values,
-                stream_min,
-                stream_max,
-                normalize_max,
-                bar_offset
-            )
-
-            # Get display mode for this stream
-            stream_widget = None
-            for widget in self.stream_list_widget.stream_widgets:
-                if widget.stream_name == stream:
-                    stream_widget = widget
-                    break
-
-            if stream_widget and stream_widget.display_mode == "points":
-                # Display as scatter points
-                self.graph_plot.plot(
-                    plot_time,
-                    normalized_data,
-                    pen=None,
-                    symbol='o',
-                    symbolSize=4,
-                    symbolBrush=color,
-                    symbolPen=None
-                )
-            else:
-                # Display as line (default)
-                pen = pg.mkPen(color=color, width=2)
-                self.graph_plot.plot(plot_time, normalized_data, pen=pen, connect='finite')
-
-        # Set axis properties based on owner (for display purposes only)
-        if self.axis_owner and self.axis_owner in self.enabled_streams:
-            color = self.stream_colors[self.axis_owner]
-            self.graph_plot.getAxis('left').setPen(pg.mkPen(color=color, width=2))
-            self.graph_plot.getAxis('left').setTextPen(pg.mkPen(color=color))
-
-            # Set the y-axis label to the axis owner's name with larger font
-            display_units = self.stream_metadata.get(self.axis_owner, {}).get('display_units', 'value')
-            display_name = UnitConverter.get_display_name(self.axis_owner,
-                                                        self.stream_metadata.get(self.axis_owner, {}).get('native_units', 'value'),
-                                                        display_units)
-
-            # Create font with configured size
-            label_font = QFont()
-            label_font.setPointSize(self.axis_font_size)
-
-            # For pyqtgraph labels, we need to use the setLabel method properly
-            self.graph_plot.setLabel('left', display_name)
-
-            # Apply font to the axis label text
-            self.graph_plot.getAxis('left').label.setFont(label_font)
-
-            # Set larger font for tick labels as well
-            tick_font = QFont()
-            tick_font.setPointSize(self.axis_font_size)
-            self.graph_plot.getAxis('left').setTickFont(tick_font)
-
-        else:
-            self.graph_plot.getAxis('left').setPen(pg.mkPen('k', width=2))
-            self.graph_plot.getAxis('left').setTextPen(pg.mkPen('k'))
-            # Use larger font for default "Value" label too
-            label_font = QFont()
-            label_font.setPointSize(self.axis_font_size)
-            self.graph_plot.setLabel('left', 'Value')
-            self.graph_plot.getAxis('left').label.setFont(label_font)
-
-        # Set up right axis properties based on right axis owner
-        if self.right_axis_owner and self.right_axis_owner in self.enabled_streams:
-            color = self.stream_colors[self.right_axis_owner]
-            self.graph_plot.getAxis('right').setPen(pg.mkPen(color=color, width=2))
-            self.graph_plot.getAxis('right').setTextPen(pg.mkPen(color=color))
-
-            # Set the right y-axis label to the axis owner's name with larger font
-            display_units = self.stream_metadata.get(self.right_axis_owner, {}).get('display_units', 'value')
-            display_name = UnitConverter.get_display_name(self.right_axis_owner,
-                                                        self.stream_metadata.get(self.right_axis_owner, {}).get('native_units', 'value'),
-                                                        display_units)
-
-            # Create font with configured size
-            label_font = QFont()
-            label_font.setPointSize(self.axis_font_size)
-
-            # For pyqtgraph labels, we need to use the setLabel method properly
-            self.graph_plot.setLabel('right', display_name)
-
-            # Apply font to the axis label text
-            self.graph_plot.getAxis('right').label.setFont(label_font)
-
-            # Set larger font for tick labels as well
-            tick_font = QFont()
-            tick_font.setPointSize(self.axis_font_size)
-            self.graph_plot.getAxis('right').setTickFont(tick_font)
-
-        else:
-            self.graph_plot.getAxis('right').setPen(pg.mkPen('k', width=2))
-            self.graph_plot.getAxis('right').setTextPen(pg.mkPen('k'))
-            # Clear the right axis label when no owner
-            label_font = QFont()
-            label_font.setPointSize(self.axis_font_size)
-            self.graph_plot.setLabel('right', '')
-            self.graph_plot.getAxis('right').label.setFont(label_font)
-
-        # Set x-axis label with configured font size
-        x_label_font = QFont()
-        x_label_font.setPointSize(self.axis_font_size)
-        self.graph_plot.setLabel('bottom', 'Time (s)')
-        self.graph_plot.getAxis('bottom').label.setFont(x_label_font)
-
-        # Set x-axis tick labels with configured font size
-        x_tick_font = QFont()
-        x_tick_font.setPointSize(self.axis_font_size)
-        self.graph_plot.getAxis('bottom').setTickFont(x_tick_font)
-
-        # Set the actual Y range for display
-        # Account for:
-        # - Bar space at bottom (bar_space_offset)
-        # - Data range (dynamic_normalize_max)
-        # - Headroom above for graph markers (e.g., CRID with line_height=0.04)
-        bar_offset = getattr(self, 'bar_space_offset', 0.0)
-        normalize_max = getattr(self, 'dynamic_normalize_max',
-                               self.stream_config.get_setting('data_normalize_max', 0.85))
-
-        # Calculate top of display area: bar_offset + normalize_max + headroom for markers
-        # Headroom of 0.10 provides space for CRID markers (line_height=0.04) plus text labels
-        # Total: data at 0.85 + marker line 0.04 + text ~0.03 + margin 0.03 = ~0.10 headroom needed
-        y_max = bar_offset + normalize_max + 0.10
-
-        self.graph_plot.setXRange(self.view_start, self.view_end, padding=0)
-        self.graph_plot.setYRange(-0.08, y_max, padding=0)
-
-        # Set up custom tick formatter to show axis owner's real values with round numbers
-        if self.axis_owner and self.axis_owner in self.enabled_streams:
-            # Use visible range if available, otherwise fall back to full range
-            if axis_owner_visible_range is not None:
-                axis_min, axis_max = axis_owner_visible_range
-            else:
-                axis_min, axis_max = self.stream_ranges.get(self.axis_owner, (0, 1))
-
-            axis_range = axis_max - axis_min
-            if axis_range == 0:
-                axis_range = 1  # Avoid division by zero for constant data
-
-            # Calculate nice round tick spacing
-            import math
-            def get_nice_tick_spacing(data_range):
-                """Calculate a nice round number for tick spacing"""
-                if not data_range or not math.isfinite(data_range) or data_range <= 0:
-                    return 1
-                # Get order of magnitude
-                exponent = math.floor(math.log10(data_range))
-                magnitude = 10 ** exponent
-                # Normalize to 1-10 range
-                normalized = data_range / magnitude
-                # Choose nice spacing: 0.1, 0.2, 0.5, 1, 2, 5, 10, etc.
-                if normalized <= 1.0:
-                    nice_spacing = 0.1 * magnitude
-                elif normalized <= 2.0:
-                    nice_spacing = 0.2 * magnitude
-                elif normalized <= 5.0:
-                    nice_spacing = 0.5 * magnitude
-                elif normalized <= 10.0:
-                    nice_spacing = 1.0 * magnitude
-                else:
-                    nice_spacing = 2.0 * magnitude
-                return nice_spacing
-
-            tick_spacing_real = get_nice_tick_spacing(axis_range)  # Calculate spacing based on full range
-
-            # Apply minimum spacing constraints for specific stream types
-            # Check if this is a temperature stream (contains "temp" in name)
-            if 'temp' in self.axis_owner.lower():
-                owner_display_units = self.stream_metadata.get(self.axis_owner, {}).get('display_units', 'celsius')
-                min_temp_spacing = UnitConverter.convert(
-                    MIN_TEMPERATURE_TICK_SPACING_C, 'temperature', 'celsius', owner_display_units
-                ) - UnitConverter.convert(0.0, 'temperature', 'celsius', owner_display_units)
-                if tick_spacing_real < min_temp_spacing:
-                    tick_spacing_real = min_temp_spacing
-                    self.debug_print(f"  Applied min temp tick spacing: {min_temp_spacing:.1f} {owner_display_units}")
-
-            # Round axis_min DOWN to nearest tick spacing multiple
-            # This ensures ticks start at nice round numbers (0, 500, 1000, etc)
-            axis_min_rounded = math.floor(axis_min / tick_spacing_real) * tick_spacing_real
-
-            # Round axis_max UP to nearest tick spacing multiple
-            axis_max_rounded = math.ceil(axis_max / tick_spacing_real) * tick_spacing_real
-
-            # Generate nice round tick values in real units
-            real_ticks = []
-            tick_value = axis_min_rounded
-            while tick_value <= axis_max_rounded:
-                real_ticks.append(tick_value)
-                tick_value += tick_spacing_real
-
-            # DEBUG
-            self.debug_print(f"Stream: {self.axis_owner}")
-            self.debug_print(f"  Data range: {axis_min:.1f} to {axis_max:.1f}")
-            self.debug_print(f"  Rounded range: {axis_min_rounded:.1f} to {axis_max_rounded:.1f}")
-            self.debug_print(f"  Tick spacing: {tick_spacing_real:.1f}")
-            self.debug_print(f"  Real ticks: {real_ticks}")
-
-            # Convert tick positions to DATA's normalized 0-1 space (where 0=axis_min, 1=axis_max)
-            # This is where the ticks will actually be drawn since data is normalized to this range
-            normalize_max = getattr(self, 'dynamic_normalize_max',
-                                   self.stream_config.get_setting('data_normalize_max', 0.85))
-            data_normalized_ticks = [((t - axis_min) / axis_range) * normalize_max for t in real_ticks]
-
-            # If bars are enabled, shift tick positions up by bar offset to match shifted data
-            bar_offset = getattr(self, 'bar_space_offset', 0.0)
-            if bar_offset > 0:
-                data_normalized_ticks = [pos + bar_offset for pos in data_normalized_ticks]
-
-            self.debug_print(f"  Normalized tick positions: {data_normalized_ticks}")
-
-            left_axis = self.graph_plot.getAxis('left')
-
-            # Filter ticks to only those within the visible area (accounting for bar offset)
-            min_visible = bar_offset
-            max_visible = bar_offset + normalize_max
-            visible_ticks = [(norm_pos, real_val) for norm_pos, real_val in zip(data_normalized_ticks, real_ticks)
-                           if min_visible <= norm_pos <= max_visible]
-
-            self.debug_print(f"  Visible ticks: {visible_ticks}")
-
-            # Override tickValues to specify exact tick positions
-            def custom_tick_values(minVal, maxVal, size):
-                # Return list of [(spacing, [tick_positions])] for major and minor ticks
-                # We return our pre-calculated positions
-                major_ticks = [pos for pos, _ in visible_ticks]
-                minor_ticks = []  # No minor ticks
-
-                self.debug_print(f"  tickValues returning {len(major_ticks)} positions")
-                return [(1.0, major_ticks), (0.0, minor_ticks)]
-
-            self._custom_tick_values = custom_tick_values
-            left_axis.tickValues = lambda minVal, maxVal, size: self._custom_tick_values(minVal, maxVal, size)
-
-            # Override tickStrings to show real values
-            tick_mapping = {pos: val for pos, val in visible_ticks}
-
-            # Determine decimal precision based on tick spacing
-            if tick_spacing_real >= 1:
-                precision = 0  # No decimal places for spacing >= 1
-            elif tick_spacing_real >= 0.1:
-                precision = 1  # One decimal place for spacing like 0.1, 0.2, 0.5
-            elif tick_spacing_real >= 0.01:
-                precision = 2  # Two decimal places for spacing like 0.01, 0.02, 0.05
-            else:
-                precision = 3  # Three decimal places for very small spacing
-
-            def custom_tick_strings(values, scale, spacing):
-                self.debug_print(f"  tickStrings called with {len(values)} positions: {values[:5]}")
-                strings = []
-                for v in values:
-                    # Find closest tick in our mapping
-                    closest = min(tick_mapping.keys(), key=lambda x: abs(x - v), default=None)
-                    if closest is not None and abs(closest - v) < 0.001:
-                        strings.append(f"{tick_mapping[closest]:.{precision}f}")
-                    else:
-                        # Shouldn't happen, but fallback
-                        real_val = axis_min + v * axis_range
-                        strings.append(f"{real_val:.{precision}f}")
-                return strings
-
-            self._custom_tick_strings = custom_tick_strings
-            left_axis.tickStrings = lambda values, scale, spacing: self._custom_tick_strings(values, scale, spacing)
-        else:
-            # Reset to default tick formatting
-            left_axis = self.graph_plot.getAxis('left')
-            # Remove custom tick value generator if it exists
-            if hasattr(self, '_custom_tick_values'):
-                left_axis.tickValues = left_axis.__class__.tickValues.__get__(left_axis, type(left_axis))
-                delattr(self, '_custom_tick_values')
-            # Remove custom tick string formatter if it exists
-            if hasattr(self, '_custom_tick_strings'):
-                # Reset tickStrings to the default method from the class
-                left_axis.tickStrings = left_axis.__class__.tickStrings.__get__(left_axis, type(left_axis))
-                delattr(self, '_custom_tick_strings')
-
-        # Set up custom tick formatter for RIGHT axis to show axis owner's real values with round numbers
-        if self.right_axis_owner and self.right_axis_owner in self.enabled_streams:
-            # Get stream configuration for display range constraints
-            right_stream_cfg = self.stream_config.get_stream(self.right_axis_owner)
-
-            # Special case: If right axis owner is smoothed RPM, use instantaneous RPM's range
-            if self.right_axis_owner == 'ecu_rpm_smoothed' and rpm_inst_range is not None:
-                axis_min, axis_max = rpm_inst_range
-                self.debug_print(f"Right axis (smoothed RPM) using instantaneous RPM range: {rpm_inst_range}")
-            else:
-                # Get visible data for right axis stream
-                full_min, full_max = self.stream_ranges.get(self.right_axis_owner, (0, 1))
-
-                # Check for fixed display range or constraints
-                if right_stream_cfg and right_stream_cfg.display_range_min is not None and right_stream_cfg.display_range_max is not None:
-                    # Fixed range - no dynamic scaling
-                    axis_min = right_stream_cfg.display_range_min
-                    axis_max = right_stream_cfg.display_range_max
-                else:
-                    # Dynamic scaling with optional constraints
-                    if self.right_axis_owner in self.raw_data:
-                        stream_data = self.raw_data[self.right_axis_owner]
-                        all_time = stream_data['time']
-                        all_values = stream_data['values']
-                        mask = (all_time >= self.view_start) & (all_time <= self.view_end)
-                        visible_values = all_values[mask]
-
-                        if len(visible_values) > 0:
-                            visible_max = float(np.nanmax(visible_values))
-                            axis_min = full_min
-
-                            # Check for minimum top constraint
-                            if right_stream_cfg and right_stream_cfg.display_range_min_top is not None:
-                                min_top = right_stream_cfg.display_range_min_top
-                                if visible_max < min_top:
-                                    visible_max = min_top
-
-                            axis_max = visible_max
-                        else:
-                            axis_min = full_min
-                            axis_max = full_max
-                    else:
-                        axis_min = full_min
-                        axis_max = full_max
-
-            axis_range = axis_max - axis_min
-            if not np.isfinite(axis_range) or axis_range <= 0:
-                axis_min, axis_max, axis_range = 0.0, 1.0, 1.0
-
-            # Calculate nice round tick spacing
-            import math
-            def get_nice_tick_spacing(data_range):
-                """Calculate a nice round number for tick spacing"""
-                if not data_range or not math.isfinite(data_range) or data_range <= 0:
-                    return 1
-                # Get order of magnitude
-                exponent = math.floor(math.log10(data_range))
-                magnitude = 10 ** exponent
-                # Normalize to 1-10 range
-                normalized = data_range / magnitude
-                # Choose nice spacing: 0.1, 0.2, 0.5, 1, 2, 5, 10, etc.
-                if normalized <= 1.0:
-                    nice_spacing = 0.1 * magnitude
-                elif normalized <= 2.0:
-                    nice_spacing = 0.2 * magnitude
-                elif normalized <= 5.0:
-                    nice_spacing = 0.5 * magnitude
-                elif normalized <= 10.0:
-                    nice_spacing = 1.0 * magnitude
-                else:
-                    nice_spacing = 2.0 * magnitude
-                return nice_spacing
-
-            tick_spacing_real = get_nice_tick_spacing(axis_range)  # Calculate spacing based on full range
-
-            # Apply minimum spacing constraints for specific stream types
-            # Check if this is a temperature stream (contains "temp" in name)
-            if 'temp' in self.right_axis_owner.lower():
-                right_display_units = self.stream_metadata.get(self.right_axis_owner, {}).get('display_units', 'celsius')
-                min_temp_spacing = UnitConverter.convert(
-                    MIN_TEMPERATURE_TICK_SPACING_C, 'temperature', 'celsius', right_display_units
-                ) - UnitConverter.convert(0.0, 'temperature', 'celsius', right_display_units)
-                if tick_spacing_real < min_temp_spacing:
-                    tick_spacing_real = min_temp_spacing
-                    self.debug_print(f"  Applied min temp tick spacing: {min_temp_spacing:.1f} {right_display_units}")
-
-            # Round axis_min DOWN to nearest tick spacing multiple
-            # This ensures ticks start at nice round numbers (0, 500, 1000, etc)
-            axis_min_rounded = math.floor(axis_min / tick_spacing_real) * tick_spacing_real
-
-            # Round axis_max UP to nearest tick spacing multiple
-            axis_max_rounded = math.ceil(axis_max / tick_spacing_real) * tick_spacing_real
-
-            # Generate nice round tick values in real units
-            real_ticks = []
-            tick_value = axis_min_rounded
-            while tick_value <= axis_max_rounded:
-                real_ticks.append(tick_value)
-                tick_value += tick_spacing_real
-
-            # DEBUG
-            self.debug_print(f"Right Axis Stream: {self.right_axis_owner}")
-            self.debug_print(f"  Data range: {axis_min:.1f} to {axis_max:.1f}")
-            self.debug_print(f"  Rounded range: {axis_min_rounded:.1f} to {axis_max_rounded:.1f}")
-            self.debug_print(f"  Tick spacing: {tick_spacing_real:.1f}")
-            self.debug_print(f"  Real ticks: {real_ticks}")
-
-            # Convert tick positions to DATA's normalized space
-            # Data is normalized to [bar_offset, bar_offset + normalize_max] range
-            # So ticks must be placed in the same range to align with the data
-            normalize_max = getattr(self, 'dynamic_normalize_max',
-                                   self.stream_config.get_setting('data_normalize_max', 0.85))
-            bar_offset = getattr(self, 'bar_space_offset', 0.0)
-
-            # Normalize ticks: first to 0-1, then scale to normalize_max and add bar_offset
-            data_normalized_ticks = [((t - axis_min) / axis_range) * normalize_max + bar_offset for t in real_ticks]
-            self.debug_print(f"  Normalized tick positions (with normalize_max={normalize_max}, bar_offset={bar_offset}): {data_normalized_ticks}")
-
-            right_axis = self.graph_plot.getAxis('right')
-
-            # Filter ticks to only those within the visible area (bar_offset to bar_offset + normalize_max)
-            visible_ticks_right = [(norm_pos, real_val) for norm_pos, real_val in zip(data_normalized_ticks, real_ticks)
-                           if bar_offset <= norm_pos <= bar_offset + normalize_max]
-
-            self.debug_print(f"  Visible ticks: {visible_ticks_right}")
-
-            # Override tickValues to specify exact tick positions
-            def custom_tick_values_right(minVal, maxVal, size):
-                # Return list of [(spacing, [tick_positions])] for major and minor ticks
-                # We return our pre-calculated positions
-                major_ticks = [pos for pos, _ in visible_ticks_right]
-                minor_ticks = []  # No minor ticks
-
-                self.debug_print(f"  Right tickValues returning {len(major_ticks)} positions")
-                return [(1.0, major_ticks), (0.0, minor_ticks)]
-
-            self._custom_right_tick_values = custom_tick_values_right
-            right_axis.tickValues = lambda minVal, maxVal, size: self._custom_right_tick_values(minVal, maxVal, size)
-
-            # Override tickStrings to show real values
-            tick_mapping_right = {pos: val for pos, val in visible_ticks_right}
+                    self.raw_data,
+                    self.view_start,
+                    self.view_end,
+                    None
+                )
 
-            # Determine decimal precision based on tick spacing
-            if tick_spacing_real >= 1:
-                precision_right = 0  # No decimal places for spacing >= 1
-            elif tick_spacing_real >= 0.1:
-                precision_right = 1  # One decimal place for spacing like 0.1, 0.2, 0.5
-            elif tick_spacing_real >= 0.01:
-                precision_right = 2  # Two decimal places for spacing like 0.01, 0.02, 0.05
-            else:
-                precision_right = 3  # Three decimal places for very small spacing
-
-            def custom_tick_strings_right(values, scale, spacing):
-                self.debug_print(f"  Right tickStrings called with {len(values)} positions: {values[:5]}")
-                strings = []
-                for v in values:
-                    # Find closest tick in our mapping
-                    closest = min(tick_mapping_right.keys(), key=lambda x: abs(x - v), default=None)
-                    if closest is not None and abs(closest - v) < 0.001:
-                        strings.append(f"{tick_mapping_right[closest]:.{precision_right}f}")
-                    else:
-                        # Shouldn't happen, but fallback
-                        real_val = axis_min + v * axis_range
-                        strings.append(f"{real_val:.{precision_right}f}")
-                return strings
+            # Normalize the data using DataNormalizer (Phase 4 refactoring)
+            normalized_data = self.normalizer.normalize_data(
+                plot_values,
+                stream_min,
+                stream_max,
+                normalize_max,
+                bar_offset,
+                out=self.normalizer.output_buffer(stream, len(plot_values))
+            )
 
-            self._custom_right_tick_strings = custom_tick_strings_right
-            right_axis.tickStrings = lambda values, scale, spacing: self._custom_right_tick_strings(values, scale, spacing)
-        else:
-            # Reset to default tick formatting
-            right_axis = self.graph_plot.getAxis('right')
-            # Remove custom tick value generator if it exists
-            if hasattr(self, '_custom_right_tick_values'):
-                right_axis.tickValues = right_axis.__class__.tickValues.__get__(right_axis, type(right_axis))
-                delattr(self, '_custom_right_tick_values')
-            # Remove custom tick string formatter if it exists
-            if hasattr(self, '_custom_right_tick_strings'):
-                # Reset tickStrings to the default method from the class
-                right_axis.tickStrings = right_axis.__class__.tickStrings.__get__(right_axis, type(right_axis))
-                delattr(self, '_custom_right_tick_strings')
+            # Get display mode for this stream
+            stream_widget = self.stream_list_widget.stream_widget_by_name.get(stream)
+            display_mode = stream_widget.display_mode if stream_widget else "line"
+
+            curve = self._get_stream_curve(stream, display_mode, color)
+            curve.setData(plot_time, normalized_data, connect='finite')
+            curve.setVisible(True)
+            drawn_curves.add(stream)
+
+        # Hide curves for streams that were disabled (kept around for when they come back)
+        self._hide_curves_except(drawn_curves)
+
+        # Axis labels, ranges and tick formatters only depend on the inputs below;
+        # skip reconfiguring them when only the plotted data changed
+        axis_sig = (self.axis_owner, self.axis_owner in self.enabled_streams,
+                    self.right_axis_owner, self.right_axis_owner in self.enabled_streams,
+                    self.stream_colors.get(self.axis_owner), self.stream_colors.get(self.right_axis_owner),
+                    self.stream_metadata.get(self.axis_owner, {}).get('display_units'),
+                    self.stream_metadata.get(self.right_axis_owner, {}).get('display_units'),
+                    self.view_start, self.view_end, self.axis_font_size, self.dark_theme,
+                    bar_offset, normalize_max, axis_owner_visible_range, rpm_inst_range)
+        if axis_sig != self._last_axis_sig:
+            self._configure_axes(axis_owner_visible_range, rpm_inst_range)
+            self._last_axis_sig = axis_sig
+            self._last_theme = None  # Reconfiguring resets non-owner axis pens to the light theme
 
         # Update GPS position markers (triangles above time axis)
         if 'gps_position' in self.raw_data:
@@ -2598,22 +3227,23 @@ class DataVisualizationTool(QMainWindow):
             all_time = gps_data['time']
 
             # Filter to visible time window
-            mask = (all_time >= self.view_start) & (all_time <= self.view_end)
-            visible_indices = np.where(mask)[0]
-            visible_time = all_time[mask]
+            lo, hi = self._view_bounds(all_time)
+            visible_indices = np.arange(lo, hi)
+            visible_time = all_time[lo:hi]
 
             if len(visible_time) > 0:
                 # Position markers just below y=0 (at -0.05 in normalized space)
-                # This puts them just above the time axis
-                y_positions = np.full(len(visible_time), -0.05)
+                # This puts them just above the time axis. Every entry is the same, so
+                # the buffer is only ever replaced when it needs to grow
+                n = len(visible_time)
+                if n > len(self._gps_y_buf):
+                    self._gps_y_buf = np.full(n * 2, -0.05)
+                y_positions = self._gps_y_buf[:n]
 
                 # Store the original indices in the data field (1D array of integers)
-                # We'll use these to look up lat/lon when clicked
-                # Clear existing points first
-                self.gps_markers.clear()
-
-                # Add points with clickable flag
-                self.gps_markers.addPoints(
+                # We'll use these to look up lat/lon when clicked.
+                # setData replaces all points in one update
+                self.gps_markers.setData(
                     x=visible_time,
                     y=y_positions,
                     data=visible_indices  # Store indices for click events
@@ -2625,18 +3255,31 @@ class DataVisualizationTool(QMainWindow):
             # No GPS data loaded, clear markers
             self.gps_markers.setData(x=[], y=[])
 
-        # Apply theme
+        # Apply theme (pens, background, grid) only when it could have changed
+        theme_key = (self.dark_theme,
+                     bool(self.axis_owner and self.axis_owner in self.enabled_streams),
+                     bool(self.right_axis_owner and self.right_axis_owner in self.enabled_streams))
+        if theme_key != self._last_theme:
+            self._apply_graph_theme()
+            self._last_theme = theme_key
+
+        # Draw event markers (spark, crankref, camshaft) and bars (injectors, coils)
+        self.draw_spark_events()  # Now draws all graph markers from config
+        self.draw_injector_bars()  # Draws all bar data from config
+
+    def _apply_graph_theme(self):
+        """Apply the light/dark theme to the main graph background, grid and non-owner axes."""
         if self.dark_theme:
             self.graph_plot.setBackground('#2b2b2b')
             self.graph_plot.getAxis('bottom').setPen('w')
             self.graph_plot.getAxis('bottom').setTextPen('w')
             # Only apply theme to left axis if there's no left axis owner
-            # (if there is an owner, the owner's color was already set above)
+            # (if there is an owner, _configure_value_axis already set the owner's color)
             if not (self.axis_owner and self.axis_owner in self.enabled_streams):
                 self.graph_plot.getAxis('left').setPen('w')
                 self.graph_plot.getAxis('left').setTextPen('w')
             # Only apply theme to right axis if there's no right axis owner
-            # (if there is an owner, the owner's color was already set above)
+            # (if there is an owner, _configure_value_axis already set the owner's color)
             if not (self.right_axis_owner and self.right_axis_owner in self.enabled_streams):
                 self.graph_plot.getAxis('right').setPen('w')
                 self.graph_plot.getAxis('right').setTextPen('w')
@@ -2649,12 +3292,12 @@ class DataVisualizationTool(QMainWindow):
             self.graph_plot.getAxis('bottom').setPen('k')
             self.graph_plot.getAxis('bottom').setTextPen('k')
             # Only apply theme to left axis if there's no left axis owner
-            # (if there is an owner, the owner's color was already set above)
+            # (if there is an owner, _configure_value_axis already set the owner's color)
             if not (self.axis_owner and self.axis_owner in self.enabled_streams):
                 self.graph_plot.getAxis('left').setPen('k')
                 self.graph_plot.getAxis('left').setTextPen('k')
             # Only apply theme to right axis if there's no right axis owner
-            # (if there is an owner, the owner's color was already set above)
+            # (if there is an owner, _configure_value_axis already set the owner's color)
             if not (self.right_axis_owner and self.right_axis_owner in self.enabled_streams):
                 self.graph_plot.getAxis('right').setPen('k')
                 self.graph_plot.getAxis('right').setTextPen('k')
@@ -2663,10 +3306,6 @@ class DataVisualizationTool(QMainWindow):
             # Disable grid for right axis to prevent duplicate horizontal lines
             self.graph_plot.getAxis('right').setGrid(False)
 
-        # Draw event markers (spark, crankref, camshaft) and bars (injectors, coils)
-        self.draw_spark_events()  # Now draws all graph markers from config
-        self.draw_injector_bars()  # Draws all bar data from config
-
     def draw_spark_events(self):
         """Draw all graph marker events (spark, crankref, camshaft) from config"""
         # Get all graph marker streams from config
@@ -2691,17 +3330,20 @@ class DataVisualizationTool(QMainWindow):
         # Check if we have the attach_to stream (usually RPM)
         attach_to = config.attach_to
         if not attach_to or attach_to not in self.raw_data:
-            self.debug_print(f"DEBUG: {stream_name} - attach_to stream '{attach_to}' not found in raw_data")
+            if self.debug:
+                self.debug_print(f"DEBUG: {stream_name} - attach_to stream '{attach_to}' not found in raw_data")
             return
 
         # Don't draw markers if the attach_to stream is not enabled
         # (e.g., don't draw spark/crank/cam markers if RPM instantaneous is disabled)
         if attach_to not in self.enabled_streams:
-            self.debug_print(f"DEBUG: {stream_name} - attach_to stream '{attach_to}' not enabled, skipping markers")
+            if self.debug:
+                self.debug_print(f"DEBUG: {stream_name} - attach_to stream '{attach_to}' not enabled, skipping markers")
             return
 
         if stream_name not in self.raw_data:
-            self.debug_print(f"DEBUG: {stream_name} - marker stream not found in raw_data")
+            if self.debug:
+                self.debug_print(f"DEBUG: {stream_name} - marker stream not found in raw_data")
             return
 
         # Get the base stream data (e.g., RPM)
@@ -2709,31 +3351,14 @@ class DataVisualizationTool(QMainWindow):
         base_time = base_data['time']
         base_values = base_data['values']
 
-        # Get normalization range: full dataset min, visible max
-        full_base_min, full_base_max = self.stream_ranges.get(attach_to, (0, 1))
-
-        # Calculate visible max for the base stream
-        visible_base_mask = (base_time >= self.view_start) & (base_time <= self.view_end)
-        visible_base_values = base_values[visible_base_mask]
-        if len(visible_base_values) > 0:
-            visible_base_max = float(np.nanmax(visible_base_values))
-            base_min = full_base_min
-            base_max = visible_base_max
-        else:
-            base_min = full_base_min
-            base_max = full_base_max
-
-        # Avoid division by zero
-        if base_max - base_min < 1e-10:
-            base_max = base_min + 1.0
-
         # Get marker event data
         marker_data = self.raw_data[stream_name]
         marker_times = marker_data['time']
         marker_values = marker_data.get('values', None)  # May have values (e.g., CRID) or not (e.g., spark)
 
-        # DEBUG: Print marker time range
-        if len(marker_times) > 0:
+        # DEBUG: Print marker time range (the 18-21s scan below touches every marker,
+        # so the whole block is skipped unless debugging)
+        if self.debug and len(marker_times) > 0:
             self.debug_print(f"DEBUG: {stream_name} - total markers: {len(marker_times)}, time range: {marker_times[0]:.2f} - {marker_times[-1]:.2f}")
             self.debug_print(f"DEBUG: {stream_name} - attach_to '{attach_to}' time range: {base_time[0]:.2f} - {base_time[-1]:.2f}")
             self.debug_print(f"DEBUG: {stream_name} - current view window: {self.view_start:.2f} - {self.view_end:.2f}")
@@ -2756,156 +3381,178 @@ class DataVisualizationTool(QMainWindow):
         label_format = config.label_format
         max_visible = config.max_visible or self.stream_config.get_setting('performance.max_event_markers_visible', MAX_VISIBLE_EVENT_MARKERS)
 
-        # Filter to visible time window
-        mask = (marker_times >= self.view_start) & (marker_times <= self.view_end)
-        visible_marker_times = marker_times[mask]
+        # Count the markers in the visible time window before doing any other work
+        lo, hi = self._view_bounds(marker_times)
+        visible_count = hi - lo
+
+        if self.debug:
+            self.debug_print(f"DEBUG: {stream_name} - visible markers in window: {visible_count}")
+
+        # Skip drawing if too many markers
+        if visible_count > max_visible:
+            if self.debug:
+                self.debug_print(f"DEBUG: Skipping {stream_name} markers - {visible_count} exceeds limit of {max_visible}")
+            return
+        if visible_count == 0:
+            return
+
+        visible_marker_times = marker_times[lo:hi]
         if marker_values is not None:
-            visible_marker_values = marker_values[mask]
+            visible_marker_values = marker_values[lo:hi]
         else:
             visible_marker_values = None
 
-        self.debug_print(f"DEBUG: {stream_name} - visible markers in window: {len(visible_marker_times)}")
+        # Get normalization range: full dataset min, visible max
+        full_base_min, full_base_max = self.stream_ranges.get(attach_to, (0, 1))
 
-        # Skip drawing if too many markers
-        if len(visible_marker_times) > max_visible:
-            self.debug_print(f"DEBUG: Skipping {stream_name} markers - {len(visible_marker_times)} exceeds limit of {max_visible}")
-            return
+        # Calculate visible max for the base stream
+        visible_base_max = self._get_visible_max(attach_to, self.view_start, self.view_end)
+        if visible_base_max is not None:
+            base_min = full_base_min
+            base_max = visible_base_max
+        else:
+            base_min = full_base_min
+            base_max = full_base_max
+
+        # Avoid division by zero
+        if base_max - base_min < 1e-10:
+            base_max = base_min + 1.0
 
         # Get normalization factor - use dynamic max if bars are enabled
-        normalize_max = getattr(self, 'dynamic_normalize_max',
-                               self.stream_config.get_setting('data_normalize_max', 0.85))
+        normalize_max = self.dynamic_normalize_max
 
         # Get bar offset if bars are enabled
-        bar_offset = getattr(self, 'bar_space_offset', 0.0)
-
-        # Draw each marker
-        for i, marker_time in enumerate(visible_marker_times):
-            # Interpolate base value at marker time, or use midpoint if outside attach_to range
-            if marker_time < base_time[0] or marker_time > base_time[-1]:
-                # Marker occurs before/after attach_to stream data
-                # Use midpoint of graph height for positioning
-                normalized_base = normalize_max / 2.0
-                if bar_offset > 0:
-                    normalized_base = normalized_base + bar_offset
-            else:
-                base_at_marker = np.interp(marker_time, base_time, base_values)
-                if np.isnan(base_at_marker):
-                    # Interpolated into a NaN region (e.g. near a CMX break) — float freely
-                    normalized_base = normalize_max / 2.0
-                else:
-                    normalized_base = ((base_at_marker - base_min) / (base_max - base_min)) * normalize_max
-
-                # Shift up by bar offset if bars are enabled
-                if bar_offset > 0:
-                    normalized_base = normalized_base + bar_offset
-
-            # Calculate label position
-            if line_height != 0:
-                # Vertical line with specified height (upward or downward)
-                # line_height determines the line length, offset is ignored
-                if line_height > 0:
-                    # Upward line
-                    label_y = normalized_base + line_height
-                    line_start_y = normalized_base
-                    line_end_y = label_y
-                    text_anchor = (0.5, 1.0)  # Bottom center
-                else:
-                    # Downward line (negative line_height)
-                    label_y = normalized_base + line_height
-                    line_start_y = normalized_base
-                    line_end_y = label_y
-                    text_anchor = (0.5, 0.0)  # Top center
-                draw_line = True
-            elif offset != 0:
-                # Offset-based positioning (spark events style)
-                # Draw line from base to label position
-                label_y = normalized_base + offset
-                line_start_y = normalized_base
-                line_end_y = label_y
-                text_anchor = (0.5, 0.5)  # Center
-                draw_line = True
-            else:
-                # No line, label at base position
-                label_y = normalized_base
-                line_start_y = normalized_base
-                line_end_y = label_y
-                text_anchor = (0.5, 0.5)  # Center
-                draw_line = False
-
-            # Draw line if needed
-            if draw_line:
-                line_item = pg.PlotDataItem(
-                    [marker_time, marker_time],
-                    [line_start_y, line_end_y],
-                    pen=pg.mkPen(color=color, width=2.0, style=Qt.PenStyle.SolidLine)
-                )
-                self.graph_plot.addItem(line_item)
-
-            # Format label text
-            if label_format and visible_marker_values is not None:
-                # Use format string with value
-                label_text = label_format.format(value=int(visible_marker_values[i]))
-            elif label:
-                # Use fixed label
-                label_text = label
-            else:
-                # No label
+        bar_offset = self.bar_space_offset
+
+        # Interpolate the base value at every visible marker in one call
+        base_at_markers = np.interp(visible_marker_times, base_time, base_values)
+        base_scale = normalize_max / (base_max - base_min)
+        normalized_bases = (base_at_markers - base_min) * base_scale
+        # Markers before/after the attach_to stream data, or interpolated into a NaN
+        # region (e.g. near a CMX break), float freely at the midpoint of graph height
+        outside_base = (visible_marker_times < base_time[0]) | (visible_marker_times > base_time[-1])
+        normalized_bases[outside_base | np.isnan(base_at_markers)] = normalize_max / 2.0
+
+        # Shift up by bar offset if bars are enabled
+        if bar_offset > 0:
+            normalized_bases += bar_offset
+
+        advance_at_markers = self._spark_advance_at(stream_name, visible_marker_times)
+
+        # Label placement only depends on the stream config, so work it out once
+        if line_height != 0:
+            # Vertical line with specified height (upward or downward)
+            # line_height determines the line length, offset is ignored
+            label_dy = line_height
+            # Upward line: bottom center; downward line (negative line_height): top center
+            text_anchor = (0.5, 1.0) if line_height > 0 else (0.5, 0.0)
+            draw_line = True
+        elif offset != 0:
+            # Offset-based positioning (spark events style)
+            # Draw line from base to label position
+            label_dy = offset
+            text_anchor = (0.5, 0.5)  # Center
+            draw_line = True
+        else:
+            # No line, label at base position
+            label_dy = 0.0
+            text_anchor = (0.5, 0.5)  # Center
+            draw_line = False
+
+        # Position advance text above/below the marker label
+        # S1 (ecu_spark_x1) has positive offset - put advance above the label
+        # S2 (ecu_spark_x2) has negative offset - put advance below the label
+        if offset > 0:
+            # S1: advance goes above the label
+            # Use bottom anchor so text extends upward from this point
+            advance_dy = 0.005  # Small gap above label
+            advance_anchor = (0.5, 1.0)  # Bottom center (text extends up from this point)
+        else:
+            # S2: advance goes below the label
+            # Use top anchor so text extends downward from this point
+            advance_dy = -0.005  # Small gap below label
+            advance_anchor = (0.5, 0.0)  # Top center (text extends down from this point)
+
+        use_label_format = bool(label_format) and visible_marker_values is not None
+        if not use_label_format and not label and not draw_line:
+            return  # Nothing to draw for any marker
+
+        marker_times_list = visible_marker_times.tolist()
+        label_y = normalized_bases + label_dy
+
+        # All of a stream's lines go in one curve: connect='pairs' draws each
+        # (base, label) point pair as a separate segment
+        if draw_line:
+            self._add_transient_item(pg.PlotCurveItem(
+                np.repeat(visible_marker_times, 2),
+                np.column_stack([normalized_bases, label_y]).ravel(),
+                pen=_cached_pen(color, 2.0, Qt.PenStyle.SolidLine),
+                connect='pairs'
+            ))
+
+        # Format label text: use format string with value (S1, S2 or formatted value), or fixed label
+        if use_label_format:
+            label_texts = [label_format.format(value=int(v)) for v in visible_marker_values.tolist()]
+        elif label:
+            label_texts = [label] * len(marker_times_list)
+        else:
+            return  # No labels
+
+        label_y_list = label_y.tolist()
+        self._add_transient_item(MarkerLabelBatchItem(marker_times_list, label_y_list, label_texts,
+                                                      color, text_anchor))
+
+        # Spark advance recorded at each marker, if any (NaN where there is none)
+        if advance_at_markers is not None:
+            has_advance = ~np.isnan(advance_at_markers)
+            if has_advance.any():
+                self._add_transient_item(MarkerLabelBatchItem(
+                    visible_marker_times[has_advance].tolist(),
+                    (label_y[has_advance] + advance_dy).tolist(),
+                    [f"{a:.1f}°" for a in advance_at_markers[has_advance].tolist()],
+                    color, advance_anchor
+                ))
+
+    def _spark_advance_at(self, stream_name, marker_times):
+        """
+        Look up the spark advance recorded with each spark marker.
+
+        Args:
+            stream_name: Name of the marker stream
+            marker_times: Sorted array of visible marker times
+
+        Returns:
+            Array of advance values aligned with marker_times (NaN where there is no
+            match within 1ms), or None if stream_name isn't a spark stream
+        """
+        # New format: ecu_spark_front_x1_advance, ecu_spark_rear_x1_advance, etc.
+        if stream_name == 'ecu_spark_x1':
+            suffix = 'x1'
+        elif stream_name == 'ecu_spark_x2':
+            suffix = 'x2'
+        else:
+            return None
+
+        advance = np.full(len(marker_times), np.nan)
+        unmatched = np.ones(len(marker_times), dtype=bool)
+        time_tolerance = 0.001  # 1ms tolerance for floating point comparison
+
+        # Try both front and rear advance streams; the front value wins if both match
+        for cyl in ('front', 'rear'):
+            advance_data = self.raw_data.get(f'ecu_spark_{cyl}_{suffix}_advance')
+            if advance_data is None or len(advance_data['time']) == 0:
                 continue
+            advance_times = advance_data['time']
 
-            # Draw the marker label (S1, S2, or formatted value)
-            text_item = pg.TextItem(text=label_text, color=color, anchor=text_anchor)
-            text_item.setPos(marker_time, label_y)
-            self.graph_plot.addItem(text_item)
-
-            # Check if this is a spark stream with corresponding advance data
-            # New format: ecu_spark_front_x1_advance, ecu_spark_rear_x1_advance, etc.
-            # Try both front and rear advance streams
-            advance_deg = None
-            for cyl in ['front', 'rear']:
-                if stream_name == 'ecu_spark_x1':
-                    advance_stream_name = f'ecu_spark_{cyl}_x1_advance'
-                elif stream_name == 'ecu_spark_x2':
-                    advance_stream_name = f'ecu_spark_{cyl}_x2_advance'
-                else:
-                    continue
-
-                if advance_stream_name in self.raw_data:
-                    # Get spark advance data
-                    advance_data = self.raw_data[advance_stream_name]
-                    advance_times = advance_data['time']
-                    advance_values = advance_data['values']
-
-                    # Find advance value at this marker time (should be exact match)
-                    # Use a small tolerance for floating point comparison
-                    time_tolerance = 0.001  # 1ms tolerance
-                    time_matches = np.abs(advance_times - marker_time) < time_tolerance
-
-                    if np.any(time_matches):
-                        # Found matching advance value
-                        advance_deg = advance_values[time_matches][0]
-                        break  # Found it, no need to check other cylinder
-
-            if advance_deg is not None:
-                advance_text = f"{advance_deg:.1f}°"
-
-                # Position advance text above/below the marker label
-                # S1 (ecu_spark_x1) has positive offset - put advance above the label
-                # S2 (ecu_spark_x2) has negative offset - put advance below the label
-                if offset > 0:
-                    # S1: advance goes above the label
-                    # Use bottom anchor so text extends upward from this point
-                    advance_y = label_y + 0.005  # Small gap above label
-                    advance_anchor = (0.5, 1.0)  # Bottom center (text extends up from this point)
-                else:
-                    # S2: advance goes below the label
-                    # Use top anchor so text extends downward from this point
-                    advance_y = label_y - 0.005  # Small gap below label
-                    advance_anchor = (0.5, 0.0)  # Top center (text extends down from this point)
+            # First advance sample after (marker - tolerance), matched if it's also
+            # before (marker + tolerance)
+            idx = np.searchsorted(advance_times, marker_times - time_tolerance, side='right')
+            idx_clipped = np.minimum(idx, len(advance_times) - 1)
+            matched = unmatched & (idx < len(advance_times)) & (advance_times[idx_clipped] < marker_times + time_tolerance)
+            advance[matched] = advance_data['values'][idx_clipped[matched]]
+            unmatched &= ~matched
 
-                # Draw advance value
-                advance_item = pg.TextItem(text=advance_text, color=color, anchor=advance_anchor)
-                advance_item.setPos(marker_time, advance_y)
-                self.graph_plot.addItem(advance_item)
+        return advance
 
     def draw_injector_bars(self):
         """Draw all bar streams (injectors, coils) on the graph."""
@@ -2957,71 +3604,63 @@ class DataVisualizationTool(QMainWindow):
         bar_height = config.height
         bar_alpha = config.alpha
 
-        # Convert duration based on units (needed for visibility filtering)
+        # Durations in seconds, end times and validity are fixed after load; the
+        # loader precomputes them, other streams are converted once on first draw
         duration_units = config.duration_units or "ticks"  # Default to ticks for backward compat
-
-        # Convert all durations to seconds for end-time calculation
-        if duration_units == "ticks":
-            # Timer ticks: 2 microseconds per tick
-            duration_seconds = duration_values * TIMER_TICK_DURATION_S
-            # Validate reasonable duration (0 to 50ms)
-            valid_mask = (duration_values > 0) & (duration_values <= MAX_REASONABLE_DURATION_TICKS)
-        elif duration_units == "nanoseconds":
-            # Nanoseconds: convert directly
-            duration_seconds = duration_values / 1e9
-            # Validate reasonable duration (0 to 100ms)
-            valid_mask = (duration_values > 0) & (duration_values <= 100_000_000)
-        else:
+        geometry = stream_data.get('bar_geometry')
+        if geometry is None or geometry[0] != duration_units or geometry[1] is not duration_values:
+            geometry = _bar_geometry(bar_times, duration_values, duration_units)
+            stream_data['bar_geometry'] = geometry
+        _, _, duration_seconds, end_times, valid_mask, max_duration = geometry
+        if duration_seconds is None:
             # Unknown units, skip all
             return
 
-        # Calculate end times for all bars
-        end_times = bar_times + duration_seconds
+        # Bar times are sorted, so only bars starting within max_duration before the
+        # view up to view_end can be visible; bracket them before masking
+        lo = int(np.searchsorted(bar_times, self.view_start - max_duration, side='left'))
+        hi = int(np.searchsorted(bar_times, self.view_end, side='right'))
 
         # Filter to visible window: include bars where ANY part is visible
-        # - Bar starts before view_end (bar_times <= view_end), AND
+        # - Bar starts before view_end (guaranteed by hi), AND
         # - Bar ends after view_start (end_times >= view_start), AND
         # - Duration is valid
-        mask = (bar_times <= self.view_end) & (end_times >= self.view_start) & valid_mask
-        visible_bar_times = bar_times[mask]
-        visible_durations = duration_seconds[mask]
+        # The mask is built in place in a reused scratch buffer (grown when a window needs more)
+        n = hi - lo
+        if n > len(self._bar_mask_buf):
+            self._bar_mask_buf = np.empty(n * 2, dtype=bool)
+        mask = self._bar_mask_buf[:n]
+        np.greater_equal(end_times[lo:hi], self.view_start, out=mask)
+        np.logical_and(mask, valid_mask[lo:hi], out=mask)
+        visible_bar_times = bar_times[lo:hi][mask]
+        visible_durations = duration_seconds[lo:hi][mask]
+        visible_end_times = end_times[lo:hi][mask]
 
         if len(visible_bar_times) == 0:
             return
 
-        # Performance limit
-        max_bars = self.stream_config.get_setting('performance.max_injector_bars_visible', MAX_INJECTOR_BARS_VISIBLE)
-        if len(visible_bar_times) > max_bars:
-            step = len(visible_bar_times) // max_bars
-            visible_bar_times = visible_bar_times[::step]
-            visible_durations = visible_durations[::step]
-
-        # Draw bars
-        rgba = parse_color_to_rgba(color, bar_alpha)
-
-        for i in range(len(visible_bar_times)):
-            start_time = visible_bar_times[i]
-            duration_seconds = visible_durations[i]
-            duration_us = duration_seconds * 1e6  # Convert to microseconds
-
-            # Add tooltip - use template from config if available
-            if config.tooltip:
-                # Use template from YAML config and format it
-                tooltip_text = config.tooltip.format(
-                    start_time=start_time,
-                    duration_us=duration_us
-                )
-            else:
-                # Fallback to default format (duration only)
-                tooltip_text = f"{config.display_name}\nDuration: {duration_us:.1f} μs"
+        # Bars less than a pixel apart are indistinguishable on screen; paint each such
+        # cluster as one span
+        span_starts, span_durations = visible_bar_times, visible_durations
+        view_pixels = self.graph_plot.getViewBox().width()
+        if view_pixels > 0 and len(span_starts) > 1:
+            seconds_per_pixel = (self.view_end - self.view_start) / view_pixels
+            span_starts, span_durations = merge_close_intervals(span_starts, visible_end_times, seconds_per_pixel)
 
-            # Create custom bar item with proper hover detection
-            rect = InjectorBarItem(
-                start_time, bar_y, duration_seconds, bar_height,
-                tooltip_text, color, bar_alpha
+        # Performance limit: merge spans that share one of max_bars time buckets across
+        # the view, so dense regions stay filled instead of thinning out
+        max_bars = self.stream_config.get_setting('performance.max_injector_bars_visible', MAX_INJECTOR_BARS_VISIBLE)
+        if len(span_starts) > max_bars:
+            span_starts, span_durations = bucket_intervals(
+                span_starts, span_starts + span_durations, self.view_start, self.view_end, max_bars
             )
 
-            self.graph_plot.addItem(rect)
+        # Draw all bars of the stream as one item; tooltips are formatted on hover
+        self._add_transient_item(InjectorBarBatchItem(
+            visible_bar_times, visible_durations, bar_y, bar_height,
+            color, bar_alpha, config.tooltip, config.display_name,
+            spans=(span_starts, span_durations)
+        ))
 
     def _calculate_bar_positions(self, enabled_bars):
         """
@@ -3034,17 +3673,15 @@ class DataVisualizationTool(QMainWindow):
             enabled_bars: List of (stream_name, config) tuples for enabled bars
 
         Returns:
-            Dictionary mapping stream_name -> y_position
+            Dictionary mapping stream_name -> y_position (shared with the cache; don't modify)
         """
-        positions = {}
-
-        # Calculate how much vertical space the bars need
-        bar_spacing = 0.01  # Small gap between bars
-        total_bar_space = sum(cfg.height + bar_spacing for _, cfg in enabled_bars)
-
         # Get the default data normalization max (how high graph data goes without bars)
         default_normalize_max = self.stream_config.get_setting('data_normalize_max', 0.85)
 
+        positions, total_bar_space = _stack_bar_positions(
+            tuple((name, cfg.height) for name, cfg in enabled_bars)
+        )
+
         # When bars are enabled, shift the graph data UP by adding total_bar_space as offset
         # Graph data will use: [total_bar_space] to [total_bar_space + default_normalize_max]
         # Bars will use: [0] to [total_bar_space]
@@ -3054,12 +3691,6 @@ class DataVisualizationTool(QMainWindow):
         # Keep normalize_max the same, but data will be shifted up
         self.dynamic_normalize_max = default_normalize_max
 
-        # Assign Y positions starting at bottom (Y=0)
-        current_y = 0.0
-        for stream_name, cfg in enabled_bars:
-            positions[stream_name] = current_y
-            current_y += cfg.height + bar_spacing
-
         return positions
 
     def update_navigation_plot(self):
@@ -3071,8 +3702,8 @@ class DataVisualizationTool(QMainWindow):
             return
 
         # Use actual time range from data (time_min to time_max)
-        time_min = getattr(self, 'time_min', 0)
-        time_max = getattr(self, 'time_max', self.total_time_span)
+        time_min = self.time_min
+        time_max = self.time_max
         self.nav_plot.setXRange(time_min, time_max, padding=0)
         # Set Y range to 0-1 since all streams are normalized
         self.nav_plot.setYRange(0, 1, padding=0)
@@ -3083,48 +3714,25 @@ class DataVisualizationTool(QMainWindow):
         self.view_region.blockSignals(False)
 
         # Plot enabled streams with heavy decimation for overview
-        max_nav_points = 1000
+        max_nav_points = NAV_MAX_POINTS
         for stream in self.enabled_streams:
             if stream not in self.raw_data:
                 continue
 
             # Skip event-only streams (markers, bars, etc.) - not plotted in navigation view
-            if self.stream_config.is_event_only_stream(stream):
+            if stream in self._event_only_streams:
                 continue
 
             # Skip duration/helper streams that shouldn't be plotted
-            if self.stream_config.should_skip_in_selection(stream):
+            if stream in self._skipped_streams:
                 continue
 
-            stream_data = self.raw_data[stream]
-            all_time = stream_data['time']
-            all_values = stream_data['values']
-
-            # Decimate for navigation view
-            if len(all_time) > max_nav_points:
-                nav_time, nav_values = min_max_decimate(all_time, all_values, max_nav_points)
-            else:
-                nav_time = all_time
-                nav_values = all_values
-
-            # Normalize to 0-1 range like main graph, using display constraints
-            # Use the entire time range for navigation (not just visible window)
-            if self.normalizer:
-                stream_min, stream_max = self.normalizer.calculate_stream_range(
-                    stream,
-                    self.raw_data,
-                    time_min,  # Use full data range for navigation
-                    time_max,
-                    axis_owner_range=None
-                )
-            else:
-                stream_min, stream_max = self.stream_ranges.get(stream, (0, 1))
-
-            normalized_values = (nav_values - stream_min) / (stream_max - stream_min)
+            nav_time, normalized_values = self._get_nav_curve(stream, max_nav_points)
 
             color = self.stream_colors[stream]
-            pen = pg.mkPen(color=color, width=1)
-            self.nav_plot.plot(nav_time, normalized_values, pen=pen)
+            pen = _cached_pen(color, 1)
+            # Plain curve: the overview never needs PlotDataItem's symbols or downsampling
+            self.nav_plot.addItem(pg.PlotCurveItem(nav_time, normalized_values, pen=pen))
 
         # Apply theme
         if self.dark_theme:
@@ -3136,13 +3744,65 @@ class DataVisualizationTool(QMainWindow):
             self.nav_plot.getAxis('bottom').setPen('k')
             self.nav_plot.getAxis('bottom').setTextPen('k')
 
+    def _get_nav_curve(self, stream_name, max_points):
+        """
+        Get a stream's decimated, normalized overview curve for the navigation plot.
+
+        The overview always spans the whole file, so the curve only changes when
+        the stream's values array is replaced (file load or unit change) and is
+        cached until then instead of being rebuilt on every navigation update.
+
+        Args:
+            stream_name: Stream in raw_data
+            max_points: Target number of points for the decimated curve
+
+        Returns:
+            Tuple of (nav_time, normalized_values) numpy arrays
+        """
+        stream_data = self.raw_data[stream_name]
+        all_time = stream_data['time']
+        all_values = stream_data['values']
+
+        cached = self._nav_curve_cache.get(stream_name)
+        if cached is not None and cached[0] is all_values:
+            return cached[1], cached[2]
+
+        # Decimate for navigation view
+        if len(all_time) > max_points:
+            nav_time, nav_values = min_max_decimate(all_time, all_values, max_points)
+        else:
+            nav_time = all_time
+            nav_values = all_values
+
+        # Normalize to 0-1 range like main graph, using display constraints
+        # Use the entire time range for navigation (not just visible window)
+        if self.normalizer:
+            stream_min, stream_max = self.normalizer.calculate_stream_range(
+                stream_name,
+                self.raw_data,
+                self.time_min,  # Use full data range for navigation
+                self.time_max,
+                axis_owner_range=None
+            )
+        else:
+            stream_min, stream_max = self.stream_ranges.get(stream_name, (0, 1))
+
+        normalized_values = nav_values - stream_min
+        normalized_values /= (stream_max - stream_min)
+
+        self._nav_curve_cache[stream_name] = (all_values, nav_time, normalized_values)
+        return nav_time, normalized_values
+
     def on_region_changed(self):
         """Handle navigation region changes (real-time)"""
         region = self.view_region.getRegion()
+        if region == self._last_region:
+            return
+        self._last_region = region
         new_start, new_end = region
 
         # Save the starting position on first change (for undo)
-        if not hasattr(self, '_region_drag_start'):
+        if self._region_drag_start is None:
             self._region_drag_start = (self.view_start, self.view_end)
 
         # Clamp
@@ -3171,16 +3831,23 @@ class DataVisualizationTool(QMainWindow):
         # Sync to view controller so keyboard shortcuts use current position
         self.view_controller.set_view_range(new_start, new_end)
 
-        self.request_update()
+        # Fast path: move the graph's X range right away so the already drawn items
+        # follow the drag; the full (30 FPS throttled) redraw fills in the new window
+        self.graph_plot.setXRange(new_start, new_end, padding=0)
+        self.request_update(navigation=False)
 
     def on_region_change_finished(self):
         """Handle navigation region change completion"""
+        # Draw the final position now instead of waiting for the throttle timer
+        if self.pending_update:
+            self.perform_pending_update()
+
         # Add the NEW position to history (after the drag)
         self.add_to_history(self.view_start, self.view_end, 0, 1)
 
         # Clean up drag tracking
-        if hasattr(self, '_region_drag_start'):
-            delattr(self, '_region_drag_start')
+        self._last_region = None
+        self._region_drag_start = None
 
     def on_nav_zoom(self, x_min, x_max, y_min, y_max):
         """Handle rubber band zoom in navigation plot - zoom to selected time range"""
@@ -3206,7 +3873,7 @@ class DataVisualizationTool(QMainWindow):
         self.view_region.blockSignals(False)
 
         # Update main graph
-        self.update_graph_plot()
+        self.schedule_graph_update()
 
     def handle_graph_zoom(self, x_min, x_max, y_min, y_max):
         """Handle rubber band zoom in graph - only X-axis zoom, Y is always 0-1"""
@@ -3224,7 +3891,7 @@ class DataVisualizationTool(QMainWindow):
         self.view_region.setRegion([self.view_start, self.view_end])
         self.view_region.blockSignals(False)
 
-        self.update_graph_plot()
+        self.schedule_graph_update()
 
 
     def zoom_in_2x(self):
@@ -3243,7 +3910,7 @@ class DataVisualizationTool(QMainWindow):
         self.view_region.setRegion([self.view_start, self.view_end])
         self.view_region.blockSignals(False)
 
-        self.update_graph_plot()
+        self.schedule_graph_update()
 
     def zoom_out_2x(self):
         """Zoom out by 2x (double the time shown), centered on current view"""
@@ -3261,7 +3928,7 @@ class DataVisualizationTool(QMainWindow):
         self.view_region.setRegion([self.view_start, self.view_end])
         self.view_region.blockSignals(False)
 
-        self.update_graph_plot()
+        self.schedule_graph_update()
 
     def pan_left_90(self):
         """Pan left by 90% of current view duration"""
@@ -3271,7 +3938,7 @@ class DataVisualizationTool(QMainWindow):
         self.view_region.blockSignals(True)
         self.view_region.setRegion([self.view_start, self.view_end])
         self.view_region.blockSignals(False)
-        self.update_graph_plot()
+        self.schedule_graph_update()
 
     def pan_right_90(self):
         """Pan right by 90% of current view duration"""
@@ -3281,7 +3948,7 @@ class DataVisualizationTool(QMainWindow):
         self.view_region.blockSignals(True)
         self.view_region.setRegion([self.view_start, self.view_end])
         self.view_region.blockSignals(False)
-        self.update_graph_plot()
+        self.schedule_graph_update()
 
     def pan_left_50(self):
         """Pan left by 50% of current view duration"""
@@ -3291,7 +3958,7 @@ class DataVisualizationTool(QMainWindow):
         self.view_region.blockSignals(True)
         self.view_region.setRegion([self.view_start, self.view_end])
         self.view_region.blockSignals(False)
-        self.update_graph_plot()
+        self.schedule_graph_update()
 
     def pan_right_50(self):
         """Pan right by 50% of current view duration"""
@@ -3301,7 +3968,7 @@ class DataVisualizationTool(QMainWindow):
         self.view_region.blockSignals(True)
         self.view_region.setRegion([self.view_start, self.view_end])
         self.view_region.blockSignals(False)
-        self.update_graph_plot()
+        self.schedule_graph_update()
 
     def pan_left_15(self):
         """Pan left by 15% of current view duration"""
@@ -3311,7 +3978,7 @@ class DataVisualizationTool(QMainWindow):
         self.view_region.blockSignals(True)
         self.view_region.setRegion([self.view_start, self.view_end])
         self.view_region.blockSignals(False)
-        self.update_graph_plot()
+        self.schedule_graph_update()
 
     def pan_right_15(self):
         """Pan right by 15% of current view duration"""
@@ -3321,7 +3988,7 @@ class DataVisualizationTool(QMainWindow):
         self.view_region.blockSignals(True)
         self.view_region.setRegion([self.view_start, self.view_end])
         self.view_region.blockSignals(False)
-        self.update_graph_plot()
+        self.schedule_graph_update()
 
     def add_to_history(self, start, end, y_min, y_max):
         """Add state to history - delegated to view_history"""
@@ -3344,7 +4011,7 @@ class DataVisualizationTool(QMainWindow):
             self.view_region.blockSignals(False)
 
             # Update main graph
-            self.update_graph_plot()
+            self.schedule_graph_update()
 
     def redo(self):
         """Redo previously undone zoom or pan operation"""
@@ -3363,7 +4030,7 @@ class DataVisualizationTool(QMainWindow):
             self.view_region.blockSignals(False)
 
             # Update main graph
-            self.update_graph_plot()
+            self.schedule_graph_update()
 
     def update_history_buttons(self):
         """Update undo/redo action states - now handled by view_history signal"""
@@ -3392,26 +4059,32 @@ class DataVisualizationTool(QMainWindow):
         # Save theme preference
         self.config.set("theme", "dark" if dark else "light")
 
-        # Apply window border
-        self.apply_window_border()
-
-        # Update panel backgrounds
-        if self.dark_theme:
-            # Dark theme backgrounds
-            self.stream_selection.setStyleSheet("QWidget { background-color: #3b3b3b; }")
-            self.nav_widget.setStyleSheet("QWidget { background-color: #3b3b3b; }")
-        else:
-            # Light theme backgrounds
-            self.stream_selection.setStyleSheet("QWidget { background-color: white; }")
-            self.nav_widget.setStyleSheet("QWidget { background-color: white; }")
+        # Restyle everything with painting suspended so the window repaints once at the end
+        # instead of after every stylesheet change and plot rebuild
+        self.setUpdatesEnabled(False)
+        try:
+            # Apply window border
+            self.apply_window_border()
+
+            # Update panel backgrounds
+            if self.dark_theme:
+                # Dark theme backgrounds
+                self.stream_selection.setStyleSheet("QWidget { background-color: #3b3b3b; }")
+                self.nav_widget.setStyleSheet("QWidget { background-color: #3b3b3b; }")
+            else:
+                # Light theme backgrounds
+                self.stream_selection.setStyleSheet("QWidget { background-color: white; }")
+                self.nav_widget.setStyleSheet("QWidget { background-color: white; }")
 
-        # Update all stream widgets with new theme
-        for widget in self.stream_list_widget.stream_widgets:
-            widget.set_theme(self.dark_theme)
+            # Update all stream widgets with new theme
+            for widget in self.stream_list_widget.stream_widgets:
+                widget.set_theme(self.dark_theme)
 
-        # Update all plots
-        self.update_graph_plot()
-        self.update_navigation_plot()
+            # Update all plots
+            self.update_graph_plot()
+            self.update_navigation_plot()
+        finally:
+            self.setUpdatesEnabled(True)  # Schedules a single repaint of the window
 
     def toggle_theme(self):
         """Toggle between light and dark themes (kept for backward compatibility)"""
@@ -3449,12 +4122,6 @@ class DataVisualizationTool(QMainWindow):
         """Handle GPS marker click events - show all GPS points on one map
 
         Note: Due to pyqtgraph design, this requires double-click"""
-        import subprocess
-        import shutil
-        import tempfile
-        import os
-        import json
-
         if 'gps_position' not in self.raw_data:
             self.debug_print("No GPS data available")
             return
@@ -3470,111 +4137,27 @@ class DataVisualizationTool(QMainWindow):
         self.debug_print(f"GPS marker clicked at time={clicked_time:.3f}s, lat={clicked_lat:.6f}, lon={clicked_lon:.6f}")
         self.debug_print(f"Generating map with all {len(gps_data['time'])} GPS positions...")
 
-        # Create a list of all GPS positions for the map
-        positions = []
-        for i in range(len(gps_data['time'])):
-            positions.append({
-                'lat': float(gps_data['lat'][i]),
-                'lon': float(gps_data['lon'][i]),
-                'time': float(gps_data['time'][i]),
-                'clicked': i == clicked_index
-            })
-
-        # Create HTML with Leaflet.js (open source map library)
-        temp_dir = tempfile.gettempdir()
-        html_file = os.path.join(temp_dir, 'umod4_gps_track.html')
-
-        html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>UMOD4 GPS Track</title>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css" />
-    <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
-    <style>
-        body {{ margin: 0; padding: 0; }}
-        #map {{ width: 100%; height: 100vh; }}
-        .info {{
-            padding: 6px 8px;
-            background: white;
-            box-shadow: 0 0 15px rgba(0,0,0,0.2);
-            border-radius: 5px;
-        }}
-        .info h4 {{ margin: 0 0 5px; color: #777; }}
-    </style>
-</head>
-<body>
-    <div id="map"></div>
-    <script>
-        // GPS positions data
-        const positions = {json.dumps(positions)};
-
-        // Find clicked position
-        const clickedPos = positions.find(p => p.clicked);
-
-        // Create map centered on clicked position
-        const map = L.map('map').setView([clickedPos.lat, clickedPos.lon], 15);
-
-        // Add CartoDB Voyager tiles (no Referer header required, unlike OSM direct tiles)
-        L.tileLayer('https://{{s}}.basemaps.cartocdn.com/rastertiles/voyager/{{z}}/{{x}}/{{y}}{{r}}.png', {{
-            attribution: '&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors &copy; <a href="https://carto.com/attributions">CARTO</a>',
-            subdomains: 'abcd',
-            maxZoom: 19
-        }}).addTo(map);
-
-        // Create polyline for the track
-        const trackPoints = positions.map(p => [p.lat, p.lon]);
-        L.polyline(trackPoints, {{
-            color: 'blue',
-            weight: 3,
-            opacity: 0.7
-        }}).addTo(map);
-
-        // Add markers for each position
-        positions.forEach((pos, idx) => {{
-            const marker = L.circleMarker([pos.lat, pos.lon], {{
-                radius: pos.clicked ? 8 : 4,
-                fillColor: pos.clicked ? '#ff0000' : '#0066ff',
-                color: pos.clicked ? '#cc0000' : '#0044cc',
-                weight: 2,
-                opacity: 1,
-                fillOpacity: pos.clicked ? 1 : 0.6
-            }}).addTo(map);
-
-            marker.bindPopup(
-                `<b>Point ${{idx + 1}}</b><br>` +
-                `Time: ${{pos.time.toFixed(3)}}s<br>` +
-                `Lat: ${{pos.lat.toFixed(6)}}<br>` +
-                `Lon: ${{pos.lon.toFixed(6)}}`
-            );
-
-            if (pos.clicked) {{
-                marker.openPopup();
-            }}
-        }});
+        # Serialize the track and write the map page in a worker thread; large tracks
+        # would otherwise stall the GUI. The page is opened once it has been written
+        worker = GpsMapWorker(gps_data['lat'], gps_data['lon'], gps_data['time'], clicked_index)
+        worker.finished.connect(self._open_gps_map)
+        worker.failed.connect(self._on_gps_map_failed)
+        self._start_worker(worker, (worker.finished, worker.failed))
 
-        // Add info box
-        const info = L.control({{position: 'topright'}});
-        info.onAdd = function(map) {{
-            this._div = L.DomUtil.create('div', 'info');
-            this._div.innerHTML =
-                '<h4>UMOD4 GPS Track</h4>' +
-                `<b>${{positions.length}}</b> GPS positions<br>` +
-                `Clicked: Time ${{clickedPos.time.toFixed(3)}}s`;
-            return this._div;
-        }};
-        info.addTo(map);
+    def _on_gps_map_failed(self, error):
+        """Report a GPS map page that could not be written."""
+        from PySide6.QtWidgets import QMessageBox
 
-        // Fit map to show all points
-        const bounds = L.latLngBounds(trackPoints);
-        map.fitBounds(bounds, {{padding: [50, 50]}});
-    </script>
-</body>
-</html>"""
+        self.debug_print(f"Error writing GPS track map: {error}")
+        QMessageBox.warning(
+            self,
+            "Could Not Create Map",
+            f"The GPS track map could not be written:\n\n{error}"
+        )
 
-        with open(html_file, 'w') as f:
-            f.write(html_content)
+    def _open_gps_map(self, html_file):
+        """Open a written GPS track map page in the browser."""
+        import shutil
 
         # Open the map in browser
         try:
@@ -3610,8 +4193,16 @@ class DataVisualizationTool(QMainWindow):
                 f"You can open it manually:\n{html_file}"
             )
 
-    def _save_per_file_settings(self):
-        """Save current visualizer state to .viz file."""
+    def _save_per_file_settings(self, wait=False):
+        """
+        Save current visualizer state to .viz file.
+
+        Args:
+            wait: Block until the file is written instead of writing it in the background
+
+        Returns:
+            True if the save was queued (or, with wait=True, written), False otherwise
+        """
         if not self.current_file:
             return False
 
@@ -3641,7 +4232,7 @@ class DataVisualizationTool(QMainWindow):
 
         # Capture and save
         settings = self.per_file_settings_manager.capture_current_state(app_state)
-        success = self.per_file_settings_manager.save(self.current_file, settings)
+        success = self.per_file_settings_manager.save(self.current_file, settings, wait=wait)
 
         if success:
             self.debug_print(f"Saved per-file settings to .viz file")
@@ -3649,7 +4240,8 @@ class DataVisualizationTool(QMainWindow):
 
     def save_layout_manual(self):
         """Manually save layout (Ctrl+S handler)."""
-        if self._save_per_file_settings():
+        # Wait for the write so the confirmation reflects what is on disk
+        if self._save_per_file_settings(wait=True):
             QMessageBox.information(
                 self,
                 "Layout Saved",
@@ -3730,24 +4322,10 @@ class DataVisualizationTool(QMainWindow):
 
         # Load source .viz file
         try:
-            with open(source_viz, 'r') as f:
-                import json
-                source_data = json.load(f)
+            source_data = self.per_file_settings_manager.read_viz_file(source_viz)
 
             # Create settings object
-            source_settings = PerFileSettings(
-                version=source_data.get('version', 1),
-                logfile=source_data.get('logfile', ''),
-                enabled_streams=source_data.get('enabled_streams', []),
-                stream_colors=source_data.get('stream_colors', {}),
-                stream_display_modes=source_data.get('stream_display_modes', {}),
-                stream_order=source_data.get('stream_order', []),
-                axis_owner=source_data.get('axis_owner'),
-                right_axis_owner=source_data.get('right_axis_owner'),
-                view_start=source_data.get('view_start'),
-                view_end=source_data.get('view_end'),
-                view_history=source_data.get('view_history')
-            )
+            source_settings = PerFileSettings.from_dict(source_data)
 
             # Validate against current file
             source_settings = self.per_file_settings_manager.validate_against_file(
@@ -3761,17 +4339,16 @@ class DataVisualizationTool(QMainWindow):
             )
 
             # Save to current file's .viz path
-            if self.per_file_settings_manager.save(self.current_file, source_settings):
+            if self.per_file_settings_manager.save(self.current_file, source_settings, wait=True):
                 # Reload current file to apply imported settings
                 current_file = self.current_file
                 self.load_hdf5_file_internal(current_file)
 
-                QMessageBox.information(
-                    self,
+                # The reload runs in the background; confirm once it has been applied
+                self._load_done_message = (
                     "Layout Imported",
                     f"Layout imported from:\n{os.path.basename(source_viz)}\n\n"
-                    f"File reloaded with imported settings.",
-                    QMessageBox.StandardButton.Ok
+                    "File reloaded with imported settings."
                 )
             else:
                 QMessageBox.critical(
@@ -3805,6 +4382,18 @@ class DataVisualizationTool(QMainWindow):
         self.config.save_window_geometry(self)
         self.config.save_splitter_state("horizontal", self.h_splitter)
         self.config.save_splitter_state("vertical", self.v_splitter)
+        # Setters only schedule a deferred flush; write everything out before exiting
+        self.config.sync()
+
+        # Let background loads/conversions finish; destroying a running QThread aborts
+        self._load_job = None
+        for thread in list(self._worker_threads):
+            thread.quit()
+            thread.wait()
+
+        # The layout was written in the background while the above ran; make sure it landed
+        if not self.per_file_settings_manager.flush(timeout=2.0):
+            print("WARNING: Layout file is still being written")
 
         # Accept the close event
         super().closeEvent(event)
@@ -3812,7 +4401,8 @@ class DataVisualizationTool(QMainWindow):
     def on_splitter_moved(self, pos, index):
         """Handle splitter movement"""
         if self.raw_data:
-            self.update_graph_plot()
+            # splitterMoved fires continuously during a drag; redraw once per event-loop pass
+            self.schedule_graph_update()
 
 def main():
     # Parse command-line arguments
@@ -3838,8 +4428,20 @@ Examples:
         action='store_true',
         help='Enable debug output'
     )
+    parser.add_argument(
+        '--opengl',
+        action='store_true',
+        help='Draw plot curves with OpenGL (requires PyOpenGL; also enabled by the use_opengl setting)'
+    )
     args = parser.parse_args()
 
+    # OpenGL must be configured before the first PlotWidget is created
+    if args.opengl or AppConfig().get("use_opengl"):
+        if OPENGL_AVAILABLE:
+            pg.setConfigOptions(useOpenGL=True, enableExperimental=True)
+        else:
+            print("OpenGL rendering requested but PyOpenGL is not installed; using software rendering")
+
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
 
@@ -10,7 +10,29 @@ Handles persistent storage of:
 """
 
 import os
-from PySide6.QtCore import QSettings, QByteArray
+import time
+from PySide6.QtCore import QSettings, QByteArray, QTimer
+
+# Writes are flushed to disk this long after the last change (coalesces bursts of setters)
+SETTINGS_SYNC_DELAY_MS = 2000
+
+# How long the existence-filtered recent files list is reused before re-checking the disk
+RECENT_FILES_CACHE_TTL_S = 1.0
+
+# Cache markers for AppConfig.get(): key not read yet / key not stored in QSettings
+_MISSING = object()
+_UNSET = object()
+
+
+def _setting_type(default):
+    """QSettings value type matching a default value (bool before int: bool is an int)."""
+    if isinstance(default, bool):
+        return bool
+    if isinstance(default, int):
+        return int
+    if isinstance(default, float):
+        return float
+    return str
 
 
 class AppConfig:
@@ -40,6 +62,8 @@ class AppConfig:
             "max_plot_points": 5000,
             "default_file_location": str(os.path.expanduser("~/logs")),
             "axis_font_size": 12,  # Font size for all axis labels and tick labels
+            "float32_values": True,  # Store stream values as float32 on load (False keeps float64)
+            "use_opengl": False,  # Draw plot curves with pyqtgraph's OpenGL path (needs PyOpenGL)
 
             # Display unit preferences (global, apply to all files)
             "temperature_units": "celsius",  # "celsius" or "fahrenheit"
@@ -48,25 +72,66 @@ class AppConfig:
             "distance_units": "miles",       # "miles" or "km"
         }
 
+        # QSettings type for each known key, so get() doesn't have to inspect the default
+        self._types = {key: _setting_type(value) for key, value in self.defaults.items()}
+
+        # Values read from QSettings (or _UNSET if not stored), keyed by setting name.
+        # Every write goes through this object, so the cache never goes stale.
+        self._cache = {}
+
+        # Deferred disk flush, created on first write (needs a running Qt event loop)
+        self._sync_timer = None
+
+        # (monotonic time, filtered recent files) from the last get_recent_files() call
+        self._recent_cache = None
+
     def get(self, key, default=None):
         """Get a configuration value with optional default."""
-        if default is None and key in self.defaults:
-            default = self.defaults[key]
-
-        # Type-safe retrieval based on key type
-        if isinstance(default, bool):
-            return self.settings.value(key, default, type=bool)
-        elif isinstance(default, int):
-            return self.settings.value(key, default, type=int)
-        elif isinstance(default, float):
-            return self.settings.value(key, default, type=float)
-        else:
-            return self.settings.value(key, default, type=str)
+        if default is None:
+            default = self.defaults.get(key)
+
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            # First read of this key: one QSettings round trip, then served from memory
+            value_type = self._types.get(key) or _setting_type(default)
+            if self.settings.contains(key):
+                value = self.settings.value(key, default, type=value_type)
+            else:
+                value = _UNSET
+            self._cache[key] = value
+
+        if value is _UNSET:
+            # Not stored: fall back to the default (QSettings returns '' for a missing str)
+            return default if default is not None else ''
+        return value
 
     def set(self, key, value):
         """Set a configuration value."""
         self.settings.setValue(key, value)
-        self.settings.sync()  # Force write to disk
+        self._cache[key] = value
+        self._schedule_sync()
+
+    def _set_if_changed(self, key, value):
+        """Store value under key (in the current group) unless it's already stored; True if written."""
+        if self.settings.value(key) == value:
+            return False
+        self.settings.setValue(key, value)
+        return True
+
+    def _schedule_sync(self):
+        """Flush settings to disk shortly, once per burst of changes instead of per write."""
+        if self._sync_timer is None:
+            self._sync_timer = QTimer()
+            self._sync_timer.setSingleShot(True)
+            self._sync_timer.setInterval(SETTINGS_SYNC_DELAY_MS)
+            self._sync_timer.timeout.connect(self.settings.sync)
+        self._sync_timer.start()
+
+    def sync(self):
+        """Write any pending changes to disk now (call on exit)."""
+        if self._sync_timer is not None:
+            self._sync_timer.stop()
+        self.settings.sync()
 
     # Unit preference accessors
     def get_temperature_units(self):
@@ -96,9 +161,15 @@ class AppConfig:
     # Recent files management
     def get_recent_files(self):
         """Get list of recently opened files."""
+        now = time.monotonic()
+        if self._recent_cache is not None and now - self._recent_cache[0] < RECENT_FILES_CACHE_TTL_S:
+            return list(self._recent_cache[1])
+
         files = self.settings.value("recent_files", [], type=list)
         # Filter out non-existent files
-        return [f for f in files if os.path.exists(f)]
+        existing = [f for f in files if os.path.exists(f)]
+        self._recent_cache = (now, existing)
+        return list(existing)
 
     def add_recent_file(self, filepath):
         """Add a file to the recent files list."""
@@ -117,21 +188,33 @@ class AppConfig:
         recent = recent[:max_count]
 
         self.settings.setValue("recent_files", recent)
-        self.settings.sync()
+        self._recent_cache = None
+        self._schedule_sync()
+
+    def remove_recent_file(self, filepath):
+        """Remove a file from the recent files list."""
+        files = self.settings.value("recent_files", [], type=list)
+        if filepath in files:
+            files.remove(filepath)
+            self.settings.setValue("recent_files", files)
+            self._schedule_sync()
+        self._recent_cache = None
 
     def clear_recent_files(self):
         """Clear the recent files list."""
         self.settings.setValue("recent_files", [])
-        self.settings.sync()
+        self._recent_cache = None
+        self._schedule_sync()
 
     # Window geometry
     def save_window_geometry(self, window):
         """Save window geometry and state."""
         self.settings.beginGroup("MainWindow")
-        self.settings.setValue("geometry", window.saveGeometry())
-        self.settings.setValue("state", window.saveState())
+        changed = self._set_if_changed("geometry", window.saveGeometry())
+        changed |= self._set_if_changed("state", window.saveState())
         self.settings.endGroup()
-        self.settings.sync()
+        if changed:
+            self._schedule_sync()
 
     def restore_window_geometry(self, window):
         """Restore window geometry and state."""
@@ -149,9 +232,10 @@ class AppConfig:
     def save_splitter_state(self, name, splitter):
         """Save splitter sizes."""
         self.settings.beginGroup("Splitters")
-        self.settings.setValue(name, splitter.saveState())
+        changed = self._set_if_changed(name, splitter.saveState())
         self.settings.endGroup()
-        self.settings.sync()
+        if changed:
+            self._schedule_sync()
 
     def restore_splitter_state(self, name, splitter):
         """Restore splitter sizes."""
@@ -166,7 +250,7 @@ class AppConfig:
     def save_stream_order(self, stream_order):
         """Save the custom stream order."""
         self.settings.setValue("stream_order", stream_order)
-        self.settings.sync()
+        self._schedule_sync()
 
     def get_stream_order(self):
         """Get the saved stream order."""
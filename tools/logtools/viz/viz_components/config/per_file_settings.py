@@ -7,14 +7,39 @@ Provides:
 - Migration/upgrade of older schema versions
 """
 
+import copy
+import hashlib
 import json
 import os
+import concurrent.futures
 from pathlib import Path
 from typing import Optional, Dict, List, Any
 from dataclasses import dataclass, asdict, field
 
+# orjson is optional; it only speeds up parsing .viz files (its JSONDecodeError
+# subclasses json.JSONDecodeError, so error handling is the same either way)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+def _digest(content: bytes) -> bytes:
+    """Short content digest used to detect unchanged .viz files."""
+    return hashlib.blake2b(content, digest_size=8).digest()
+
+
+def _file_stamp(path: str) -> Optional[tuple]:
+    """(mtime_ns, size) of a file, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+@dataclass(slots=True)
 class PerFileSettings:
     """Container for per-file visualizer settings."""
 
@@ -42,6 +67,21 @@ class PerFileSettings:
     # Navigation history
     view_history: Optional[Dict[str, Any]] = None
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PerFileSettings':
+        """
+        Build settings from a parsed .viz dict.
+
+        Unknown keys are ignored and missing ones keep their defaults.
+
+        Args:
+            data: Parsed .viz file contents
+
+        Returns:
+            PerFileSettings populated from data
+        """
+        return cls(**{key: value for key, value in data.items() if key in cls.__dataclass_fields__})
+
 
 class PerFileSettingsManager:
     """Manages loading/saving of per-file settings."""
@@ -60,6 +100,19 @@ class PerFileSettingsManager:
         self.current_viz_path: Optional[str] = None
         self.has_unsaved_changes: bool = False
 
+        # Parsed .viz files keyed by path: ((mtime_ns, size), data). Reloading or
+        # re-importing an unchanged layout reuses the parsed data instead of re-reading it.
+        self._json_cache: Dict[str, tuple] = {}
+
+        # Single background writer: .viz writes run in submission order off the GUI thread
+        self._writer = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="viz-writer")
+        self._last_write = None  # Future of the most recently queued write
+
+        # ((mtime_ns, size), digest) of each .viz file as last read or written, so saving
+        # a layout that hasn't changed skips the write (and leaves the file's mtime alone).
+        # The stamp must still match, so a file changed by someone else is overwritten.
+        self._last_hash: Dict[str, tuple] = {}
+
     def get_viz_path(self, logfile_path: str) -> str:
         """
         Get the .viz sidecar file path for a given log file.
@@ -94,15 +147,9 @@ class PerFileSettingsManager:
         viz_path = self.get_viz_path(logfile_path)
         self.current_viz_path = viz_path
 
-        if not os.path.exists(viz_path):
-            self._debug_print(f"No .viz file found at {viz_path}")
-            self.current_settings = None
-            self.has_unsaved_changes = False
-            return None
-
         try:
-            with open(viz_path, 'r') as f:
-                data = json.load(f)
+            # Single read + parse; a missing file surfaces here instead of via a separate exists() probe
+            data = self.read_viz_file(viz_path)
 
             # Validate schema version
             version = data.get('version', 1)
@@ -115,64 +162,95 @@ class PerFileSettingsManager:
                 data = self._migrate_schema(data, version)
 
             # Create settings object
-            settings = PerFileSettings(
-                version=data.get('version', 1),
-                logfile=data.get('logfile', ''),
-                enabled_streams=data.get('enabled_streams', []),
-                stream_colors=data.get('stream_colors', {}),
-                stream_display_modes=data.get('stream_display_modes', {}),
-                stream_units=data.get('stream_units', {}),
-                stream_order=data.get('stream_order', []),
-                axis_owner=data.get('axis_owner'),
-                right_axis_owner=data.get('right_axis_owner'),
-                view_start=data.get('view_start'),
-                view_end=data.get('view_end'),
-                view_history=data.get('view_history')
-            )
-
-            self.current_settings = settings
-            self.has_unsaved_changes = False
+            settings = PerFileSettings.from_dict(data)
             self._debug_print(f"Loaded .viz file from {viz_path}")
-            return settings
 
+        except FileNotFoundError:
+            self._debug_print(f"No .viz file found at {viz_path}")
+            settings = None
         except json.JSONDecodeError as e:
             print(f"ERROR: Failed to parse .viz file {viz_path}: {e}")
-            print(f"       Using default settings instead.")
-            self.current_settings = None
-            self.has_unsaved_changes = False
-            return None
+            print("       Using default settings instead.")
+            settings = None
         except Exception as e:
             print(f"ERROR: Failed to load .viz file {viz_path}: {e}")
-            self.current_settings = None
-            self.has_unsaved_changes = False
-            return None
+            settings = None
+
+        self.current_settings = settings
+        self.has_unsaved_changes = False
+        return settings
 
-    def save(self, logfile_path: str, settings: PerFileSettings) -> bool:
+    def save(self, logfile_path: str, settings: PerFileSettings, wait: bool = False) -> bool:
         """
         Save per-file settings to .viz file.
 
+        The file is written on a background thread so the GUI doesn't block on
+        disk I/O; use flush() (or wait=True) when the result must be on disk.
+
         Args:
             logfile_path: Path to the HDF5 log file
             settings: Settings to save
+            wait: Block until the file is written and report the write's result
 
         Returns:
-            True if save succeeded, False otherwise
+            True if the save was queued (or, with wait=True, succeeded), False otherwise
         """
         viz_path = self.get_viz_path(logfile_path)
 
-        try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(viz_path) or '.', exist_ok=True)
+        # Convert to dict now: asdict copies, so later changes to settings don't race the writer
+        data = asdict(settings)
+        data['version'] = self.SCHEMA_VERSION
+        data['logfile'] = os.path.basename(logfile_path)
 
-            # Convert to dict and save as JSON
-            data = asdict(settings)
-            data['version'] = self.SCHEMA_VERSION
-            data['logfile'] = os.path.basename(logfile_path)
+        self._last_write = self._writer.submit(self._write_viz_file, viz_path, data)
+        self.has_unsaved_changes = False
+        if wait:
+            return self._last_write.result()
+        return True
 
-            with open(viz_path, 'w') as f:
-                json.dump(data, f, indent=2)
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued .viz writes to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if all queued writes have finished
+        """
+        if self._last_write is None:
+            return True
+        # Writes run in order on one thread, so the last one finishing means all have
+        done, _ = concurrent.futures.wait([self._last_write], timeout=timeout)
+        return bool(done)
+
+    def _write_viz_file(self, viz_path: str, data: Dict[str, Any]) -> bool:
+        """Write data to viz_path atomically (runs on the writer thread)."""
+        try:
+            # Ensure directory exists
+            viz_dir = os.path.dirname(viz_path) or '.'
+            os.makedirs(viz_dir, exist_ok=True)
+
+            encoded = json.dumps(data, indent=2).encode('utf-8')
+            digest = _digest(encoded)
+            stamp = _file_stamp(viz_path)
+            if stamp is not None and self._last_hash.get(viz_path) == (stamp, digest):
+                self._debug_print(f"Layout unchanged, not rewriting {viz_path}")
+                return True
+
+            # Write a temp file and rename it over the old one, so an interrupted
+            # write never leaves a truncated .viz behind
+            tmp_path = viz_path + '.tmp'
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(encoded)
+                os.replace(tmp_path, viz_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+            self._cache_viz_data(viz_path, data, digest)
 
-            self.has_unsaved_changes = False
             self._debug_print(f"Saved .viz file to {viz_path}")
             return True
 
@@ -184,6 +262,49 @@ class PerFileSettingsManager:
             print(f"ERROR: Unexpected error saving .viz file {viz_path}: {e}")
             return False
 
+    def read_viz_file(self, viz_path: str) -> Dict[str, Any]:
+        """
+        Read and parse a .viz file, reusing the last parse if the file is unchanged.
+
+        Args:
+            viz_path: Path to the .viz file
+
+        Returns:
+            Parsed settings dict (a private copy the caller may modify)
+
+        Raises:
+            OSError: If the file can't be read
+            json.JSONDecodeError: If the file isn't valid JSON
+        """
+        # A queued save may be about to replace this file; read what it writes
+        self.flush()
+
+        st = os.stat(viz_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._json_cache.get(viz_path)
+        if cached is not None and cached[0] == stamp:
+            self._debug_print(f"Using cached parse of {viz_path}")
+            return copy.deepcopy(cached[1])
+
+        # One read of the whole file, then parse the bytes in a single call
+        with open(viz_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+        self._json_cache[viz_path] = (stamp, data)
+        self._last_hash[viz_path] = (stamp, _digest(raw))
+        return copy.deepcopy(data)
+
+    def _cache_viz_data(self, viz_path: str, data: Dict[str, Any], digest: bytes):
+        """Remember data and the digest of its bytes as the contents of a just-written .viz file."""
+        stamp = _file_stamp(viz_path)
+        if stamp is None:
+            self._json_cache.pop(viz_path, None)
+            self._last_hash.pop(viz_path, None)
+            return
+        self._json_cache[viz_path] = (stamp, copy.deepcopy(data))
+        self._last_hash[viz_path] = (stamp, digest)
+
     def validate_against_file(self, settings: PerFileSettings,
                              available_streams: List[str]) -> PerFileSettings:
         """
@@ -3,5 +3,6 @@ Data management components for viz_components
 """
 from .hdf5_loader import HDF5DataLoader
 from .data_manager import DataManager
+from .range_pyramid import RangePyramid, warm_up_range_pyramid
 
-__all__ = ['HDF5DataLoader', 'DataManager']
+__all__ = ['HDF5DataLoader', 'DataManager', 'RangePyramid', 'warm_up_range_pyramid']
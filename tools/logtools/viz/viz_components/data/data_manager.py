@@ -5,8 +5,15 @@ Manages loaded data and provides query interface for retrieving
 time-windowed data for rendering.
 """
 
+import sys
+
 import numpy as np
 
+from .range_pyramid import RangePyramid
+
+# Window index lookups kept before the cache is reset
+VISIBLE_SLICE_CACHE_MAX_ENTRIES = 64
+
 
 class DataManager:
     """Manages loaded data and provides query interface"""
@@ -21,6 +28,10 @@ class DataManager:
         self.time_min = 0.0
         self.time_max = 0.0
         self.time_span = 0.0
+        self._first_cam_time = None  # Time of the first camshaft event, anchors the initial view
+        self._streams = {}  # interned stream_name -> (raw_data entry, metadata dict)
+        self._slice_cache = {}  # (stream_name, time_start, time_end) -> (time, i0, i1)
+        self._range_pyramids = {}  # stream_name -> RangePyramid, built on first windowed query
 
     def set_data(self, raw_data, stream_names, stream_ranges, stream_metadata, file_metadata, time_bounds):
         """
@@ -42,6 +53,20 @@ class DataManager:
         self.time_min, self.time_max = time_bounds
         self.time_span = self.time_max - self.time_min
 
+        # One lookup per query instead of one per dict. Entries are the raw_data/metadata
+        # dicts themselves (not their arrays), so in-place unit conversions stay visible.
+        self._streams = {sys.intern(name): (data, stream_metadata.get(name, {}))
+                         for name, data in raw_data.items()}
+
+        cam_data = raw_data.get('ecu_camshaft_timestamp')
+        if cam_data is not None and len(cam_data['time']) > 0:
+            self._first_cam_time = float(cam_data['time'][0])
+        else:
+            self._first_cam_time = None
+
+        self._slice_cache = {}
+        self._range_pyramids = {}
+
     def clear(self):
         """Clear all loaded data"""
         self.raw_data = {}
@@ -52,6 +77,10 @@ class DataManager:
         self.time_min = 0.0
         self.time_max = 0.0
         self.time_span = 0.0
+        self._first_cam_time = None
+        self._streams = {}
+        self._slice_cache = {}
+        self._range_pyramids = {}
 
     def has_data(self):
         """Check if data is loaded"""
@@ -67,7 +96,62 @@ class DataManager:
         Returns:
             Dict with 'time' and 'values' arrays, or None if not found
         """
-        return self.raw_data.get(stream_name)
+        entry = self._streams.get(stream_name)
+        return entry[0] if entry is not None else None
+
+    def _get_visible_slice(self, stream_name, time_start, time_end):
+        """
+        Locate a stream's samples within a time window.
+
+        Times are sorted, so the window is found with two binary searches
+        instead of a mask over the whole stream. Results are cached because
+        the same window is usually queried several times per redraw.
+
+        Args:
+            stream_name: Name of the stream
+            time_start: Start time (seconds)
+            time_end: End time (seconds)
+
+        Returns:
+            Tuple of (data, i0, i1) where data['time'][i0:i1] is the window,
+            or (None, 0, 0) if stream not found
+        """
+        entry = self._streams.get(stream_name)
+        if entry is None:
+            return None, 0, 0
+        data = entry[0]
+
+        time = data['time']
+        key = (stream_name, time_start, time_end)
+        cached = self._slice_cache.get(key)
+        if cached is not None and cached[0] is time:
+            return data, cached[1], cached[2]
+
+        i0 = int(np.searchsorted(time, time_start, side='left'))
+        i1 = int(np.searchsorted(time, time_end, side='right'))
+
+        if len(self._slice_cache) >= VISIBLE_SLICE_CACHE_MAX_ENTRIES:
+            self._slice_cache.clear()
+        self._slice_cache[key] = (time, i0, i1)
+        return data, i0, i1
+
+    def _get_range_pyramid(self, stream_name, values):
+        """
+        Get the min/max summary pyramid for a stream, building it on first use.
+
+        Args:
+            stream_name: Name of the stream
+            values: The stream's current values array
+
+        Returns:
+            RangePyramid over values
+        """
+        pyramid = self._range_pyramids.get(stream_name)
+        # Rebuild if the stream's values array was replaced (e.g. unit conversion)
+        if pyramid is None or pyramid.values is not values:
+            pyramid = RangePyramid(values)
+            self._range_pyramids[stream_name] = pyramid
+        return pyramid
 
     def get_visible_data(self, stream_name, time_start, time_end):
         """
@@ -79,19 +163,13 @@ class DataManager:
             time_end: End time (seconds)
 
         Returns:
-            Tuple of (time_array, values_array) for the visible window,
+            Tuple of (time_array, values_array) views for the visible window,
             or (None, None) if stream not found
         """
-        if stream_name not in self.raw_data:
+        data, i0, i1 = self._get_visible_slice(stream_name, time_start, time_end)
+        if data is None:
             return None, None
-
-        data = self.raw_data[stream_name]
-        time = data['time']
-        values = data['values']
-
-        # Filter to time window
-        mask = (time >= time_start) & (time <= time_end)
-        return time[mask], values[mask]
+        return data['time'][i0:i1], data['values'][i0:i1]
 
     def get_stream_range(self, stream_name):
         """
@@ -115,11 +193,11 @@ class DataManager:
             time_end: End time (seconds)
 
         Returns:
-            Maximum value in the window, or None if no data
+            Maximum non-NaN value in the window, or None if no data
         """
-        time, values = self.get_visible_data(stream_name, time_start, time_end)
-        if values is not None and len(values) > 0:
-            return float(values.max())
+        data, i0, i1 = self._get_visible_slice(stream_name, time_start, time_end)
+        if data is not None and i1 > i0:
+            return self._get_range_pyramid(stream_name, data['values']).range(i0, i1)[1]
         return None
 
     def get_visible_min(self, stream_name, time_start, time_end):
@@ -132,13 +210,36 @@ class DataManager:
             time_end: End time (seconds)
 
         Returns:
-            Minimum value in the window, or None if no data
+            Minimum non-NaN value in the window, or None if no data
         """
-        time, values = self.get_visible_data(stream_name, time_start, time_end)
-        if values is not None and len(values) > 0:
-            return float(values.min())
+        data, i0, i1 = self._get_visible_slice(stream_name, time_start, time_end)
+        if data is not None and i1 > i0:
+            return self._get_range_pyramid(stream_name, data['values']).range(i0, i1)[0]
         return None
 
+    def get_visible_range(self, stream_name, time_start, time_end):
+        """
+        Get the minimum and maximum values for a stream within a time window.
+
+        Locates the window once and answers both ends from the stream's
+        summary pyramid, so the viewer's axis scaling (visible maxima and
+        DataNormalizer ranges) doesn't scan every visible sample. NaN samples
+        are ignored, as with np.nanmin/np.nanmax.
+
+        Args:
+            stream_name: Name of the stream
+            time_start: Start time (seconds)
+            time_end: End time (seconds)
+
+        Returns:
+            Tuple of (min, max) in the window (NaN if every sample is NaN),
+            or (None, None) if no data
+        """
+        data, i0, i1 = self._get_visible_slice(stream_name, time_start, time_end)
+        if data is None or i1 <= i0:
+            return None, None
+        return self._get_range_pyramid(stream_name, data['values']).range(i0, i1)
+
     def get_metadata(self, stream_name):
         """
         Get metadata for a stream.
@@ -149,7 +250,8 @@ class DataManager:
         Returns:
             Metadata dict or empty dict if not found
         """
-        return self.stream_metadata.get(stream_name, {})
+        entry = self._streams.get(stream_name)
+        return entry[1] if entry is not None else {}
 
     def get_time_bounds(self):
         """
@@ -175,14 +277,11 @@ class DataManager:
         nav_offset_before = stream_config.get_setting('nav_offset_before', 1.0)
         nav_offset_after = stream_config.get_setting('nav_offset_after', 5.0)
 
-        if nav_anchor == 'first_cam' and 'ecu_camshaft_timestamp' in self.raw_data:
+        if nav_anchor == 'first_cam' and self._first_cam_time is not None:
             # Position around first CAM event
-            cam_data = self.raw_data['ecu_camshaft_timestamp']
-            if len(cam_data['time']) > 0:
-                first_cam_time = float(cam_data['time'][0])
-                view_start = max(self.time_min, first_cam_time - nav_offset_before)
-                view_end = min(self.time_max, first_cam_time + nav_offset_after)
-                return (view_start, view_end)
+            view_start = max(self.time_min, self._first_cam_time - nav_offset_before)
+            view_end = min(self.time_max, self._first_cam_time + nav_offset_after)
+            return (view_start, view_end)
 
         # Fall back to data_start
         view_start = self.time_min
@@ -7,15 +7,14 @@ Handles loading and parsing HDF5 log files, including:
 - Applying unit conversions based on user preferences
 """
 
+import importlib.util
 import os
+import sys
+
 import numpy as np
 
-try:
-    import h5py
-    HDF5_AVAILABLE = True
-except ImportError:
-    HDF5_AVAILABLE = False
-    h5py = None
+# h5py is imported on first file open rather than at startup; only check it's installed
+HDF5_AVAILABLE = importlib.util.find_spec("h5py") is not None
 
 from ..config import UnitConverter
 
@@ -23,6 +22,15 @@ from ..config import UnitConverter
 class HDF5DataLoader:
     """Handles loading and parsing HDF5 log files"""
 
+    # Raw chunk cache per file handle; large enough to hold whole chunks of the
+    # log datasets so a full read never evicts a chunk before it is consumed
+    CHUNK_CACHE_BYTES = 64 << 20
+    # Hash slots for the chunk cache: a prime ~10x the number of decoder chunks
+    # (1000 samples x 2 x 8 bytes) that fit in the cache, keeping collisions rare
+    CHUNK_CACHE_SLOTS = 40009
+    # Datasets are read front to back exactly once, so fully read chunks are evicted first
+    CHUNK_CACHE_W0 = 1.0
+
     def __init__(self, stream_config_manager):
         """
         Initialize the HDF5 data loader.
@@ -32,13 +40,29 @@ class HDF5DataLoader:
         """
         self.stream_config = stream_config_manager
 
-    def load_file(self, filepath, app_config):
+    @classmethod
+    def _open_file(cls, filepath):
+        """Open an HDF5 file read-only with the loader's chunk cache settings."""
+        import h5py
+        return h5py.File(filepath, 'r',
+                         rdcc_nbytes=cls.CHUNK_CACHE_BYTES,
+                         rdcc_nslots=cls.CHUNK_CACHE_SLOTS,
+                         rdcc_w0=cls.CHUNK_CACHE_W0)
+
+    def load_file(self, filepath, unit_preferences, float32_values=True, progress_callback=None):
         """
         Load an HDF5 file and extract all datasets.
 
+        Preferences are passed as plain values (not the AppConfig) because this
+        runs on a worker thread and QSettings must not be shared across threads.
+
         Args:
             filepath: Path to HDF5 file
-            app_config: AppConfig instance for user preferences (units, etc.)
+            unit_preferences: Dict mapping data type ('temperature', 'velocity',
+                'pressure') to the user's preferred display units
+            float32_values: Store stream values as float32 (False keeps float64)
+            progress_callback: Optional callable(datasets_read, datasets_total),
+                called on the loading thread as each dataset finishes
 
         Returns:
             Dictionary with keys:
@@ -57,7 +81,7 @@ class HDF5DataLoader:
 
         print(f"Loading HDF5 file: {filepath}")
 
-        with h5py.File(filepath, 'r') as h5file:
+        with self._open_file(filepath) as h5file:
             # Read file metadata
             file_metadata = {}
             print("Metadata:")
@@ -65,123 +89,164 @@ class HDF5DataLoader:
                 file_metadata[key] = value
                 print(f"  {key}: {value}")
 
-            # Load all datasets
-            raw_data = {}
-            stream_names = []
-            stream_metadata = {}
-
-            # Get all dataset names
+            # Decide which datasets to load from their shapes before reading any data
+            keys_to_read = []
             for key in h5file.keys():
                 if key == 'eprom_loads':  # Skip special datasets
                     continue
 
                 ds = h5file[key]
-
-                # Handle different dataset shapes
-                if len(ds.shape) == 2 and ds.shape[1] == 2:
-                    # Standard (time_ns, value) format
+                if len(ds.shape) == 2 and ds.shape[1] in (2, 3):
                     if ds.shape[0] > 0:  # Only include non-empty datasets
-                        print(f"  Loading {key}: {ds.shape[0]} samples")
-
-                        # Detect native units from dataset name
-                        data_type, native_units = UnitConverter.parse_units_from_name(key)
-
-                        # Get user's preferred display units
-                        display_units = native_units  # Default to native
-                        if data_type == 'temperature':
-                            display_units = app_config.get_temperature_units()
-                        elif data_type == 'velocity':
-                            display_units = app_config.get_velocity_units()
-                        elif data_type == 'pressure':
-                            display_units = app_config.get_pressure_units()
-                        elif data_type == 'throttle':
-                            display_units = 'percent_open'  # always default to % open
-
-                        # Store metadata for this stream
-                        stream_metadata[key] = {
-                            'data_type': data_type,
-                            'native_units': native_units,
-                            'display_units': display_units
-                        }
-
-                        # Load and convert data
-                        time_data = ds[:, 0] / 1e9  # Convert ns to seconds
-                        native_values = ds[:, 1].astype(float)
-
-                        # Apply unit conversion if needed; keep native copy for live re-conversion
-                        if native_units != display_units:
-                            value_data = UnitConverter.convert(native_values, data_type, native_units, display_units)
-                            print(f"    Converted from {native_units} to {display_units}")
-                        else:
-                            value_data = native_values
-                            native_values = None  # no copy needed when no conversion applied
-
-                        # Store data; native_values enables unit switching without re-reading the file
-                        raw_data[key] = {
-                            'time': time_data,
-                            'values': value_data,
-                            'native_values': native_values,
-                        }
-
-                        # Don't add hidden streams to stream_names
-                        if not self.stream_config.should_skip_in_selection(key):
-                            stream_names.append(key)
-
-                elif len(ds.shape) == 2 and ds.shape[1] == 3:
-                    # 3D data like gps_position (time_ns, lat, lon)
-                    if ds.shape[0] > 0:
-                        print(f"  Loading {key}: {ds.shape[0]} samples (3D)")
-                        time_ns = ds[:, 0] / 1e9
-                        # Keep GPS position as a single entity (lat/lon cannot be separated)
-                        if key == 'gps_position':
-                            raw_data['gps_position'] = {
-                                'time': time_ns,
-                                'lat': ds[:, 1],
-                                'lon': ds[:, 2]
-                            }
-                            # Note: gps_position is NOT added to stream_names
-                            # It will be displayed as markers, not as a plottable stream
-
+                        # Interned: every stream-keyed dict downstream shares this one
+                        # string object, so name lookups succeed on the identity check
+                        keys_to_read.append(sys.intern(key))
                 elif len(ds.shape) == 1:
                     # 1D timestamp arrays (markers) - skip for now
                     if ds.shape[0] > 0:
                         print(f"  Skipping 1D marker dataset {key}: {ds.shape[0]} samples")
 
-            print(f"\nTotal streams loaded: {len(stream_names)}")
-
-            # Calculate ranges for each stream
-            stream_ranges = {}
-            all_times = []
-
-            for stream in stream_names:
-                # Use nan-safe min/max: streams like throttle % open contain NaN
-                # sentinel values (ADC=0 and 1023) that must not corrupt the range.
-                vals = raw_data[stream]['values']
-                stream_min = float(np.nanmin(vals))
-                stream_max = float(np.nanmax(vals))
-                # Add epsilon to avoid division by zero for constant streams
-                if stream_max - stream_min < 1e-10:
-                    stream_max = stream_min + 1.0
-                stream_ranges[stream] = (stream_min, stream_max)
-                print(f"  {stream}: range [{stream_min:.2f}, {stream_max:.2f}]")
-
-                # Collect all time values to find overall bounds
-                all_times.extend([raw_data[stream]['time'].min(), raw_data[stream]['time'].max()])
-
-            # Set time bounds from raw data
-            time_min = float(min(all_times)) if all_times else 0.0
-            time_max = float(max(all_times)) if all_times else 0.0
-
-            print(f"Time range: [{time_min:.2f}s, {time_max:.2f}s], span: {time_max - time_min:.2f}s")
-
-            return {
-                'raw_data': raw_data,
-                'stream_names': stream_names,
-                'stream_ranges': stream_ranges,
-                'stream_metadata': stream_metadata,
-                'file_metadata': file_metadata,
-                'time_bounds': (time_min, time_max)
-            }
+            arrays = self._read_datasets(h5file, keys_to_read, progress_callback)
+
+        # Stream values are stored as float32 unless the user opted out: it halves the
+        # memory traffic of every mask/decimate/normalize pass. Times stay float64 so
+        # sub-millisecond event timing is preserved late in long logs.
+        value_dtype = np.float32 if float32_values else np.float64
+
+        # Load all datasets
+        raw_data = {}
+        stream_names = []
+        stream_metadata = {}
+
+        for key in keys_to_read:
+            # Pop so each interleaved (N, 2)/(N, 3) block is freed once its stream arrays
+            # are built, instead of every block staying alive until the whole load is done
+            data = arrays.pop(key)
+
+            # Handle different dataset shapes
+            if data.shape[1] == 2:
+                # Standard (time_ns, value) format
+                print(f"  Loading {key}: {data.shape[0]} samples")
+
+                # Detect native units from dataset name
+                data_type, native_units = UnitConverter.parse_units_from_name(key)
+
+                # Get user's preferred display units
+                display_units = native_units  # Default to native
+                if data_type in unit_preferences:
+                    display_units = unit_preferences[data_type]
+                elif data_type == 'throttle':
+                    display_units = 'percent_open'  # always default to % open
+
+                # Store metadata for this stream
+                stream_metadata[key] = {
+                    'data_type': data_type,
+                    'native_units': native_units,
+                    'display_units': display_units
+                }
+
+                # Load and convert data
+                time_data = data[:, 0] / 1e9  # Convert ns to seconds
+                native_values = data[:, 1].astype(value_dtype)
+
+                # Apply unit conversion if needed; keep native copy for live re-conversion
+                if native_units != display_units:
+                    value_data = np.asarray(UnitConverter.convert(native_values, data_type, native_units, display_units),
+                                            dtype=value_dtype)
+                    print(f"    Converted from {native_units} to {display_units}")
+                else:
+                    value_data = native_values
+                    native_values = None  # no copy needed when no conversion applied
+
+                # Store data; native_values enables unit switching without re-reading the file
+                raw_data[key] = {
+                    'time': time_data,
+                    'values': value_data,
+                    'native_values': native_values,
+                }
+
+                # Don't add hidden streams to stream_names
+                if not self.stream_config.should_skip_in_selection(key):
+                    stream_names.append(key)
+
+            else:
+                # 3D data like gps_position (time_ns, lat, lon)
+                print(f"  Loading {key}: {data.shape[0]} samples (3D)")
+                time_ns = data[:, 0] / 1e9
+                # Keep GPS position as a single entity (lat/lon cannot be separated)
+                if key == 'gps_position':
+                    # Copy the columns out: strided views into the (N, 3) block would make
+                    # every lat/lon mask and gather step over the interleaved other columns
+                    raw_data['gps_position'] = {
+                        'time': time_ns,
+                        'lat': np.ascontiguousarray(data[:, 1]),
+                        'lon': np.ascontiguousarray(data[:, 2])
+                    }
+                    # Note: gps_position is NOT added to stream_names
+                    # It will be displayed as markers, not as a plottable stream
+
+        print(f"\nTotal streams loaded: {len(stream_names)}")
+
+        # Calculate ranges for each stream
+        stream_ranges = {}
+        first_times = []
+        last_times = []
+
+        for stream in stream_names:
+            # Use nan-safe min/max: streams like throttle % open contain NaN
+            # sentinel values (ADC=0 and 1023) that must not corrupt the range.
+            vals = raw_data[stream]['values']
+            stream_min = float(np.nanmin(vals))
+            stream_max = float(np.nanmax(vals))
+            # Add epsilon to avoid division by zero for constant streams
+            if stream_max - stream_min < 1e-10:
+                stream_max = stream_min + 1.0
+            stream_ranges[stream] = (stream_min, stream_max)
+            print(f"  {stream}: range [{stream_min:.2f}, {stream_max:.2f}]")
+
+            # Stream times are in log order, so the ends give each stream's time bounds
+            first_times.append(raw_data[stream]['time'][0])
+            last_times.append(raw_data[stream]['time'][-1])
+
+        # Set time bounds from raw data
+        time_min = float(np.minimum.reduce(first_times)) if first_times else 0.0
+        time_max = float(np.maximum.reduce(last_times)) if last_times else 0.0
+
+        print(f"Time range: [{time_min:.2f}s, {time_max:.2f}s], span: {time_max - time_min:.2f}s")
+
+        return {
+            'raw_data': raw_data,
+            'stream_names': stream_names,
+            'stream_ranges': stream_ranges,
+            'stream_metadata': stream_metadata,
+            'file_metadata': file_metadata,
+            'time_bounds': (time_min, time_max)
+        }
+
+    @staticmethod
+    def _read_datasets(h5file, keys, progress_callback=None):
+        """
+        Read several datasets in full through an open file handle.
+
+        Args:
+            h5file: Open h5py.File
+            keys: Dataset names to read
+            progress_callback: Optional callable(datasets_read, datasets_total)
+
+        Returns:
+            Dict mapping dataset name to its full numpy array
+        """
+        arrays = {}
+        for done, key in enumerate(keys, start=1):
+            ds = h5file[key]
+            # One bulk read straight into a preallocated array (no intermediate copy)
+            data = np.empty(ds.shape, dtype=ds.dtype)
+            if data.size:
+                ds.read_direct(data)
+            arrays[key] = data
+            if progress_callback:
+                progress_callback(done, len(keys))
+        return arrays
 
     def get_metadata(self, filepath):
         """
@@ -207,7 +272,7 @@ class HDF5DataLoader:
             'eprom_loads': []
         }
 
-        with h5py.File(filepath, 'r') as f:
+        with self._open_file(filepath) as f:
             # Get file attributes
             for key, value in f.attrs.items():
                 metadata['attributes'][key] = value
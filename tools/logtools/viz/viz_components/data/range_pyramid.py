@@ -0,0 +1,144 @@
+"""
+Precomputed min/max summary pyramid for windowed range queries.
+
+Each level holds the minimum and maximum of consecutive buckets of samples,
+with the bucket size doubling from level to level (128, 256, 512, ...). A
+windowed min/max then reads a few whole buckets per level plus short raw
+fringes at the window edges, instead of scanning every sample in the window.
+NaN samples are skipped, as with np.nanmin/np.nanmax.
+
+If numba is installed the finest level is built with a single fused min/max
+pass over the samples; otherwise numpy reduces the buckets twice.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, boundscheck=False)
+    def _bucket_min_max_kernel(values, size, mins, maxs):
+        """NaN-skipping min and max of each whole bucket in one pass (NaN only for an all-NaN bucket)."""
+        for b in range(len(mins)):
+            start = b * size
+            mn = np.inf
+            mx = -np.inf
+            valid = False
+            # Branch-free body so LLVM can vectorize both reductions together;
+            # NaN compares false, so it never replaces the running extremes
+            for i in range(start, start + size):
+                v = values[i]
+                valid |= v == v
+                mn = v if v < mn else mn
+                mx = v if v > mx else mx
+            if not valid:
+                mn = np.nan
+                mx = np.nan
+            mins[b] = mn
+            maxs[b] = mx
+
+
+def _bucket_min_max(values, size, count):
+    """Per-bucket NaN-skipping (mins, maxs) for the first count whole buckets of size samples."""
+    if NUMBA_AVAILABLE and values.dtype.kind == 'f':
+        mins = np.empty(count, dtype=values.dtype)
+        maxs = np.empty(count, dtype=values.dtype)
+        _bucket_min_max_kernel(values, size, mins, maxs)
+        return mins, maxs
+    buckets = values[:count * size].reshape(count, size)
+    # fmin/fmax skip NaN like nanmin/nanmax, without the all-NaN warning
+    return np.fmin.reduce(buckets, axis=1), np.fmax.reduce(buckets, axis=1)
+
+
+def warm_up_range_pyramid(value_dtype=np.float64):
+    """Compile the numba bucket kernel for a value dtype ahead of the first redraw (no-op without numba)."""
+    if not NUMBA_AVAILABLE:
+        return
+    v = np.arange(16, dtype=value_dtype)
+    v[5] = np.nan  # exercise the NaN handling as well
+    _bucket_min_max(v, 4, 4)
+
+
+class RangePyramid:
+    """Bucketed min/max levels for one stream's values"""
+
+    # Samples per bucket at the finest level
+    BASE_BUCKET_SIZE = 128
+
+    def __init__(self, values):
+        """
+        Build all levels for a stream.
+
+        Args:
+            values: numpy array of sample values (NaN samples are ignored)
+        """
+        self.values = values
+        self.levels = []  # [(bucket_size, mins, maxs)] from finest to coarsest
+
+        size = self.BASE_BUCKET_SIZE
+        count = len(values) // size
+        if count == 0:
+            return
+
+        # Only whole buckets are summarized; the tail is always read from the raw values
+        mins, maxs = _bucket_min_max(values, size, count)
+        while True:
+            self.levels.append((size, mins, maxs))
+            if len(mins) < 2:
+                break
+            pairs = len(mins) // 2 * 2
+            # fmin/fmax keep the valid side when one bucket of a pair is all-NaN
+            mins = np.fmin(mins[0:pairs:2], mins[1:pairs:2])
+            maxs = np.fmax(maxs[0:pairs:2], maxs[1:pairs:2])
+            size *= 2
+
+    def range(self, i0, i1):
+        """
+        Get the minimum and maximum of values[i0:i1], ignoring NaN.
+
+        Args:
+            i0: First sample index of the window
+            i1: One past the last sample index of the window (must be > i0)
+
+        Returns:
+            Tuple of (min, max) as floats (NaN if every sample in the window is NaN)
+        """
+        mins = []
+        maxs = []
+        self._collect(i0, i1, len(self.levels) - 1, mins, maxs)
+        return float(np.fmin.reduce(mins)), float(np.fmax.reduce(maxs))
+
+    def _collect(self, i0, i1, level, mins, maxs):
+        """Append partial minima/maxima covering values[i0:i1], using levels up to level."""
+        if i1 <= i0:
+            return
+
+        # Coarsest level whose buckets can fit inside the window
+        while level >= 0 and self.levels[level][0] > i1 - i0:
+            level -= 1
+
+        if level < 0:
+            window = self.values[i0:i1]
+            mins.append(np.fmin.reduce(window))
+            maxs.append(np.fmax.reduce(window))
+            return
+
+        size, level_mins, level_maxs = self.levels[level]
+        b0 = -(-i0 // size)
+        b1 = min(i1 // size, len(level_mins))
+        if b1 <= b0:
+            # No whole bucket of this level fits; try the next finer one
+            self._collect(i0, i1, level - 1, mins, maxs)
+            return
+
+        mins.append(np.fmin.reduce(level_mins[b0:b1]))
+        maxs.append(np.fmax.reduce(level_maxs[b0:b1]))
+        # Edge fringes are shorter than one bucket, so finer levels cover them
+        self._collect(i0, b0 * size, level - 1, mins, maxs)
+        self._collect(b1 * size, i1, level - 1, mins, maxs)
@@ -4,13 +4,13 @@ View navigation controller for zoom and pan operations.
 Manages the current view window and provides methods for navigation.
 """
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
 
 
 class ViewNavigationController(QObject):
     """Manages view navigation (zoom, pan, fit)"""
 
-    # Signal emitted when view changes
+    # Signal emitted when view changes (at most once per event-loop pass, with the latest range)
     view_changed = Signal(float, float, float, float)  # start, end, y_min, y_max
 
     def __init__(self, time_min=0.0, time_max=100.0):
@@ -36,6 +36,9 @@ class ViewNavigationController(QObject):
         self.initial_view_start = time_min
         self.initial_view_end = time_max
 
+        # A view_changed emit is queued for the next event-loop pass
+        self._emit_pending = False
+
     def set_time_bounds(self, time_min, time_max):
         """
         Update the time bounds from loaded data.
@@ -62,7 +65,17 @@ class ViewNavigationController(QObject):
         self.view_end = end
         self.view_y_min = y_min
         self.view_y_max = y_max
-        self.view_changed.emit(start, end, y_min, y_max)
+
+        # The range itself updates immediately; listeners hear about it once per event-loop
+        # pass, so several changes in one interaction (or a drag's stream of moves) emit once
+        if not self._emit_pending:
+            self._emit_pending = True
+            QTimer.singleShot(0, self._emit_view_changed)
+
+    def _emit_view_changed(self):
+        """Emit view_changed with the current range (queued by set_view_range)."""
+        self._emit_pending = False
+        self.view_changed.emit(self.view_start, self.view_end, self.view_y_min, self.view_y_max)
 
     def set_initial_view(self, start, end):
         """
@@ -84,53 +97,34 @@ class ViewNavigationController(QObject):
         """
         return (self.view_start, self.view_end, self.view_y_min, self.view_y_max)
 
-    def zoom_in_2x(self):
-        """Zoom in by 2x (halve the time shown), centered on current view"""
-        current_duration = self.view_end - self.view_start
-        center = (self.view_start + self.view_end) / 2
-
-        # Halve the duration
-        new_duration = current_duration / 2
+    def _fit_window(self, start, duration):
+        """
+        Slide a window of the given duration into the time bounds.
 
-        # Calculate new start/end centered on the same point
-        new_start = center - new_duration / 2
-        new_end = center + new_duration / 2
+        The window keeps its duration unless it is longer than the data, in
+        which case it is cut off at time_max.
 
-        # Clamp to valid range
-        new_start = max(self.time_min, new_start)
-        new_end = min(self.time_max, new_end)
+        Args:
+            start: Requested window start time
+            duration: Window duration
 
-        # If we hit a boundary, adjust the other side to maintain zoom if possible
-        if new_start == self.time_min:
-            new_end = min(self.time_min + new_duration, self.time_max)
-        elif new_end == self.time_max:
-            new_start = max(self.time_min, self.time_max - new_duration)
+        Returns:
+            Tuple of (start, end) within [time_min, time_max]
+        """
+        start = max(self.time_min, min(start, self.time_max - duration))
+        return start, min(start + duration, self.time_max)
 
-        self.set_view_range(new_start, new_end)
+    def zoom_in_2x(self):
+        """Zoom in by 2x (halve the time shown), centered on current view"""
+        new_duration = (self.view_end - self.view_start) / 2
+        center = (self.view_start + self.view_end) / 2
+        self.set_view_range(*self._fit_window(center - new_duration / 2, new_duration))
 
     def zoom_out_2x(self):
         """Zoom out by 2x (double the time shown), centered on current view"""
-        current_duration = self.view_end - self.view_start
+        new_duration = (self.view_end - self.view_start) * 2
         center = (self.view_start + self.view_end) / 2
-
-        # Double the duration
-        new_duration = current_duration * 2
-
-        # Calculate new start/end centered on the same point
-        new_start = center - new_duration / 2
-        new_end = center + new_duration / 2
-
-        # Clamp to valid range
-        new_start = max(self.time_min, new_start)
-        new_end = min(self.time_max, new_end)
-
-        # If we hit a boundary, adjust the other side to maintain 2x zoom if possible
-        if new_start == self.time_min:
-            new_end = min(self.time_min + new_duration, self.time_max)
-        elif new_end == self.time_max:
-            new_start = max(self.time_min, self.time_max - new_duration)
-
-        self.set_view_range(new_start, new_end)
+        self.set_view_range(*self._fit_window(center - new_duration / 2, new_duration))
 
     def pan_left(self, percentage):
         """
@@ -140,18 +134,7 @@ class ViewNavigationController(QObject):
             percentage: Percentage to pan (e.g., 0.5 for 50%)
         """
         current_duration = self.view_end - self.view_start
-        shift = current_duration * percentage
-
-        # Shift left (decrease both start and end)
-        new_start = self.view_start - shift
-        new_end = self.view_end - shift
-
-        # Clamp to valid range
-        if new_start < self.time_min:
-            new_start = self.time_min
-            new_end = self.time_min + current_duration
-
-        self.set_view_range(new_start, new_end)
+        self.set_view_range(*self._fit_window(self.view_start - current_duration * percentage, current_duration))
 
     def pan_right(self, percentage):
         """
@@ -161,18 +144,7 @@ class ViewNavigationController(QObject):
             percentage: Percentage to pan (e.g., 0.5 for 50%)
         """
         current_duration = self.view_end - self.view_start
-        shift = current_duration * percentage
-
-        # Shift right (increase both start and end)
-        new_start = self.view_start + shift
-        new_end = self.view_end + shift
-
-        # Clamp to valid range
-        if new_end > self.time_max:
-            new_end = self.time_max
-            new_start = self.time_max - current_duration
-
-        self.set_view_range(new_start, new_end)
+        self.set_view_range(*self._fit_window(self.view_start + current_duration * percentage, current_duration))
 
     def reset_to_initial(self):
         """Reset view to initial state"""
@@ -4,6 +4,7 @@ View history management for undo/redo navigation.
 Maintains a stack of view states to support undo/redo operations.
 """
 
+import numpy as np
 from PySide6.QtCore import QObject, Signal
 
 
@@ -21,9 +22,23 @@ class ViewHistory(QObject):
             max_history: Maximum number of history entries to keep
         """
         super().__init__()
-        self.history = []
-        self.history_index = -1
         self.max_history = max_history
+        # Ring buffer of (start, end, y_min, y_max) rows: pushes write a row in place,
+        # and once full the oldest entry is dropped by advancing _head
+        self._buf = np.empty((max_history, 4), dtype=np.float64)
+        self._head = 0  # Buffer row of the oldest entry
+        self._len = 0   # Number of entries
+        self.history_index = -1
+
+    @property
+    def history(self):
+        """List of (start, end, y_min, y_max) entries, oldest first."""
+        rows = (self._head + np.arange(self._len)) % self.max_history
+        return [tuple(row) for row in self._buf[rows].tolist()]
+
+    def _entry(self, index):
+        """Entry at a history index as a tuple of Python floats."""
+        return tuple(self._buf[(self._head + index) % self.max_history].tolist())
 
     def push(self, start, end, y_min=0, y_max=1):
         """
@@ -36,17 +51,19 @@ class ViewHistory(QObject):
             y_max: View Y maximum (currently unused, always 1)
         """
         # Truncate forward history when adding a new state
-        self.history = self.history[:self.history_index + 1]
+        self._len = self.history_index + 1
+
+        # Limit history size: when full, the new entry overwrites the oldest
+        if self._len == self.max_history:
+            self._head = (self._head + 1) % self.max_history
+            self._len -= 1
+            self.history_index -= 1
 
         # Add new state (Y values stored for compatibility but not currently used)
-        self.history.append((start, end, y_min, y_max))
+        self._buf[(self._head + self._len) % self.max_history] = (start, end, y_min, y_max)
+        self._len += 1
         self.history_index += 1
 
-        # Limit history size
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
-            self.history_index -= 1
-
         self._emit_state()
 
     def undo(self):
@@ -65,7 +82,7 @@ class ViewHistory(QObject):
         if self.history_index > 0:
             self.history_index -= 1
             self._emit_state()
-            return self.history[self.history_index]
+            return self._entry(self.history_index)
         return None
 
     def redo(self):
@@ -75,10 +92,10 @@ class ViewHistory(QObject):
         Returns:
             Tuple of (start, end, y_min, y_max) or None if can't redo
         """
-        if self.history_index < len(self.history) - 1:
+        if self.history_index < self._len - 1:
             self.history_index += 1
             self._emit_state()
-            return self.history[self.history_index]
+            return self._entry(self.history_index)
         return None
 
     def can_undo(self):
@@ -87,14 +104,35 @@ class ViewHistory(QObject):
 
     def can_redo(self):
         """Check if redo is possible"""
-        return self.history_index < len(self.history) - 1
+        return self.history_index < self._len - 1
 
     def clear(self):
         """Clear all history"""
-        self.history = []
+        self._head = 0
+        self._len = 0
         self.history_index = -1
         self._emit_state()
 
+    def restore(self, entries, index):
+        """
+        Replace the history with saved entries.
+
+        Args:
+            entries: Sequence of (start, end, y_min, y_max) entries, oldest first
+            index: Index of the current entry within entries
+        """
+        # Keep the newest max_history entries and shift the index to match
+        kept = entries[-self.max_history:] if entries else []
+        dropped = len(entries) - len(kept)
+        self._head = 0
+        self._len = len(kept)
+        for row, entry in enumerate(kept):
+            # Y values default to 0..1 for entries saved without them
+            ys = list(entry[2:4]) + [0, 1][len(entry[2:4]):]
+            self._buf[row] = (entry[0], entry[1], *ys)
+        self.history_index = max(0, index - dropped) if kept else -1
+        self._emit_state()
+
     def _emit_state(self):
         """Emit signal with current history state"""
         self.history_changed.emit(self.can_undo(), self.can_redo())
@@ -1,7 +1,8 @@
 """
 Rendering components for viz_components
 """
-from .decimation import min_max_decimate
+from .decimation import min_max_decimate, merge_close_intervals, bucket_intervals, warm_up_decimation
+from .lod_pyramid import LODPyramid
 from .normalization import DataNormalizer
 
-__all__ = ['min_max_decimate', 'DataNormalizer']
+__all__ = ['min_max_decimate', 'merge_close_intervals', 'bucket_intervals', 'warm_up_decimation', 'LODPyramid', 'DataNormalizer']
@@ -3,10 +3,116 @@ Data decimation utilities for performance optimization.
 
 Provides algorithms for reducing the number of data points while preserving
 key features (peaks, valleys, trends) in time-series data.
+
+If numba is installed the per-bin scan runs as a JIT-compiled kernel;
+otherwise an equivalent vectorized numpy implementation is used.
 """
 
 import numpy as np
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, boundscheck=False)
+    def _min_max_decimate_kernel(time_array, value_array, bin_size, out_time, out_values):
+        """Single pass over each bin; writes kept points to out_* and returns their count."""
+        n = len(value_array)
+        count = 0
+        for start in range(0, n, bin_size):
+            end = min(start + bin_size, n)
+
+            # NaN-skipping argmin/argmax (first occurrence, like np.nanargmin/nanargmax)
+            min_idx = -1
+            max_idx = -1
+            has_nan = False
+            for i in range(start, end):
+                v = value_array[i]
+                if v == v:
+                    if min_idx < 0 or v < value_array[min_idx]:
+                        min_idx = i
+                    if max_idx < 0 or v > value_array[max_idx]:
+                        max_idx = i
+                else:
+                    has_nan = True
+
+            if has_nan:
+                # Emit first, min, max, last and any NaN break-points in time order
+                for i in range(start, end):
+                    v = value_array[i]
+                    if i == start or i == end - 1 or i == min_idx or i == max_idx or v != v:
+                        out_time[count] = time_array[i]
+                        out_values[count] = v
+                        count += 1
+                continue
+
+            # No NaNs: emit first, min, max, last directly in time order (no second scan)
+            last = end - 1
+            lo_idx = min(min_idx, max_idx)
+            hi_idx = max(min_idx, max_idx)
+            out_time[count] = time_array[start]
+            out_values[count] = value_array[start]
+            count += 1
+            if start < lo_idx < last:
+                out_time[count] = time_array[lo_idx]
+                out_values[count] = value_array[lo_idx]
+                count += 1
+            if hi_idx != lo_idx and start < hi_idx < last:
+                out_time[count] = time_array[hi_idx]
+                out_values[count] = value_array[hi_idx]
+                count += 1
+            if last > start:
+                out_time[count] = time_array[last]
+                out_values[count] = value_array[last]
+                count += 1
+        return count
+
+
+# Scratch output buffers for the numba kernel, grown on demand and reused across calls
+_scratch = {}
+
+
+def _scratch_buffers(n, time_dtype, value_dtype):
+    """Return reusable output buffers with room for at least n points."""
+    key = (np.dtype(time_dtype), np.dtype(value_dtype))
+    buffers = _scratch.get(key)
+    if buffers is None or len(buffers[0]) < n:
+        buffers = (np.empty(n, dtype=time_dtype), np.empty(n, dtype=value_dtype))
+        _scratch[key] = buffers
+    return buffers
+
+
+def _bin_extreme_indices(values, starts, bin_size, fill, reduce_op):
+    """First index of each bin's extreme value (NaNs replaced by fill so they never win)."""
+    filled = np.where(np.isnan(values), fill, values)
+    extremes = reduce_op.reduceat(filled, starts)
+    bin_ids = np.arange(len(values)) // bin_size
+    candidates = np.flatnonzero(filled == extremes[bin_ids])
+    candidate_bins = candidates // bin_size
+    first_in_bin = np.ones(len(candidates), dtype=bool)
+    first_in_bin[1:] = candidate_bins[1:] != candidate_bins[:-1]
+    return candidates[first_in_bin]
+
+
+def _min_max_decimate_numpy(time_array, value_array, bin_size):
+    """Vectorized equivalent of the numba kernel."""
+    n = len(value_array)
+    starts = np.arange(0, n, bin_size)
+    ends = np.minimum(starts + bin_size, n) - 1
+
+    keep = np.isnan(value_array)
+    keep[starts] = True
+    keep[ends] = True
+    keep[_bin_extreme_indices(value_array, starts, bin_size, np.inf, np.minimum)] = True
+    keep[_bin_extreme_indices(value_array, starts, bin_size, -np.inf, np.maximum)] = True
+
+    return time_array[keep], value_array[keep]
+
 
 def min_max_decimate(time_array, value_array, target_points):
     """Decimate data while preserving min/max peaks in each bin.
@@ -36,31 +142,82 @@ def min_max_decimate(time_array, value_array, target_points):
     num_bins = max(1, target_points // 4)
     bin_size = max(1, n // num_bins)
 
-    result_time = []
-    result_values = []
+    if not NUMBA_AVAILABLE:
+        return _min_max_decimate_numpy(np.asarray(time_array), np.asarray(value_array), bin_size)
+
+    # Output can't exceed n points (NaN break-points are all kept)
+    out_time, out_values = _scratch_buffers(n, time_array.dtype, value_array.dtype)
+    count = _min_max_decimate_kernel(time_array, value_array, bin_size, out_time, out_values)
+
+    # Copy out of the shared scratch buffers - callers hand these arrays to plot items
+    return out_time[:count].copy(), out_values[:count].copy()
 
-    for i in range(0, n, bin_size):
-        bin_time = time_array[i:i+bin_size]
-        bin_values = value_array[i:i+bin_size]
 
-        if len(bin_values) == 0:
-            continue
+def merge_close_intervals(start_times, end_times, min_gap):
+    """Merge intervals separated by less than min_gap into single spans.
 
-        # Always keep first and last points of each bin for continuity
-        first_idx = 0
-        last_idx = len(bin_values) - 1
+    Used to collapse bars that would be drawn less than a pixel apart; the
+    merged spans cover exactly the same ground at that resolution.
 
-        # Find min and max indices within this bin (nanarg* ignores NaN sentinel values)
-        min_idx = np.nanargmin(bin_values)
-        max_idx = np.nanargmax(bin_values)
+    Args:
+        start_times: sorted numpy array of interval start times
+        end_times: numpy array of interval end times
+        min_gap: smallest gap between intervals that is kept
+
+    Returns:
+        tuple of (span_starts, span_durations) numpy arrays
+    """
+    if len(start_times) < 2:
+        return start_times, end_times - start_times
 
-        # Collect unique indices in time order; also preserve any NaN break-points
-        nan_indices = list(np.where(np.isnan(bin_values))[0])
-        indices = sorted(set([first_idx, min_idx, max_idx, last_idx] + nan_indices))
+    # Running max of the ends so an interval swallowed by a longer one never splits a span
+    reach = np.maximum.accumulate(end_times)
+    new_span = np.empty(len(start_times), dtype=bool)
+    new_span[0] = True
+    new_span[1:] = start_times[1:] - reach[:-1] >= min_gap
+    firsts = np.flatnonzero(new_span)
 
-        # Add all unique points in time order
-        for idx in indices:
-            result_time.append(bin_time[idx])
-            result_values.append(bin_values[idx])
+    span_starts = start_times[firsts]
+    span_ends = np.maximum.reduceat(end_times, firsts)
+    return span_starts, span_ends - span_starts
 
-    return np.array(result_time), np.array(result_values)
+
+def bucket_intervals(start_times, end_times, window_start, window_end, num_buckets):
+    """Merge intervals into at most num_buckets spans across a time window.
+
+    Intervals are grouped by the bucket their start falls in, and each group
+    is replaced by one span from its earliest start to its latest end. Unlike
+    keeping every Nth interval, this never leaves a gap where an interval was
+    dropped, so the drawn coverage matches the full data at bucket resolution.
+
+    Args:
+        start_times: sorted numpy array of interval start times
+        end_times: numpy array of interval end times
+        window_start: start of the time window being drawn
+        window_end: end of the time window being drawn
+        num_buckets: number of equal-width buckets across the window
+
+    Returns:
+        tuple of (span_starts, span_durations) numpy arrays
+    """
+    if len(start_times) <= num_buckets or window_end <= window_start:
+        return start_times, end_times - start_times
+
+    scale = num_buckets / (window_end - window_start)
+    # Intervals that start before the window share the first bucket
+    buckets = np.clip(((start_times - window_start) * scale).astype(np.int64), 0, num_buckets - 1)
+    firsts = np.flatnonzero(np.diff(buckets, prepend=-1))
+
+    span_starts = start_times[firsts]
+    span_ends = np.maximum.reduceat(end_times, firsts)
+    return span_starts, span_ends - span_starts
+
+
+def warm_up_decimation(time_dtype=np.float64, value_dtype=np.float64):
+    """Compile the numba kernel for the given dtypes ahead of the first redraw (no-op without numba)."""
+    if not NUMBA_AVAILABLE:
+        return
+    t = np.arange(16, dtype=time_dtype)
+    v = np.arange(16, dtype=value_dtype)
+    v[5] = np.nan  # exercise the NaN branch as well
+    min_max_decimate(t, v, 4)
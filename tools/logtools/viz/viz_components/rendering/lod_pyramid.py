@@ -0,0 +1,118 @@
+"""
+Precomputed level-of-detail pyramid for min/max decimated rendering.
+
+Each level summarizes the raw samples in bins of 4, 8, 16, ... samples. A bin
+keeps its minimum and maximum samples in time order plus a third "gap" slot,
+so every level is a plain time-sorted (time, values) pair that can be sliced
+with np.searchsorted at render time instead of re-decimating the raw data.
+"""
+
+import numpy as np
+
+
+class LODPyramid:
+    """Dyadic min/max pyramid for one stream"""
+
+    # Raw samples per bin at the finest level
+    BASE_BIN_SIZE = 4
+
+    def __init__(self, time_array, value_array, min_points):
+        """
+        Build all levels for a stream.
+
+        Args:
+            time_array: Sorted numpy array of sample times
+            value_array: numpy array of sample values (NaN marks a line break)
+            min_points: Stop adding coarser levels once a level has at most this many points
+        """
+        self.levels = []  # [(time, values)] from finest to coarsest
+
+        if len(time_array) <= min_points:
+            return
+
+        bins = self._base_bins(time_array, value_array)
+        while True:
+            level = self._interleave(*bins)
+            self.levels.append(level)
+            if len(level[0]) <= min_points or len(bins[0]) < 2:
+                break
+            bins = self._merge_pairs(*bins)
+
+    @classmethod
+    def _base_bins(cls, time_array, value_array):
+        """Per-bin (tmin, vmin, tmax, vmax, has_nan) for the finest level."""
+        size = cls.BASE_BIN_SIZE
+        pad = -len(time_array) % size
+        if pad:
+            # Repeat the last sample so the tail bin is full (doesn't change its min/max)
+            time_array = np.concatenate([time_array, np.repeat(time_array[-1:], pad)])
+            value_array = np.concatenate([value_array, np.repeat(value_array[-1:], pad)])
+
+        t = time_array.reshape(-1, size)
+        v = value_array.reshape(-1, size)
+        nan = np.isnan(v)
+        rows = np.arange(len(v))
+
+        min_idx = np.where(nan, np.inf, v).argmin(axis=1)
+        max_idx = np.where(nan, -np.inf, v).argmax(axis=1)
+
+        return (t[rows, min_idx], v[rows, min_idx],
+                t[rows, max_idx], v[rows, max_idx],
+                nan.any(axis=1))
+
+    @staticmethod
+    def _merge_pairs(tmin, vmin, tmax, vmax, has_nan):
+        """Combine neighbouring bins pairwise to build the next coarser level."""
+        if len(tmin) % 2:
+            # Odd bin count: pair the last bin with itself
+            tmin, vmin, tmax, vmax, has_nan = (np.append(a, a[-1]) for a in (tmin, vmin, tmax, vmax, has_nan))
+
+        a_vmin, b_vmin = vmin[0::2], vmin[1::2]
+        take_b = (b_vmin < a_vmin) | (np.isnan(a_vmin) & ~np.isnan(b_vmin))
+        new_tmin = np.where(take_b, tmin[1::2], tmin[0::2])
+        new_vmin = np.where(take_b, b_vmin, a_vmin)
+
+        a_vmax, b_vmax = vmax[0::2], vmax[1::2]
+        take_b = (b_vmax > a_vmax) | (np.isnan(a_vmax) & ~np.isnan(b_vmax))
+        new_tmax = np.where(take_b, tmax[1::2], tmax[0::2])
+        new_vmax = np.where(take_b, b_vmax, a_vmax)
+
+        return new_tmin, new_vmin, new_tmax, new_vmax, has_nan[0::2] | has_nan[1::2]
+
+    @staticmethod
+    def _interleave(tmin, vmin, tmax, vmax, has_nan):
+        """Flatten bins to (first, second, gap) points per bin in time order."""
+        min_first = tmin <= tmax
+        t_first = np.where(min_first, tmin, tmax)
+        v_first = np.where(min_first, vmin, vmax)
+        t_second = np.where(min_first, tmax, tmin)
+        v_second = np.where(min_first, vmax, vmin)
+
+        # Gap slot repeats the second point (invisible) unless the bin held a NaN
+        v_gap = np.where(has_nan, np.nan, v_second)
+
+        time = np.column_stack([t_first, t_second, t_second]).ravel()
+        values = np.column_stack([v_first, v_second, v_gap]).ravel()
+        return time, values
+
+    def select(self, view_start, view_end, max_points):
+        """
+        Get the finest level that fits the visible window.
+
+        Args:
+            view_start: Start of the visible window
+            view_end: End of the visible window
+            max_points: Maximum number of points wanted in the window
+
+        Returns:
+            Tuple of (time, values) for the window (plus one point past each edge),
+            or None if no level is coarse enough
+        """
+        for time, values in self.levels:
+            lo = int(np.searchsorted(time, view_start, side='left'))
+            hi = int(np.searchsorted(time, view_end, side='right'))
+            if hi - lo <= max_points:
+                lo = max(0, lo - 1)
+                hi = min(len(time), hi + 1)
+                return time[lo:hi], values[lo:hi]
+        return None
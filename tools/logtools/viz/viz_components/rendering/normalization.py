@@ -23,19 +23,24 @@ class DataNormalizer:
     the same unified calculation method for consistency.
     """
 
-    def __init__(self, stream_config, stream_ranges, debug=False):
+    def __init__(self, stream_config, stream_ranges, data_manager, debug=False):
         """
         Initialize normalizer.
 
         Args:
             stream_config: StreamConfigManager instance
             stream_ranges: Dict of {stream_name: (min, max)} for full dataset ranges
+            data_manager: DataManager holding the streams, used for windowed min/max queries
             debug: Enable debug output (default: False)
         """
         self.stream_config = stream_config
         self.stream_ranges = stream_ranges
+        self.data_manager = data_manager
         self.debug = debug
 
+        # Reusable per-stream output buffers for normalize_data (grown on demand)
+        self._buffers = {}
+
     def debug_print(self, *args, **kwargs):
         """Print debug message if debug flag is enabled"""
         if self.debug:
@@ -95,26 +100,25 @@ class DataNormalizer:
         if stream_name not in raw_data:
             return (full_min, full_max)
 
-        stream_data = raw_data[stream_name]
-        all_time = stream_data['time']
-        all_values = stream_data['values']
-        mask = (all_time >= view_start) & (all_time <= view_end)
-        visible_values = all_values[mask]
+        # Window min/max from the data manager's summary pyramid (NaN-skipping, like
+        # np.nanmax), so long windows don't scan every visible sample
+        _, visible_max = self.data_manager.get_visible_range(stream_name, view_start, view_end)
 
         # Get stream configuration for display constraints
         stream_cfg = self.stream_config.get_stream(stream_name)
 
-        if len(visible_values) > 0:
+        if visible_max is not None:
             # Check for fixed display range (e.g., temperature: 0-120°C)
             if stream_cfg and stream_cfg.display_range_min is not None and stream_cfg.display_range_max is not None:
                 stream_min = stream_cfg.display_range_min
                 stream_max = stream_cfg.display_range_max
-                visible_median = float(np.median(visible_values))
-                self.debug_print(f"Stream {stream_name}: fixed range [{stream_min:.1f}, {stream_max:.1f}] (median: {visible_median:.1f})")
+                if self.debug:
+                    # The median is only reported, so skip the sort unless debugging
+                    _, visible_values = self.data_manager.get_visible_data(stream_name, view_start, view_end)
+                    visible_median = float(np.median(visible_values))
+                    self.debug_print(f"Stream {stream_name}: fixed range [{stream_min:.1f}, {stream_max:.1f}] (median: {visible_median:.1f})")
             else:
-                # Dynamic scaling with optional constraints
-                visible_min = float(np.nanmin(visible_values))
-                visible_max = float(np.nanmax(visible_values))
+                # Dynamic scaling with optional constraints (full-dataset min, visible max)
                 stream_min = full_min
                 stream_max = visible_max
 
@@ -161,7 +165,27 @@ class DataNormalizer:
 
         return (stream_min, stream_max)
 
-    def normalize_data(self, values, stream_min, stream_max, normalize_max, bar_offset=0.0):
+    def output_buffer(self, key, size):
+        """
+        Get a reusable float32 buffer for normalize_data output.
+
+        The buffer for a key is overwritten by the next call with the same key,
+        so only use it for data that is replaced on every redraw.
+
+        Args:
+            key: Buffer owner (typically the stream name)
+            size: Number of elements needed
+
+        Returns:
+            float32 array view of length size
+        """
+        buf = self._buffers.get(key)
+        if buf is None or len(buf) < size:
+            buf = np.empty(max(size, 16384), dtype=np.float32)
+            self._buffers[key] = buf
+        return buf[:size]
+
+    def normalize_data(self, values, stream_min, stream_max, normalize_max, bar_offset=0.0, out=None):
         """
         Normalize data values to display coordinates.
 
@@ -171,14 +195,19 @@ class DataNormalizer:
             stream_max: Maximum value for normalization
             normalize_max: Target maximum (typically 0.85)
             bar_offset: Offset to add (for bar space at bottom)
+            out: Optional preallocated array (same length as values) to write into
 
         Returns:
             Normalized array in range [bar_offset, bar_offset + normalize_max]
         """
-        normalized = ((values - stream_min) / (stream_max - stream_min)) * normalize_max
+        scale = normalize_max / (stream_max - stream_min)
+
+        # In-place ufuncs: one output array, no temporaries
+        normalized = np.subtract(values, stream_min, out=out)
+        np.multiply(normalized, scale, out=normalized)
 
         # Shift up by bar offset if bars are enabled
         if bar_offset > 0:
-            normalized = normalized + bar_offset
+            np.add(normalized, bar_offset, out=normalized)
 
         return normalized
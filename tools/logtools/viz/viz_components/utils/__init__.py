@@ -2,5 +2,6 @@
 Utility functions for viz_components
 """
 from .color_utils import parse_color_to_rgba
+from .geometry import simplify_polyline
 
-__all__ = ['parse_color_to_rgba']
+__all__ = ['parse_color_to_rgba', 'simplify_polyline']
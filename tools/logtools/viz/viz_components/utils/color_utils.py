@@ -4,7 +4,11 @@ Color utility functions for visualization.
 Provides color parsing and conversion utilities.
 """
 
+from functools import lru_cache
 
+
+# Only a handful of (color, alpha) pairs are used, but they're parsed on every redraw
+@lru_cache(maxsize=256)
 def parse_color_to_rgba(color_string, alpha=1.0):
     """
     Convert hex color string to RGBA tuple for QBrush.
@@ -19,9 +23,12 @@ def parse_color_to_rgba(color_string, alpha=1.0):
     if isinstance(color_string, str) and color_string.startswith('#'):
         hex_str = color_string.lstrip('#')
         if len(hex_str) == 6:
-            r = int(hex_str[0:2], 16)
-            g = int(hex_str[2:4], 16)
-            b = int(hex_str[4:6], 16)
-            return (r, g, b, int(alpha * 255))
+            try:
+                # One C-level hex decode instead of three slice + int(..., 16) parses
+                r, g, b = bytes.fromhex(hex_str)
+            except ValueError:
+                pass
+            else:
+                return (r, g, b, int(alpha * 255))
     # Fallback for invalid colors
     return (255, 0, 0, int(alpha * 255))
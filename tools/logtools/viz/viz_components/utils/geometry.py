@@ -0,0 +1,61 @@
+"""
+Geometry utility functions for visualization.
+
+Provides polyline simplification for drawing long tracks.
+"""
+
+import numpy as np
+
+
+def simplify_polyline(x, y, epsilon):
+    """
+    Simplify a polyline with the Ramer-Douglas-Peucker algorithm.
+
+    Points are dropped when they lie within epsilon of the straight segment
+    between the points kept around them, so straight runs collapse to their
+    end points while corners are preserved.
+
+    Args:
+        x: numpy array of point x coordinates
+        y: numpy array of point y coordinates
+        epsilon: Largest perpendicular distance (in x/y units) a dropped point may have
+
+    Returns:
+        Sorted numpy array of the indices of the points to keep (always
+        includes the first and last point)
+    """
+    n = len(x)
+    if n < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+
+    # Iterative instead of recursive so long, detailed tracks can't hit the recursion limit
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        dx = x[end] - x[start]
+        dy = y[end] - y[start]
+        px = x[start + 1:end] - x[start]
+        py = y[start + 1:end] - y[start]
+        length = np.hypot(dx, dy)
+        if length > 0:
+            dist = np.abs(px * dy - py * dx) / length
+        else:
+            # Segment ends coincide (e.g. the track returns to its start)
+            dist = np.hypot(px, py)
+
+        i = int(np.argmax(dist))
+        if dist[i] > epsilon:
+            split = start + 1 + i
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+
+    return np.flatnonzero(keep)
@@ -3,14 +3,20 @@ Custom checkbox widget that fills with color when checked.
 """
 
 from PySide6.QtWidgets import QCheckBox
+from PySide6.QtCore import QRect
 from PySide6.QtGui import QPainter, QColor
 
 
 class ColorCheckbox(QCheckBox):
     """Custom checkbox that fills with color when checked instead of showing a checkmark"""
+
+    # Area of the indicator covered by the color fill
+    FILL_RECT = QRect(2, 2, 12, 12)
+
     def __init__(self, color, parent=None):
         super().__init__(parent)
         self.fill_color = color
+        self._qcolor = QColor(color)  # Parsed once here, not on every paint
         self.setFixedSize(16, 16)
         # Remove default styling
         self.setStyleSheet("""
@@ -26,13 +32,29 @@ class ColorCheckbox(QCheckBox):
             }
         """)
 
+    def set_fill_color(self, color):
+        """
+        Change the fill color and redraw.
+
+        Args:
+            color: Color string (e.g. '#ff0000') used when the box is checked
+        """
+        if color == self.fill_color:
+            return
+        self.fill_color = color
+        self._qcolor = QColor(color)
+        self.update()
+
     def paintEvent(self, event):
         """Custom paint to fill with color when checked"""
         super().paintEvent(event)
-        if self.isChecked():
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Skip the overlay when Qt only repaints a region outside the fill
+        if not self.isChecked() or not event.rect().intersects(self.FILL_RECT):
+            return
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-            # Fill the checkbox with the stream color
-            painter.fillRect(2, 2, 12, 12, QColor(self.fill_color))
-            painter.end()
+        # Fill the checkbox with the stream color
+        painter.fillRect(self.FILL_RECT, self._qcolor)
+        painter.end()
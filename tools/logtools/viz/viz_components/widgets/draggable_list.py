@@ -2,11 +2,17 @@
 Custom list widget that supports drag-and-drop reordering with visual feedback.
 """
 
+import bisect
+
+from PySide6.QtCore import QRect
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 from PySide6.QtGui import QPainter, QPen, QColor
 
 from .stream_checkbox import StreamCheckbox
 
+# Drop indicator line (blue), shared by every paint
+_INDICATOR_PEN = QPen(QColor(0, 120, 215), 2)
+
 
 class DraggableStreamList(QWidget):
     """Custom list widget that supports drag-and-drop reordering with visual feedback"""
@@ -21,7 +27,10 @@ class DraggableStreamList(QWidget):
         self.setLayout(self.layout)
 
         self.stream_widgets = []
+        self.stream_widget_by_name = {}  # stream_name -> widget, for O(1) lookups
         self.drop_indicator_pos = -1  # -1 means no indicator
+        self._last_indicator_y = None  # Y of the drawn indicator line, for partial repaints
+        self._drop_mids = None  # (widget midpoints, layout indices) cached for the current drag
         self.dragging = False
         self.reorder_callback = None  # Callback to notify parent of reorder
 
@@ -31,6 +40,7 @@ class DraggableStreamList(QWidget):
         insert_pos = self.layout.count() - 1
         self.layout.insertWidget(insert_pos, widget)
         self.stream_widgets.append(widget)
+        self.stream_widget_by_name[widget.stream_name] = widget
 
     def clear_streams(self):
         """Clear all stream widgets"""
@@ -39,6 +49,7 @@ class DraggableStreamList(QWidget):
             if item.widget():
                 item.widget().deleteLater()
         self.stream_widgets.clear()
+        self.stream_widget_by_name.clear()
 
     def get_stream_order(self):
         """Get the current order of stream names"""
@@ -51,25 +62,23 @@ class DraggableStreamList(QWidget):
 
     def reorder_to_match(self, stream_order):
         """Reorder widgets to match the given order"""
-        # Create a mapping of stream name to widget
-        widget_map = {}
-        for widget in self.stream_widgets:
-            widget_map[widget.stream_name] = widget
-
         # Remove all widgets from layout (except stretch)
         while self.layout.count() > 1:
             self.layout.takeAt(0)
 
         # Re-add in the specified order
         for stream_name in stream_order:
-            if stream_name in widget_map:
-                self.layout.insertWidget(self.layout.count() - 1, widget_map[stream_name])
+            widget = self.stream_widget_by_name.get(stream_name)
+            if widget is not None:
+                self.layout.insertWidget(self.layout.count() - 1, widget)
 
     def dragEnterEvent(self, event):
         """Accept drag events"""
         if event.mimeData().hasText():
             event.acceptProposedAction()
             self.dragging = True
+            # Widgets don't move during a drag, so measure them once
+            self._drop_mids = self._measure_drop_mids()
 
     def dragMoveEvent(self, event):
         """Update drop indicator position during drag"""
@@ -80,7 +89,11 @@ class DraggableStreamList(QWidget):
 
             if insert_index != self.drop_indicator_pos:
                 self.drop_indicator_pos = insert_index
-                self.update()  # Trigger repaint
+                # Only the old and new indicator bands need repainting
+                new_y = self._indicator_y_for_index(insert_index)
+                self._update_indicator_band(self._last_indicator_y)
+                self._update_indicator_band(new_y)
+                self._last_indicator_y = new_y
 
             event.acceptProposedAction()
 
@@ -88,7 +101,9 @@ class DraggableStreamList(QWidget):
         """Clear drop indicator when drag leaves"""
         self.drop_indicator_pos = -1
         self.dragging = False
-        self.update()
+        self._update_indicator_band(self._last_indicator_y)
+        self._last_indicator_y = None
+        self._drop_mids = None
 
     def dropEvent(self, event):
         """Handle drop - reorder the widgets"""
@@ -97,13 +112,8 @@ class DraggableStreamList(QWidget):
             insert_index = self._get_drop_index(event.position().y())
 
             # Find the widget being dragged
-            dragged_widget = None
-            old_index = -1
-            for i, widget in enumerate(self.stream_widgets):
-                if widget.stream_name == stream_name:
-                    dragged_widget = widget
-                    old_index = i
-                    break
+            dragged_widget = self.stream_widget_by_name.get(stream_name)
+            old_index = self.stream_widgets.index(dragged_widget) if dragged_widget else -1
 
             if dragged_widget and insert_index != old_index:
                 # Remove from old position
@@ -128,49 +138,70 @@ class DraggableStreamList(QWidget):
 
         self.drop_indicator_pos = -1
         self.dragging = False
+        self._last_indicator_y = None
+        self._drop_mids = None
         self.update()
 
-    def _get_drop_index(self, y_pos):
-        """Calculate the insertion index based on Y position"""
+    def _measure_drop_mids(self):
+        """Vertical midpoints of the stream widgets in layout order, with their layout indices"""
+        mids = []
+        indices = []
         for i in range(self.layout.count() - 1):  # Exclude stretch
             widget = self.layout.itemAt(i).widget()
             if widget:
-                widget_y = widget.y()
-                widget_height = widget.height()
+                mids.append(widget.y() + widget.height() / 2)
+                indices.append(i)
+        return mids, indices
+
+    def _get_drop_index(self, y_pos):
+        """Calculate the insertion index based on Y position"""
+        mids, indices = self._drop_mids or self._measure_drop_mids()
 
-                # If above midpoint, insert before this widget
-                if y_pos < widget_y + widget_height / 2:
-                    return i
+        # Insert before the first widget whose midpoint is below y_pos
+        pos = bisect.bisect_right(mids, y_pos)
+        if pos < len(indices):
+            return indices[pos]
 
         # Insert at end
         return self.layout.count() - 1
 
+    def _indicator_y_for_index(self, index):
+        """Y coordinate of the drop indicator line for an insertion index"""
+        if index < self.layout.count() - 1:
+            widget = self.layout.itemAt(index).widget()
+            return widget.y() - 1 if widget else 0
+
+        # Draw at bottom
+        if self.layout.count() > 1:
+            last_widget = self.layout.itemAt(self.layout.count() - 2).widget()
+            if last_widget:
+                return last_widget.y() + last_widget.height()
+        return 0
+
+    def _indicator_band(self, y):
+        """Rectangle covered by a 2px indicator line drawn at y"""
+        return QRect(0, y - 2, self.width(), 4)
+
+    def _update_indicator_band(self, y):
+        """Schedule a repaint of just the indicator band at y (no-op for None)"""
+        if y is not None:
+            self.update(self._indicator_band(y))
+
     def paintEvent(self, event):
         """Draw drop indicator line"""
         super().paintEvent(event)
 
-        if self.drop_indicator_pos >= 0 and self.dragging:
-            painter = QPainter(self)
-            painter.setPen(QPen(QColor(0, 120, 215), 2))  # Blue line
-
-            # Calculate Y position for the indicator
-            if self.drop_indicator_pos < self.layout.count() - 1:
-                widget = self.layout.itemAt(self.drop_indicator_pos).widget()
-                if widget:
-                    y = widget.y() - 1
-                else:
-                    y = 0
-            else:
-                # Draw at bottom
-                if self.layout.count() > 1:
-                    last_widget = self.layout.itemAt(self.layout.count() - 2).widget()
-                    if last_widget:
-                        y = last_widget.y() + last_widget.height()
-                    else:
-                        y = 0
-                else:
-                    y = 0
-
-            # Draw horizontal line
-            painter.drawLine(0, y, self.width(), y)
-            painter.end()
+        if self.drop_indicator_pos < 0 or not self.dragging:
+            return
+
+        y = self._indicator_y_for_index(self.drop_indicator_pos)
+        # Nothing to draw if this repaint doesn't touch the indicator band
+        if not event.region().intersects(self._indicator_band(y)):
+            return
+
+        painter = QPainter(self)
+        painter.setPen(_INDICATOR_PEN)
+
+        # Draw horizontal line
+        painter.drawLine(0, y, self.width(), y)
+        painter.end()
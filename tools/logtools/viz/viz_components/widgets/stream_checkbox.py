@@ -3,6 +3,7 @@ Custom stream selection widget with checkbox, label, and drag-drop support.
 """
 
 import re
+from functools import lru_cache
 
 from PySide6.QtWidgets import (QWidget, QHBoxLayout, QLabel, QApplication,
                              QColorDialog, QMenu)
@@ -12,6 +13,19 @@ from PySide6.QtGui import QFont, QColor, QAction, QDrag
 from .color_checkbox import ColorCheckbox
 
 
+@lru_cache(maxsize=16)
+def _mono_font(size):
+    """
+    Get the shared monospace font for stream names at a point size.
+
+    Built on first use (fonts need the QApplication), then reused; setFont()
+    copies the font, so sharing one instance is safe.
+    """
+    font = QFont("Monospace", size)
+    font.setStyleHint(QFont.StyleHint.TypeWriter)
+    return font
+
+
 class StreamCheckbox(QWidget):
     """Custom widget for stream selection with color-filled checkbox and colored label - supports drag and drop"""
     def __init__(self, stream_name, color, display_name=None, parent=None):
@@ -39,13 +53,9 @@ class StreamCheckbox(QWidget):
         self.checkbox.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.checkbox.customContextMenuRequested.connect(self.show_color_picker)
 
-        # Use monospace font for stream names
-        mono_font = QFont("Monospace", 9)
-        mono_font.setStyleHint(QFont.StyleHint.TypeWriter)
-
         # Create a drag handle area (the label area) - use display name
         self.label = QLabel(self.display_name)
-        self.label.setFont(mono_font)
+        self.label.setFont(_mono_font(9))  # Monospace font for stream names
         self.label.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.label.customContextMenuRequested.connect(self.show_stream_context_menu)
         self.update_label_style()  # Set initial style
@@ -75,9 +85,7 @@ class StreamCheckbox(QWidget):
 
     def set_font_size(self, size):
         """Update font size for the label"""
-        mono_font = QFont("Monospace", size)
-        mono_font.setStyleHint(QFont.StyleHint.TypeWriter)
-        self.label.setFont(mono_font)
+        self.label.setFont(_mono_font(size))
 
     def show_color_picker(self, pos):
         """Show color picker dialog when right-clicking checkbox"""
@@ -86,8 +94,7 @@ class StreamCheckbox(QWidget):
 
         if color.isValid():
             self.color = color.name()
-            self.checkbox.fill_color = self.color
-            self.checkbox.update()  # Redraw checkbox
+            self.checkbox.set_fill_color(self.color)  # Redraws the checkbox
 
             # Notify parent via callback
             if self.color_change_callback:
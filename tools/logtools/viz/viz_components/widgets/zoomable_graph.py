@@ -18,6 +18,9 @@ class ZoomableGraphWidget(pg.PlotWidget):
         self.zoom_callback = None
         self.click_callback = None  # Called with (x_value) on a simple left click (no drag)
         self.exclude_region = None  # Optional LinearRegionItem to exclude from rubber band zoom
+        # Rubber band style, created once rather than on every mouse move
+        self._rb_pen = pg.mkPen('b', width=2, style=Qt.PenStyle.DashLine)
+        self._rb_brush = pg.mkBrush(100, 150, 255, 50)
 
     def mousePressEvent(self, ev):
         if ev.button() == Qt.MouseButton.LeftButton:
@@ -41,9 +44,6 @@ class ZoomableGraphWidget(pg.PlotWidget):
 
     def mouseMoveEvent(self, ev):
         if self.is_dragging and self.rubberband_start is not None:
-            if self.rubberband_rect is not None:
-                self.plotItem.vb.removeItem(self.rubberband_rect)
-
             pos = QPointF(ev.pos())
             current = self.plotItem.vb.mapSceneToView(pos)
 
@@ -52,10 +52,14 @@ class ZoomableGraphWidget(pg.PlotWidget):
             w = abs(current.x() - self.rubberband_start.x())
             h = abs(current.y() - self.rubberband_start.y())
 
-            self.rubberband_rect = QtWidgets.QGraphicsRectItem(x, y, w, h)
-            self.rubberband_rect.setPen(pg.mkPen('b', width=2, style=Qt.PenStyle.DashLine))
-            self.rubberband_rect.setBrush(pg.mkBrush(100, 150, 255, 50))
-            self.plotItem.vb.addItem(self.rubberband_rect)
+            if self.rubberband_rect is None:
+                # Added on the first move of a drag (a plain click never shows it), then resized in place
+                self.rubberband_rect = QtWidgets.QGraphicsRectItem(x, y, w, h)
+                self.rubberband_rect.setPen(self._rb_pen)
+                self.rubberband_rect.setBrush(self._rb_brush)
+                self.plotItem.vb.addItem(self.rubberband_rect)
+            else:
+                self.rubberband_rect.setRect(x, y, w, h)
             ev.accept()
         else:
             super().mouseMoveEvent(ev)
@@ -7,9 +7,18 @@ process.
 
 import socket
 import json
+import selectors
 import threading
 from typing import Callable, Optional
 
+# orjson is optional; it only speeds up parsing check-in packets (its
+# JSONDecodeError subclasses json.JSONDecodeError, so error handling is the same)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 CHECKIN_PORT = 54549  # UDP port devices broadcast/unicast check-ins to
 
 
@@ -26,6 +35,9 @@ class CheckInListener:
         self.port = port
         self.host = host
         self.socket = None
+        self.selector = None
+        self._wake_r = None  # Socket pair used by stop() to wake the listener thread
+        self._wake_w = None
         self.thread = None
         self.running = False
         self.on_device_checkin = None  # Callback: on_device_checkin(device_mac, device_ip)
@@ -40,7 +52,12 @@ class CheckInListener:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self.socket.bind((self.host, self.port))
-            self.socket.settimeout(1.0)  # 1 second timeout for clean shutdown
+
+            # The listener sleeps in select() until a packet or a stop() wake-up arrives
+            self._wake_r, self._wake_w = socket.socketpair()
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(self.socket, selectors.EVENT_READ)
+            self.selector.register(self._wake_r, selectors.EVENT_READ)
 
             self.running = True
 
@@ -53,6 +70,7 @@ class CheckInListener:
         except Exception as e:
             print(f"CheckInListener: Failed to start: {e}")
             self.running = False
+            self._close_sockets()
 
     def stop(self):
         """Stop the UDP listener."""
@@ -61,25 +79,48 @@ class CheckInListener:
 
         self.running = False
 
+        # Wake the listener thread so it returns immediately
+        try:
+            self._wake_w.send(b'x')
+        except OSError:
+            pass
+
         if self.thread:
             self.thread.join(timeout=2)
 
-        if self.socket:
-            self.socket.close()
-            self.socket = None
+        self._close_sockets()
 
         print("CheckInListener: Stopped")
 
+    def _close_sockets(self):
+        """Close the selector, UDP socket and wake-up socket pair."""
+        if self.selector:
+            self.selector.close()
+            self.selector = None
+
+        for sock in (self.socket, self._wake_r, self._wake_w):
+            if sock:
+                sock.close()
+        self.socket = None
+        self._wake_r = None
+        self._wake_w = None
+
     def _listen_loop(self):
         """Main listening loop (runs in background thread)."""
         while self.running:
             try:
+                # Block until a packet arrives or stop() writes to the wake-up socket
+                events = self.selector.select()
+                if any(key.fileobj is self._wake_r for key, _ in events):
+                    return
+
                 # Receive UDP packet (max 1024 bytes)
                 data, addr = self.socket.recvfrom(1024)
 
                 # Parse JSON payload
                 try:
-                    payload = json.loads(data.decode('utf-8'))
+                    # Both parsers take the raw bytes, so no intermediate str is built
+                    payload = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
                     msg_type = payload.get('type', 'checkin')
                     device_mac = payload.get('device_mac')
                     device_ip = payload.get('ip')
@@ -106,10 +147,6 @@ class CheckInListener:
                 except json.JSONDecodeError as e:
                     print(f"CheckInListener: Invalid JSON from {addr}: {data[:100]}")
 
-            except socket.timeout:
-                # Timeout is normal, allows checking self.running flag
-                continue
-
             except Exception as e:
                 if self.running:  # Only log errors if we're supposed to be running
                     print(f"CheckInListener: Error receiving packet: {e}")